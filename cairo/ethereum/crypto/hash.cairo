@@ -23,6 +23,8 @@ dw 0x9a53d8e885d3650ceebe4156d54784fc;  // low
 dw 0x27c691d691291fefea0a2a3bc21395be;  // high
 
 // @notice Computes the keccak256 hash of a bytes object.
+// @dev The keccak-f permutations are only recorded in the `keccak_ptr` segment here; they are
+// verified together, in batches, by `finalize_keccak` at the end of the program.
 func keccak256{range_check_ptr, bitwise_ptr: BitwiseBuiltin*, keccak_ptr: felt*}(
     buffer: Bytes
 ) -> Hash32 {
@@ -13,7 +13,6 @@ from starkware.cairo.common.alloc import alloc
 from cairo_core.bytes_impl import Bytes__hash__, Bytes32__hash__
 from ethereum.utils.bytes import Bytes32_to_Bytes, Bytes__eq__
 
-from ethereum.prague.state import state_root
 from ethereum.prague.fork import BlockChain
 from mpt.types import AccountDiff, StorageDiff
 from mpt.utils import sort_account_diff, sort_storage_diff
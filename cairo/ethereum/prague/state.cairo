@@ -661,23 +661,6 @@ func account_has_code_or_nonce{range_check_ptr, state: State}(address: Address)
     return res;
 }
 
-// @notice Returns all (address, key) pairs for a given address.
-// This is a temporary fix specifically made for the `account_has_storage` function.
-// We need to make a deeper refactor once we have a sound way to handle storage keys.
-func get_storage_keys_for_address{dict_ptr: DictAccess*}(
-    prefix_len: felt, prefix: felt*
-) -> ListTupleAddressBytes32 {
-    alloc_locals;
-
-    local keys_len: felt;
-    local keys: TupleAddressBytes32*;
-    %{ get_storage_keys_for_address %}
-
-    // warning: this is unsound as the prover can return any list of keys.
-    tempvar res = ListTupleAddressBytes32(new ListTupleAddressBytes32Struct(keys, keys_len));
-    return res;
-}
-
 func account_has_storage{range_check_ptr, state: State}(address: Address) -> bool {
     alloc_locals;
 
@@ -1341,6 +1324,9 @@ func build_storage_trie_for_address{
 
 // @notice Computes the state root of the state
 // @dev Squashes the main trie for unique keys, and updates the state with the new, squashed segment.
+// @dev This rebuilds the whole account and storage tries from the flat state. The proving programs
+// don't call it: they take the post-state root as an input and check it against the pre-state
+// root with `mpt.trie_diff.compute_diff_entrypoint`, which only walks the modified paths.
 func state_root{
     range_check_ptr, bitwise_ptr: BitwiseBuiltin*, keccak_ptr: felt*, poseidon_ptr: PoseidonBuiltin*
 }(state: State, hash_function_name: felt) -> Bytes32 {
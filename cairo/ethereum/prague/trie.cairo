@@ -1189,37 +1189,554 @@ func nibble_list_to_bytes{range_check_ptr: felt, bitwise_ptr: BitwiseBuiltin*}(x
     return result;
 }
 
-func bytes_to_nibble_list{bitwise_ptr: BitwiseBuiltin*}(bytes_: Bytes) -> Bytes {
+// @notice Splits each byte of `bytes_` into its high and low nibbles.
+// @dev Nibbles are read from a table in the program data, indexed by the byte value: each byte is
+// range checked to be in [0, 256) before being used as an index.
+func bytes_to_nibble_list{range_check_ptr}(bytes_: Bytes) -> Bytes {
     alloc_locals;
-    local result: Bytes;
-
-    %{ bytes_to_nibble_list_hint %}
-
-    assert result.value.len = 2 * bytes_.value.len;
+    let (local result_data: felt*) = alloc();
+    let (local nibbles_table: felt*) = get_label_location(data);
 
     if (bytes_.value.len == 0) {
-        return bytes_;
+        tempvar result = Bytes(new BytesStruct(result_data, 0));
+        return result;
     }
 
-    tempvar bitwise_ptr = bitwise_ptr;
-    tempvar len = bytes_.value.len;
+    tempvar i = 0;
 
     loop:
-    let bitwise_ptr = bitwise_ptr;
-    let len = [ap - 1];
-    let ptr = cast([fp - 3], BytesStruct*);
-    let dst = cast([fp], BytesStruct*);
-
-    assert bitwise_ptr.x = dst.data[2 * len - 2] * 2 ** 4;
-    assert bitwise_ptr.y = dst.data[2 * len - 1];
-    assert bitwise_ptr.x_xor_y = ptr.data[len - 1];
-
-    tempvar bitwise_ptr = bitwise_ptr + BitwiseBuiltin.SIZE;
-    tempvar len = len - 1;
+    let i = [ap - 1];
+    tempvar byte = bytes_.value.data[i];
+    with_attr error_message("bytes_to_nibble_list: byte not in bounds") {
+        assert [range_check_ptr + 2 * i] = byte;
+        assert [range_check_ptr + 2 * i + 1] = 255 - byte;
+    }
+    tempvar entry = nibbles_table + 2 * byte;
+    assert result_data[2 * i] = [entry];
+    assert result_data[2 * i + 1] = [entry + 1];
 
-    jmp loop if len != 0;
+    tempvar cond = bytes_.value.len - i - 1;
+    tempvar i = i + 1;
+    jmp loop if cond != 0;
 
+    let range_check_ptr = range_check_ptr + 2 * bytes_.value.len;
+    tempvar result = Bytes(new BytesStruct(result_data, 2 * bytes_.value.len));
     return result;
+
+    // (high, low) nibbles of each byte value
+    data:
+    dw 0;
+    dw 0;
+    dw 0;
+    dw 1;
+    dw 0;
+    dw 2;
+    dw 0;
+    dw 3;
+    dw 0;
+    dw 4;
+    dw 0;
+    dw 5;
+    dw 0;
+    dw 6;
+    dw 0;
+    dw 7;
+    dw 0;
+    dw 8;
+    dw 0;
+    dw 9;
+    dw 0;
+    dw 10;
+    dw 0;
+    dw 11;
+    dw 0;
+    dw 12;
+    dw 0;
+    dw 13;
+    dw 0;
+    dw 14;
+    dw 0;
+    dw 15;
+    dw 1;
+    dw 0;
+    dw 1;
+    dw 1;
+    dw 1;
+    dw 2;
+    dw 1;
+    dw 3;
+    dw 1;
+    dw 4;
+    dw 1;
+    dw 5;
+    dw 1;
+    dw 6;
+    dw 1;
+    dw 7;
+    dw 1;
+    dw 8;
+    dw 1;
+    dw 9;
+    dw 1;
+    dw 10;
+    dw 1;
+    dw 11;
+    dw 1;
+    dw 12;
+    dw 1;
+    dw 13;
+    dw 1;
+    dw 14;
+    dw 1;
+    dw 15;
+    dw 2;
+    dw 0;
+    dw 2;
+    dw 1;
+    dw 2;
+    dw 2;
+    dw 2;
+    dw 3;
+    dw 2;
+    dw 4;
+    dw 2;
+    dw 5;
+    dw 2;
+    dw 6;
+    dw 2;
+    dw 7;
+    dw 2;
+    dw 8;
+    dw 2;
+    dw 9;
+    dw 2;
+    dw 10;
+    dw 2;
+    dw 11;
+    dw 2;
+    dw 12;
+    dw 2;
+    dw 13;
+    dw 2;
+    dw 14;
+    dw 2;
+    dw 15;
+    dw 3;
+    dw 0;
+    dw 3;
+    dw 1;
+    dw 3;
+    dw 2;
+    dw 3;
+    dw 3;
+    dw 3;
+    dw 4;
+    dw 3;
+    dw 5;
+    dw 3;
+    dw 6;
+    dw 3;
+    dw 7;
+    dw 3;
+    dw 8;
+    dw 3;
+    dw 9;
+    dw 3;
+    dw 10;
+    dw 3;
+    dw 11;
+    dw 3;
+    dw 12;
+    dw 3;
+    dw 13;
+    dw 3;
+    dw 14;
+    dw 3;
+    dw 15;
+    dw 4;
+    dw 0;
+    dw 4;
+    dw 1;
+    dw 4;
+    dw 2;
+    dw 4;
+    dw 3;
+    dw 4;
+    dw 4;
+    dw 4;
+    dw 5;
+    dw 4;
+    dw 6;
+    dw 4;
+    dw 7;
+    dw 4;
+    dw 8;
+    dw 4;
+    dw 9;
+    dw 4;
+    dw 10;
+    dw 4;
+    dw 11;
+    dw 4;
+    dw 12;
+    dw 4;
+    dw 13;
+    dw 4;
+    dw 14;
+    dw 4;
+    dw 15;
+    dw 5;
+    dw 0;
+    dw 5;
+    dw 1;
+    dw 5;
+    dw 2;
+    dw 5;
+    dw 3;
+    dw 5;
+    dw 4;
+    dw 5;
+    dw 5;
+    dw 5;
+    dw 6;
+    dw 5;
+    dw 7;
+    dw 5;
+    dw 8;
+    dw 5;
+    dw 9;
+    dw 5;
+    dw 10;
+    dw 5;
+    dw 11;
+    dw 5;
+    dw 12;
+    dw 5;
+    dw 13;
+    dw 5;
+    dw 14;
+    dw 5;
+    dw 15;
+    dw 6;
+    dw 0;
+    dw 6;
+    dw 1;
+    dw 6;
+    dw 2;
+    dw 6;
+    dw 3;
+    dw 6;
+    dw 4;
+    dw 6;
+    dw 5;
+    dw 6;
+    dw 6;
+    dw 6;
+    dw 7;
+    dw 6;
+    dw 8;
+    dw 6;
+    dw 9;
+    dw 6;
+    dw 10;
+    dw 6;
+    dw 11;
+    dw 6;
+    dw 12;
+    dw 6;
+    dw 13;
+    dw 6;
+    dw 14;
+    dw 6;
+    dw 15;
+    dw 7;
+    dw 0;
+    dw 7;
+    dw 1;
+    dw 7;
+    dw 2;
+    dw 7;
+    dw 3;
+    dw 7;
+    dw 4;
+    dw 7;
+    dw 5;
+    dw 7;
+    dw 6;
+    dw 7;
+    dw 7;
+    dw 7;
+    dw 8;
+    dw 7;
+    dw 9;
+    dw 7;
+    dw 10;
+    dw 7;
+    dw 11;
+    dw 7;
+    dw 12;
+    dw 7;
+    dw 13;
+    dw 7;
+    dw 14;
+    dw 7;
+    dw 15;
+    dw 8;
+    dw 0;
+    dw 8;
+    dw 1;
+    dw 8;
+    dw 2;
+    dw 8;
+    dw 3;
+    dw 8;
+    dw 4;
+    dw 8;
+    dw 5;
+    dw 8;
+    dw 6;
+    dw 8;
+    dw 7;
+    dw 8;
+    dw 8;
+    dw 8;
+    dw 9;
+    dw 8;
+    dw 10;
+    dw 8;
+    dw 11;
+    dw 8;
+    dw 12;
+    dw 8;
+    dw 13;
+    dw 8;
+    dw 14;
+    dw 8;
+    dw 15;
+    dw 9;
+    dw 0;
+    dw 9;
+    dw 1;
+    dw 9;
+    dw 2;
+    dw 9;
+    dw 3;
+    dw 9;
+    dw 4;
+    dw 9;
+    dw 5;
+    dw 9;
+    dw 6;
+    dw 9;
+    dw 7;
+    dw 9;
+    dw 8;
+    dw 9;
+    dw 9;
+    dw 9;
+    dw 10;
+    dw 9;
+    dw 11;
+    dw 9;
+    dw 12;
+    dw 9;
+    dw 13;
+    dw 9;
+    dw 14;
+    dw 9;
+    dw 15;
+    dw 10;
+    dw 0;
+    dw 10;
+    dw 1;
+    dw 10;
+    dw 2;
+    dw 10;
+    dw 3;
+    dw 10;
+    dw 4;
+    dw 10;
+    dw 5;
+    dw 10;
+    dw 6;
+    dw 10;
+    dw 7;
+    dw 10;
+    dw 8;
+    dw 10;
+    dw 9;
+    dw 10;
+    dw 10;
+    dw 10;
+    dw 11;
+    dw 10;
+    dw 12;
+    dw 10;
+    dw 13;
+    dw 10;
+    dw 14;
+    dw 10;
+    dw 15;
+    dw 11;
+    dw 0;
+    dw 11;
+    dw 1;
+    dw 11;
+    dw 2;
+    dw 11;
+    dw 3;
+    dw 11;
+    dw 4;
+    dw 11;
+    dw 5;
+    dw 11;
+    dw 6;
+    dw 11;
+    dw 7;
+    dw 11;
+    dw 8;
+    dw 11;
+    dw 9;
+    dw 11;
+    dw 10;
+    dw 11;
+    dw 11;
+    dw 11;
+    dw 12;
+    dw 11;
+    dw 13;
+    dw 11;
+    dw 14;
+    dw 11;
+    dw 15;
+    dw 12;
+    dw 0;
+    dw 12;
+    dw 1;
+    dw 12;
+    dw 2;
+    dw 12;
+    dw 3;
+    dw 12;
+    dw 4;
+    dw 12;
+    dw 5;
+    dw 12;
+    dw 6;
+    dw 12;
+    dw 7;
+    dw 12;
+    dw 8;
+    dw 12;
+    dw 9;
+    dw 12;
+    dw 10;
+    dw 12;
+    dw 11;
+    dw 12;
+    dw 12;
+    dw 12;
+    dw 13;
+    dw 12;
+    dw 14;
+    dw 12;
+    dw 15;
+    dw 13;
+    dw 0;
+    dw 13;
+    dw 1;
+    dw 13;
+    dw 2;
+    dw 13;
+    dw 3;
+    dw 13;
+    dw 4;
+    dw 13;
+    dw 5;
+    dw 13;
+    dw 6;
+    dw 13;
+    dw 7;
+    dw 13;
+    dw 8;
+    dw 13;
+    dw 9;
+    dw 13;
+    dw 10;
+    dw 13;
+    dw 11;
+    dw 13;
+    dw 12;
+    dw 13;
+    dw 13;
+    dw 13;
+    dw 14;
+    dw 13;
+    dw 15;
+    dw 14;
+    dw 0;
+    dw 14;
+    dw 1;
+    dw 14;
+    dw 2;
+    dw 14;
+    dw 3;
+    dw 14;
+    dw 4;
+    dw 14;
+    dw 5;
+    dw 14;
+    dw 6;
+    dw 14;
+    dw 7;
+    dw 14;
+    dw 8;
+    dw 14;
+    dw 9;
+    dw 14;
+    dw 10;
+    dw 14;
+    dw 11;
+    dw 14;
+    dw 12;
+    dw 14;
+    dw 13;
+    dw 14;
+    dw 14;
+    dw 14;
+    dw 15;
+    dw 15;
+    dw 0;
+    dw 15;
+    dw 1;
+    dw 15;
+    dw 2;
+    dw 15;
+    dw 3;
+    dw 15;
+    dw 4;
+    dw 15;
+    dw 5;
+    dw 15;
+    dw 6;
+    dw 15;
+    dw 7;
+    dw 15;
+    dw 8;
+    dw 15;
+    dw 9;
+    dw 15;
+    dw 10;
+    dw 15;
+    dw 11;
+    dw 15;
+    dw 12;
+    dw 15;
+    dw 13;
+    dw 15;
+    dw 14;
+    dw 15;
+    dw 15;
 }
 
 func _prepare_trie{
@@ -0,0 +1,123 @@
+from starkware.cairo.common.default_dict import default_dict_finalize_inner
+from starkware.cairo.common.dict_access import DictAccess
+from starkware.cairo.common.math import assert_le_felt
+
+from ethereum_types.bytes import Bytes
+from ethereum_types.numeric import U256, U256Struct
+from ethereum.prague.vm.runtime import finalize_jumpdests
+from legacy.utils.dict import dict_read, dict_write, dict_squash
+
+// @notice Prototype of a single dict holding the valid jump destinations, the stack and the memory
+// of a message call frame, squashed once at the end of the frame instead of once per dict.
+// @dev Entries are keyed by (kind, key), encoded as `kind * FRAME_DICT_KIND_SHIFT + key`. The jump
+// destinations are kind 0: their keys are the program counters, and they come first once the dict
+// is squashed. The stack and memory entries follow, and default to 0.
+struct FrameDict {
+    value: FrameDictStruct*,
+}
+
+struct FrameDictStruct {
+    dict_ptr_start: DictAccess*,
+    dict_ptr: DictAccess*,
+}
+
+// Keys of every kind are below 2**128: jump destinations are u128, stack indices are below
+// STACK_MAX_SIZE and memory word indices are bounded by the memory expansion gas.
+const FRAME_DICT_KIND_SHIFT = 2 ** 128;
+const FRAME_DICT_KIND_JUMPDEST = 0;
+const FRAME_DICT_KIND_STACK = 1;
+const FRAME_DICT_KIND_MEMORY = 2;
+
+namespace FrameDictImpl {
+    // @notice Creates the frame dict of a message call executing `bytecode`.
+    // @dev As in `get_valid_jump_destinations`, the valid jump destinations are an oracle: they are
+    // checked against the bytecode in `finalize`.
+    func init(bytecode: Bytes) -> FrameDict {
+        %{ initialize_jumpdests %}
+        ap += 1;
+        let dict_ptr_start = cast([ap - 1], DictAccess*);
+        tempvar frame_dict = FrameDict(new FrameDictStruct(dict_ptr_start, dict_ptr_start));
+        return frame_dict;
+    }
+
+    func read{frame_dict: FrameDict}(kind: felt, key: felt) -> felt {
+        alloc_locals;
+        let dict_ptr = frame_dict.value.dict_ptr;
+        let (value) = dict_read{dict_ptr=dict_ptr}(kind * FRAME_DICT_KIND_SHIFT + key);
+        tempvar frame_dict = FrameDict(
+            new FrameDictStruct(dict_ptr_start=frame_dict.value.dict_ptr_start, dict_ptr=dict_ptr)
+        );
+        return value;
+    }
+
+    func write{frame_dict: FrameDict}(kind: felt, key: felt, value: felt) {
+        let dict_ptr = frame_dict.value.dict_ptr;
+        dict_write{dict_ptr=dict_ptr}(kind * FRAME_DICT_KIND_SHIFT + key, value);
+        tempvar frame_dict = FrameDict(
+            new FrameDictStruct(dict_ptr_start=frame_dict.value.dict_ptr_start, dict_ptr=dict_ptr)
+        );
+        return ();
+    }
+
+    func is_valid_jumpdest{frame_dict: FrameDict}(pc: felt) -> felt {
+        return read(FRAME_DICT_KIND_JUMPDEST, pc);
+    }
+
+    func stack_read{frame_dict: FrameDict}(index: felt) -> U256 {
+        let value = read(FRAME_DICT_KIND_STACK, index);
+        tempvar res = U256(cast(value, U256Struct*));
+        return res;
+    }
+
+    func stack_write{frame_dict: FrameDict}(index: felt, value: U256) {
+        return write(FRAME_DICT_KIND_STACK, index, cast(value.value, felt));
+    }
+
+    func memory_read{frame_dict: FrameDict}(word_index: felt) -> felt {
+        return read(FRAME_DICT_KIND_MEMORY, word_index);
+    }
+
+    func memory_write{frame_dict: FrameDict}(word_index: felt, value: felt) {
+        return write(FRAME_DICT_KIND_MEMORY, word_index, value);
+    }
+
+    // @notice Squashes the frame dict once, then checks the jump destinations against `bytecode`
+    // and that the stack and memory entries were first read with their default value 0.
+    func finalize{range_check_ptr}(frame_dict: FrameDict, bytecode: Bytes) {
+        alloc_locals;
+        let (local squashed_start, local squashed_end) = dict_squash(
+            frame_dict.value.dict_ptr_start, frame_dict.value.dict_ptr
+        );
+
+        // The squashed keys are sorted: the jump destinations are the entries before the first
+        // key of another kind.
+        local n_jumpdests;
+        %{ frame_dict_jumpdests_len %}
+        local jumpdests_end: DictAccess* = squashed_start + n_jumpdests * DictAccess.SIZE;
+
+        if (n_jumpdests != 0) {
+            let last_jumpdest = jumpdests_end - DictAccess.SIZE;
+            assert [range_check_ptr] = last_jumpdest.key;
+            tempvar range_check_ptr = range_check_ptr + 1;
+        } else {
+            tempvar range_check_ptr = range_check_ptr;
+        }
+        let range_check_ptr = [ap - 1];
+
+        if (jumpdests_end != squashed_end) {
+            assert_le_felt(FRAME_DICT_KIND_SHIFT, jumpdests_end.key);
+            tempvar range_check_ptr = range_check_ptr;
+        } else {
+            tempvar range_check_ptr = range_check_ptr;
+        }
+        let range_check_ptr = [ap - 1];
+
+        finalize_jumpdests(0, squashed_start, jumpdests_end, bytecode);
+        default_dict_finalize_inner(
+            dict_accesses_start=jumpdests_end,
+            n_accesses=(squashed_end - jumpdests_end) / DictAccess.SIZE,
+            default_value=0,
+        );
+        return ();
+    }
+}
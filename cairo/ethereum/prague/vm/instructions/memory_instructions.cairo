@@ -6,7 +6,13 @@ from ethereum.exceptions import EthereumException
 from ethereum.prague.vm.exceptions import OutOfGasError
 from ethereum_types.numeric import U256, U256Struct, Uint
 from ethereum.prague.vm.gas import charge_gas, GasConstants, calculate_gas_extend_memory
-from ethereum.prague.vm.memory import expand_by, memory_read_bytes, memory_write
+from ethereum.prague.vm.memory import (
+    expand_by,
+    memory_read_bytes,
+    memory_read_u256,
+    memory_write,
+    memory_write_u256,
+)
 from ethereum.utils.numeric import ceil32
 from ethereum_types.bytes import Bytes, BytesStruct
 from starkware.cairo.common.alloc import alloc
@@ -16,8 +22,6 @@ from ethereum_types.others import (
     TupleU256U256,
     TupleU256U256Struct,
 )
-from legacy.utils.bytes import uint256_to_bytes32
-from legacy.utils.utils import Helpers
 
 // @notice Stores a word to memory
 func mstore{
@@ -61,15 +65,10 @@ func mstore{
     }
 
     // OPERATION
-    let memory = evm.value.memory;
-    let (value_data: felt*) = alloc();
-    uint256_to_bytes32(value_data, [value.value]);
-    tempvar value_bytes = Bytes(new BytesStruct(value_data, 32));
-
     let memory = evm.value.memory;
     with memory {
         expand_by(extend_memory.value.expand_by);
-        memory_write(start_position, value_bytes);
+        memory_write_u256(start_position, value);
     }
 
     // PROGRAM COUNTER
@@ -178,12 +177,11 @@ func mload{
     // OPERATION
     let memory = evm.value.memory;
     with memory {
-        let value_bytes = memory_read_bytes(start_position, U256(new U256Struct(32, 0)));
+        let value = memory_read_u256(start_position);
         expand_by(extend_memory.value.expand_by);
     }
-    let value = Helpers.bytes32_to_uint256(value_bytes.value.data);
     with stack {
-        let err = push(U256(new U256Struct(value.low, value.high)));
+        let err = push(value);
         if (cast(err, felt) != 0) {
             EvmImpl.set_stack(stack);
             EvmImpl.set_memory(memory);
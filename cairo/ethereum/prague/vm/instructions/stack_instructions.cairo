@@ -1,5 +1,6 @@
 from starkware.cairo.common.cairo_builtins import BitwiseBuiltin, PoseidonBuiltin, ModBuiltin
 from starkware.cairo.common.math_cmp import is_le
+from starkware.cairo.common.bool import FALSE
 
 from ethereum.prague.vm.stack import StackImpl, push, pop as stack_pop
 from ethereum.prague.vm.evm_impl import Evm, EvmImpl
@@ -25,12 +26,25 @@ func push_n{range_check_ptr, evm: Evm}(num_bytes: Uint) -> EthereumException* {
     }
 
     let code = evm.value.code;
-    tempvar start_position = U256(new U256Struct(evm.value.pc.value + 1, 0));
-    // @dev: assumption that size is <= 32
-    tempvar size = U256(new U256Struct(num_bytes.value, 0));
-    let _data = buffer_read(code, start_position, size);
-    let data = Helpers.bytes_to_uint256(num_bytes.value, _data.value.data);
-    tempvar data_to_push = U256(new U256Struct(data.low, data.high));
+    let immediate_start = evm.value.pc.value + 1;
+    // Immediates fully contained in the code, i.e. all but a truncated PUSH at the end of the
+    // code, are decoded in place instead of being copied to a zero-padded buffer first.
+    let is_immediate_in_code = is_le(immediate_start + num_bytes.value, code.value.len);
+    if (is_immediate_in_code != FALSE) {
+        let data = Helpers.bytes_to_uint256(num_bytes.value, code.value.data + immediate_start);
+        tempvar data_to_push = U256(new U256Struct(data.low, data.high));
+        tempvar range_check_ptr = range_check_ptr;
+    } else {
+        tempvar start_position = U256(new U256Struct(immediate_start, 0));
+        // @dev: assumption that size is <= 32
+        tempvar size = U256(new U256Struct(num_bytes.value, 0));
+        let _data = buffer_read(code, start_position, size);
+        let data = Helpers.bytes_to_uint256(num_bytes.value, _data.value.data);
+        tempvar data_to_push = U256(new U256Struct(data.low, data.high));
+        tempvar range_check_ptr = range_check_ptr;
+    }
+    let data_to_push = U256(cast([ap - 2], U256Struct*));
+    let range_check_ptr = [ap - 1];
 
     // STACK
     let stack = evm.value.stack;
@@ -34,7 +34,7 @@ from ethereum.prague.vm.exceptions import (
 
 from ethereum.prague.vm.precompiled_contracts.mapping import precompile_table_lookup
 from ethereum.prague.vm.instructions import op_implementation
-from ethereum.prague.vm.memory import Memory, MemoryStruct, Bytes1DictAccess
+from ethereum.prague.vm.memory import Memory, MemoryStruct, MemoryWordDictAccess
 from ethereum.prague.vm.runtime import get_valid_jump_destinations, finalize_jumpdests
 from ethereum.prague.vm.stack import Stack, StackStruct, StackDictAccess
 from ethereum.utils.numeric import U256, U256Struct, U256__eq__
@@ -300,8 +300,8 @@ func execute_code{
     let dict_ptr = dict_start;
     tempvar empty_memory = Memory(
         new MemoryStruct(
-            dict_ptr_start=cast(dict_start, Bytes1DictAccess*),
-            dict_ptr=cast(dict_ptr, Bytes1DictAccess*),
+            dict_ptr_start=cast(dict_start, MemoryWordDictAccess*),
+            dict_ptr=cast(dict_ptr, MemoryWordDictAccess*),
             len=0,
         ),
     );
@@ -718,8 +718,8 @@ func finalize_evm{range_check_ptr, evm: Evm}() {
     );
     tempvar new_memory = Memory(
         new MemoryStruct(
-            dict_ptr_start=cast(new_memory_start, Bytes1DictAccess*),
-            dict_ptr=cast(new_memory_end, Bytes1DictAccess*),
+            dict_ptr_start=cast(new_memory_start, MemoryWordDictAccess*),
+            dict_ptr=cast(new_memory_end, MemoryWordDictAccess*),
             len=memory.value.len,
         ),
     );
@@ -3,17 +3,28 @@
 from starkware.cairo.common.alloc import alloc
 from starkware.cairo.common.bool import TRUE
 from starkware.cairo.common.dict import DictAccess
+from starkware.cairo.common.math import split_int
 from starkware.cairo.common.memset import memset
 from starkware.cairo.common.memcpy import memcpy
 from starkware.cairo.common.math_cmp import is_le
 
-from ethereum_types.bytes import Bytes, BytesStruct, Bytes1DictAccess
-from ethereum_types.numeric import U256, Uint
+from ethereum_types.bytes import Bytes, BytesStruct
+from ethereum_types.numeric import U256, U256Struct, Uint
+from cairo_core.maths import unsigned_div_rem, pow256
+from legacy.utils.array import reverse
+from legacy.utils.bytes import bytes_to_felt
 from legacy.utils.dict import dict_read, dict_write
 
+// Number of bytes packed in a memory word.
+const MEMORY_WORD_SIZE = 16;
+
+// The memory is stored as 16-byte words keyed by word index, i.e. byte position // 16.
+// A word is the big-endian packing of its bytes, so that a 32-byte access touches 2 or 3 dict
+// entries instead of 32. Words never written are read as 0.
+// `len` is the size of the memory in bytes.
 struct MemoryStruct {
-    dict_ptr_start: Bytes1DictAccess*,
-    dict_ptr: Bytes1DictAccess*,
+    dict_ptr_start: MemoryWordDictAccess*,
+    dict_ptr: MemoryWordDictAccess*,
     len: felt,
 }
 
@@ -21,6 +32,12 @@ struct Memory {
     value: MemoryStruct*,
 }
 
+struct MemoryWordDictAccess {
+    key: felt,
+    prev_value: felt,
+    new_value: felt,
+}
+
 // @notice Write bytes to memory at a given position.
 // @dev assumption: memory is resized by the calling opcode
 // @param memory The pointer to the bytearray.
@@ -45,7 +62,7 @@ func memory_write{range_check_ptr, memory: Memory}(start_position: U256, value:
     with dict_ptr {
         _write_bytes(start_position_felt, bytes_data, bytes_len);
     }
-    let new_dict_ptr = cast(dict_ptr, Bytes1DictAccess*);
+    let new_dict_ptr = cast(dict_ptr, MemoryWordDictAccess*);
 
     // we do not resize the memory here as it is done by the calling opcode
     tempvar memory = Memory(
@@ -59,7 +76,9 @@ func memory_write{range_check_ptr, memory: Memory}(start_position: U256, value:
 // @param start_position Starting position to read from.
 // @param size Number of bytes to read.
 // @return The bytes read from memory.
-func memory_read_bytes{memory: Memory}(start_position: U256, size: U256) -> Bytes {
+func memory_read_bytes{range_check_ptr, memory: Memory}(
+    start_position: U256, size: U256
+) -> Bytes {
     alloc_locals;
 
     with_attr error_message("memory_read_bytes: size > 2**128") {
@@ -84,7 +103,7 @@ func memory_read_bytes{memory: Memory}(start_position: U256, size: U256) -> Byte
     with dict_ptr {
         _read_bytes(start_position_felt, size_felt, output);
     }
-    let new_dict_ptr = cast(dict_ptr, Bytes1DictAccess*);
+    let new_dict_ptr = cast(dict_ptr, MemoryWordDictAccess*);
 
     tempvar memory = Memory(
         new MemoryStruct(memory.value.dict_ptr_start, new_dict_ptr, memory.value.len)
@@ -93,6 +112,120 @@ func memory_read_bytes{memory: Memory}(start_position: U256, size: U256) -> Byte
     return result;
 }
 
+// @notice Write a 32-byte big-endian word to memory at a given position.
+// @dev Equivalent to `memory_write` with the 32 bytes of `value`, without splitting it into bytes.
+// @dev assumption: memory is resized by the calling opcode
+// @param start_position Starting position to write at.
+// @param value The value to write.
+func memory_write_u256{range_check_ptr, memory: Memory}(start_position: U256, value: U256) {
+    alloc_locals;
+
+    with_attr error_message("memory_write: start_position > 2**128") {
+        assert start_position.value.high = 0;
+    }
+
+    let dict_ptr = cast(memory.value.dict_ptr, DictAccess*);
+    let (local word_index, local offset) = unsigned_div_rem(
+        start_position.value.low, MEMORY_WORD_SIZE
+    );
+
+    // Aligned: the value is exactly two words.
+    if (offset == 0) {
+        dict_write{dict_ptr=dict_ptr}(word_index, value.value.high);
+        dict_write{dict_ptr=dict_ptr}(word_index + 1, value.value.low);
+        tempvar range_check_ptr = range_check_ptr;
+        tempvar dict_ptr = dict_ptr;
+    } else {
+        // Unaligned: the value overwrites the last 16 - offset bytes of the first word,
+        // the whole second word and the first offset bytes of the third word.
+        let head_factor_ = pow256(offset);
+        local head_factor = head_factor_;
+        let tail_factor_ = pow256(MEMORY_WORD_SIZE - offset);
+        local tail_factor = tail_factor_;
+
+        let (local high_head, local high_tail) = unsigned_div_rem(value.value.high, head_factor);
+        let (local low_head, local low_tail) = unsigned_div_rem(value.value.low, head_factor);
+
+        let (first_word) = dict_read{dict_ptr=dict_ptr}(word_index);
+        let (first_word_head, _) = unsigned_div_rem(first_word, tail_factor);
+        dict_write{dict_ptr=dict_ptr}(word_index, first_word_head * tail_factor + high_head);
+
+        dict_write{dict_ptr=dict_ptr}(word_index + 1, high_tail * tail_factor + low_head);
+
+        let (last_word) = dict_read{dict_ptr=dict_ptr}(word_index + 2);
+        let (_, last_word_tail) = unsigned_div_rem(last_word, tail_factor);
+        dict_write{dict_ptr=dict_ptr}(word_index + 2, low_tail * tail_factor + last_word_tail);
+        tempvar range_check_ptr = range_check_ptr;
+        tempvar dict_ptr = dict_ptr;
+    }
+    let range_check_ptr = [ap - 2];
+    let dict_ptr = cast([ap - 1], DictAccess*);
+    let new_dict_ptr = cast(dict_ptr, MemoryWordDictAccess*);
+
+    tempvar memory = Memory(
+        new MemoryStruct(memory.value.dict_ptr_start, new_dict_ptr, memory.value.len)
+    );
+    return ();
+}
+
+// @notice Read a 32-byte big-endian word from memory.
+// @dev Equivalent to packing the 32 bytes returned by `memory_read_bytes`, without reading them
+// one by one.
+// @param start_position Starting position to read from.
+// @return The value read from memory.
+func memory_read_u256{range_check_ptr, memory: Memory}(start_position: U256) -> U256 {
+    alloc_locals;
+
+    with_attr error_message("memory_read_bytes: start_position > 2**128") {
+        assert start_position.value.high = 0;
+    }
+
+    let dict_ptr = cast(memory.value.dict_ptr, DictAccess*);
+    let (local word_index, local offset) = unsigned_div_rem(
+        start_position.value.low, MEMORY_WORD_SIZE
+    );
+
+    let (local first_word) = dict_read{dict_ptr=dict_ptr}(word_index);
+    let (local second_word) = dict_read{dict_ptr=dict_ptr}(word_index + 1);
+
+    // Aligned: the value is exactly two words.
+    if (offset == 0) {
+        tempvar result = U256(new U256Struct(low=second_word, high=first_word));
+        tempvar range_check_ptr = range_check_ptr;
+        tempvar dict_ptr = dict_ptr;
+    } else {
+        // Unaligned: the value is made of the last 16 - offset bytes of the first word,
+        // the whole second word and the first offset bytes of the third word.
+        let (local last_word) = dict_read{dict_ptr=dict_ptr}(word_index + 2);
+        local dict_ptr: DictAccess* = dict_ptr;
+        let head_factor_ = pow256(offset);
+        local head_factor = head_factor_;
+        let tail_factor_ = pow256(MEMORY_WORD_SIZE - offset);
+        local tail_factor = tail_factor_;
+
+        let (local last_word_head, _) = unsigned_div_rem(last_word, tail_factor);
+        let (local second_word_head, local second_word_tail) = unsigned_div_rem(
+            second_word, tail_factor
+        );
+        let (_, first_word_tail) = unsigned_div_rem(first_word, tail_factor);
+
+        tempvar high = first_word_tail * head_factor + second_word_head;
+        tempvar low = second_word_tail * head_factor + last_word_head;
+        tempvar result = U256(new U256Struct(low=low, high=high));
+        tempvar range_check_ptr = range_check_ptr;
+        tempvar dict_ptr = dict_ptr;
+    }
+    let result = U256(cast([ap - 3], U256Struct*));
+    let range_check_ptr = [ap - 2];
+    let dict_ptr = cast([ap - 1], DictAccess*);
+    let new_dict_ptr = cast(dict_ptr, MemoryWordDictAccess*);
+
+    tempvar memory = Memory(
+        new MemoryStruct(memory.value.dict_ptr_start, new_dict_ptr, memory.value.len)
+    );
+    return result;
+}
+
 // @notice Read bytes from a buffer with zero padding.
 // @dev assumption: size < 2**128
 // @param buffer Source bytes to read from.
@@ -141,57 +274,116 @@ func expand_by{memory: Memory}(expansion: Uint) {
     return ();
 }
 
-// @notice Internal function to write bytes to memory.
+// @notice Internal function to write bytes to memory, one word at a time.
 // @dev Length was checked to not be 0 in the caller.
 // @param start_position Starting position to write at.
 // @param data Pointer to the bytes data.
 // @param len Length of bytes to write.
-func _write_bytes{dict_ptr: DictAccess*}(start_position: felt, data: felt*, len: felt) {
-    tempvar index = len;
-    tempvar dict_ptr = dict_ptr;
-
-    body:
-    let index = [ap - 2] - 1;
+func _write_bytes{range_check_ptr, dict_ptr: DictAccess*}(
+    start_position: felt, data: felt*, len: felt
+) {
+    alloc_locals;
+    let (local word_index, local offset) = unsigned_div_rem(start_position, MEMORY_WORD_SIZE);
+    let chunk_size = _word_chunk_size(offset, len);
+    local n_bytes = chunk_size;
+
+    // Whole words are overwritten without being read.
+    if (n_bytes == MEMORY_WORD_SIZE) {
+        let word = bytes_to_felt(MEMORY_WORD_SIZE, data);
+        dict_write(word_index, word);
+        tempvar range_check_ptr = range_check_ptr;
+        tempvar dict_ptr = dict_ptr;
+    } else {
+        let (word) = dict_read(word_index);
+        let new_word = _replace_word_bytes(word, offset, n_bytes, data);
+        dict_write(word_index, new_word);
+        tempvar range_check_ptr = range_check_ptr;
+        tempvar dict_ptr = dict_ptr;
+    }
+    let range_check_ptr = [ap - 2];
     let dict_ptr = cast([ap - 1], DictAccess*);
-    let start_position = [fp - 5];
-    let data = cast([fp - 4], felt*);
-
-    dict_write(start_position + index, data[index]);
 
-    tempvar index = index;
-    tempvar dict_ptr = dict_ptr;
-    jmp body if index != 0;
-
-    end:
-    return ();
+    if (n_bytes == len) {
+        return ();
+    }
+    return _write_bytes(start_position + n_bytes, data + n_bytes, len - n_bytes);
 }
 
-// @notice Internal function to read bytes from memory.
+// @notice Internal function to read bytes from memory, one word at a time.
 // @dev Size was checked to not be 0 in the caller.
 // @param start_position Starting position to read from.
 // @param size Number of bytes to read.
 // @param output Pointer to write output bytes to.
-func _read_bytes{dict_ptr: DictAccess*}(start_position: felt, size: felt, output: felt*) {
+func _read_bytes{range_check_ptr, dict_ptr: DictAccess*}(
+    start_position: felt, size: felt, output: felt*
+) {
     alloc_locals;
+    let (local word_index, local offset) = unsigned_div_rem(start_position, MEMORY_WORD_SIZE);
+    let chunk_size = _word_chunk_size(offset, size);
+    local n_bytes = chunk_size;
+
+    let (word) = dict_read(word_index);
+    local dict_ptr: DictAccess* = dict_ptr;
+    if (n_bytes == MEMORY_WORD_SIZE) {
+        tempvar chunk = word;
+        tempvar range_check_ptr = range_check_ptr;
+    } else {
+        let chunk = _extract_word_bytes(word, offset, n_bytes);
+        tempvar chunk = chunk;
+        tempvar range_check_ptr = range_check_ptr;
+    }
+    let chunk = [ap - 2];
+    let range_check_ptr = [ap - 1];
 
-    tempvar dict_index = start_position + size;
-    tempvar dict_ptr = dict_ptr;
+    // Unpack the chunk to big-endian bytes.
+    let (local chunk_bytes: felt*) = alloc();
+    split_int(chunk, n_bytes, 256, 256, chunk_bytes);
+    reverse(output, n_bytes, chunk_bytes);
 
-    body:
-    let dict_index = [ap - 2] - 1;
-    let dict_ptr = cast([ap - 1], DictAccess*);
-    let output = cast([fp - 3], felt*);
-    let start_position = [fp - 5];
-    tempvar output_index = dict_index - start_position;
+    if (n_bytes == size) {
+        return ();
+    }
+    return _read_bytes(start_position + n_bytes, size - n_bytes, output + n_bytes);
+}
 
-    let (value) = dict_read(dict_index);
-    assert output[output_index] = value;
+// @notice Returns the number of bytes of a `len`-byte access starting at `offset` in a word
+// that fall into that word, i.e. min(len, MEMORY_WORD_SIZE - offset).
+func _word_chunk_size{range_check_ptr}(offset: felt, len: felt) -> felt {
+    let fits_in_word = is_le(offset + len, MEMORY_WORD_SIZE);
+    if (fits_in_word == TRUE) {
+        return len;
+    }
+    return MEMORY_WORD_SIZE - offset;
+}
 
-    tempvar dict_index = dict_index;
-    tempvar dict_ptr = dict_ptr;
-    jmp body if output_index != 0;
+// @notice Returns the packing of the bytes [offset, offset + len) of a word.
+// @dev 0 < len < MEMORY_WORD_SIZE and offset + len <= MEMORY_WORD_SIZE.
+func _extract_word_bytes{range_check_ptr}(word: felt, offset: felt, len: felt) -> felt {
+    alloc_locals;
+    let chunk_factor_ = pow256(len);
+    local chunk_factor = chunk_factor_;
+    let tail_factor = pow256(MEMORY_WORD_SIZE - offset - len);
+    let (head, _) = unsigned_div_rem(word, tail_factor);
+    let (_, chunk) = unsigned_div_rem(head, chunk_factor);
+    return chunk;
+}
 
-    return ();
+// @notice Returns a word with its bytes [offset, offset + len) replaced by the `len` bytes of
+// `data`.
+// @dev 0 < len < MEMORY_WORD_SIZE and offset + len <= MEMORY_WORD_SIZE.
+func _replace_word_bytes{range_check_ptr}(
+    word: felt, offset: felt, len: felt, data: felt*
+) -> felt {
+    alloc_locals;
+    let chunk_factor_ = pow256(len);
+    local chunk_factor = chunk_factor_;
+    let tail_factor_ = pow256(MEMORY_WORD_SIZE - offset - len);
+    local tail_factor = tail_factor_;
+    let (head, local tail) = unsigned_div_rem(word, tail_factor);
+    let (local prefix, _) = unsigned_div_rem(head, chunk_factor);
+    let chunk = bytes_to_felt(len, data);
+    tempvar new_word = (prefix * chunk_factor + chunk) * tail_factor + tail;
+    return new_word;
 }
 
 // @notice Internal function to read bytes from a buffer with zero padding.
@@ -72,6 +72,7 @@ from ethereum.utils.numeric import (
 )
 from ethereum.utils.bytes import Bytes8_to_Bytes, Bytes__eq__, Bytes_to_Bytes32
 from cairo_core.comparison import is_zero
+from cairo_core.maths import felt252_bytes_length
 from legacy.utils.bytes import (
     felt_to_bytes,
     bytes_to_felt,
@@ -542,20 +543,8 @@ func encode_legacy_transaction{range_check_ptr}(transaction: LegacyTransaction)
 func encode_log{range_check_ptr}(raw_log: Log) -> Bytes {
     alloc_locals;
     let (local dst) = alloc();
-    let body_ptr = dst + PREFIX_LEN_MAX;
-
-    let address_len = _encode_address(body_ptr, raw_log.value.address);
-    let body_ptr = body_ptr + address_len;
-    let topics_len = _encode_tuple_bytes32(body_ptr, raw_log.value.topics);
-    let body_ptr = body_ptr + topics_len;
-    let data_len = _encode_bytes(body_ptr, raw_log.value.data);
-    let body_ptr = body_ptr + data_len;
-
-    let body_len = body_ptr - dst - PREFIX_LEN_MAX;
-    let body_ptr = dst + PREFIX_LEN_MAX;
-    let prefix_len = _encode_prefix_len(body_ptr, body_len);
-
-    tempvar result = Bytes(new BytesStruct(body_ptr - prefix_len, prefix_len + body_len));
+    let len = _encode_log(dst, raw_log);
+    tempvar result = Bytes(new BytesStruct(dst, len));
     return result;
 }
 
@@ -2208,6 +2197,26 @@ func _encode_tuple_bytes32_inner{range_check_ptr}(
     return ();
 }
 
+// @notice Encodes a log directly into `dst`.
+// @dev The length of the body is computed upfront so that the prefix can be written first,
+// avoiding a copy of the log data.
+func _encode_log{range_check_ptr}(dst: felt*, raw_log: Log) -> felt {
+    alloc_locals;
+    let body_len = _get_log_body_len(raw_log);
+    let prefix_len = _encode_list_prefix(dst, body_len);
+    let body_ptr = dst + prefix_len;
+
+    let address_len = _encode_address(body_ptr, raw_log.value.address);
+    let body_ptr = body_ptr + address_len;
+    let topics_len = _encode_tuple_bytes32(body_ptr, raw_log.value.topics);
+    let body_ptr = body_ptr + topics_len;
+    let data_len = _encode_bytes(body_ptr, raw_log.value.data);
+    let body_ptr = body_ptr + data_len;
+
+    assert body_ptr - dst - prefix_len = body_len;
+    return prefix_len + body_len;
+}
+
 func _encode_tuple_log{range_check_ptr}(dst: felt*, raw_tuple_log: TupleLog) -> felt {
     alloc_locals;
     if (raw_tuple_log.value.len == 0) {
@@ -2215,14 +2224,12 @@ func _encode_tuple_log{range_check_ptr}(dst: felt*, raw_tuple_log: TupleLog) ->
         return 1;
     }
 
-    let (local tmp) = alloc();
-    let body_ptr = tmp + PREFIX_LEN_MAX;
-    let body_len = _encode_tuple_log_inner(
-        body_ptr, raw_tuple_log.value.len, raw_tuple_log.value.data
+    let body_len = _get_tuple_log_body_len(raw_tuple_log.value.len, raw_tuple_log.value.data);
+    let prefix_len = _encode_list_prefix(dst, body_len);
+    let written_len = _encode_tuple_log_inner(
+        dst + prefix_len, raw_tuple_log.value.len, raw_tuple_log.value.data
     );
-    let prefix_len = _encode_prefix_len(body_ptr, body_len);
-
-    memcpy(dst, body_ptr - prefix_len, prefix_len + body_len);
+    assert written_len = body_len;
 
     return prefix_len + body_len;
 }
@@ -2233,14 +2240,33 @@ func _encode_tuple_log_inner{range_check_ptr}(dst: felt*, len: felt, raw_tuple_l
         return 0;
     }
 
-    let log_encoded = encode_log(raw_tuple_log[0]);
-    memcpy(dst, log_encoded.value.data, log_encoded.value.len);
+    let log_len = _encode_log(dst, raw_tuple_log[0]);
+    let remaining_len = _encode_tuple_log_inner(dst + log_len, len - 1, raw_tuple_log + 1);
 
-    let remaining_len = _encode_tuple_log_inner(
-        dst + log_encoded.value.len, len - 1, raw_tuple_log + 1
-    );
+    return log_len + remaining_len;
+}
 
-    return log_encoded.value.len + remaining_len;
+// @notice Returns the length of the encoded body of a log, without its prefix.
+func _get_log_body_len{range_check_ptr}(raw_log: Log) -> felt {
+    alloc_locals;
+    let topics_len = _get_tuple_bytes32_encoded_len(raw_log.value.topics.value.len);
+    let data_len = _get_bytes_encoded_len(raw_log.value.data);
+    // The address is always encoded on 21 bytes
+    return 21 + topics_len + data_len;
+}
+
+// @notice Returns the length of the concatenated encodings of `len` logs.
+func _get_tuple_log_body_len{range_check_ptr}(len: felt, raw_tuple_log: Log*) -> felt {
+    alloc_locals;
+    if (len == 0) {
+        return 0;
+    }
+
+    let body_len = _get_log_body_len(raw_tuple_log[0]);
+    let prefix_len = _get_list_prefix_len(body_len);
+    let remaining_len = _get_tuple_log_body_len(len - 1, raw_tuple_log + 1);
+
+    return prefix_len + body_len + remaining_len;
 }
 
 func _encode_tuple_access_list_inner{range_check_ptr}(
@@ -2319,6 +2345,74 @@ func _encode_prefix_len{range_check_ptr}(dst: felt*, len: felt) -> felt {
     return 1 + len_be_len;
 }
 
+// @notice Writes the prefix of a list with a body of `len` bytes at `dst`.
+// @dev Unlike `_encode_prefix_len`, the prefix is written forward, starting at [dst].
+// @return The length of the prefix.
+func _encode_list_prefix{range_check_ptr}(dst: felt*, len: felt) -> felt {
+    alloc_locals;
+
+    let cond = is_le(len, 0x38 - 1);
+    if (cond != 0) {
+        assert [dst] = 0xC0 + len;
+        return 1;
+    }
+
+    let len_be_len = felt_to_bytes(dst + 1, len);
+    assert [dst] = 0xF7 + len_be_len;
+    return 1 + len_be_len;
+}
+
+// @notice Returns the length of the prefix of a list with a body of `len` bytes.
+func _get_list_prefix_len{range_check_ptr}(len: felt) -> felt {
+    let cond = is_le(len, 0x38 - 1);
+    if (cond != 0) {
+        return 1;
+    }
+
+    let len_be_len = felt252_bytes_length(len);
+    return 1 + len_be_len;
+}
+
+// @notice Returns the length of the encoding of `raw_bytes`, as written by `_encode_bytes`.
+func _get_bytes_encoded_len{range_check_ptr}(raw_bytes: Bytes) -> felt {
+    alloc_locals;
+    let len = raw_bytes.value.len;
+
+    if (len == 0) {
+        return 1;
+    }
+
+    let cond_1 = is_le(raw_bytes.value.data[0], 0x80 - 1);
+    let cond_2 = is_zero(len - 1);
+    if (cond_1 * cond_2 != 0) {
+        return 1;
+    }
+
+    let cond = is_le(len, 0x38 - 1);
+    if (cond != 0) {
+        return 1 + len;
+    }
+
+    let len_be_len = felt252_bytes_length(len);
+    return 1 + len_be_len + len;
+}
+
+// @notice Returns the length of the encoding of a tuple of `len` Bytes32, as written by
+// `_encode_tuple_bytes32`.
+func _get_tuple_bytes32_encoded_len{range_check_ptr}(len: felt) -> felt {
+    if (len == 0) {
+        return 1;
+    }
+
+    if (len == 1) {
+        return 34;
+    }
+
+    let joined_encodings_len = len * 33;
+    let len_joined_encodings_len = felt252_bytes_length(joined_encodings_len);
+    return 1 + len_joined_encodings_len + joined_encodings_len;
+}
+
 func _encode_bytes8{range_check_ptr}(dst: felt*, raw_bytes8: Bytes8) -> felt {
     alloc_locals;
     let bytes = Bytes8_to_Bytes(raw_bytes8);
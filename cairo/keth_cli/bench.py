@@ -0,0 +1,99 @@
+"""Benchmark reports of the execution resources used by the Keth programs."""
+
+import json
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterable, List
+
+# Execution resources of a run, as returned by `generate_trace`: `n_steps`, `n_memory_holes`
+# and the number of instances of each builtin.
+Resources = Dict[str, int]
+
+
+@dataclass
+class Regression:
+    """A metric of a step that increased above the threshold compared to the baseline."""
+
+    block: str
+    step: str
+    metric: str
+    baseline: int
+    current: int
+
+    @property
+    def increase(self) -> float:
+        """Relative increase of the metric over the baseline."""
+        if self.baseline == 0:
+            return float("inf")
+        return (self.current - self.baseline) / self.baseline
+
+
+def sum_resources(resources: Iterable[Resources]) -> Resources:
+    """Sum the execution resources of several runs, metric by metric."""
+    total: Resources = {}
+    for run_resources in resources:
+        for metric, value in run_resources.items():
+            total[metric] = total.get(metric, 0) + value
+    return total
+
+
+def build_block_report(step_resources: Dict[str, Resources]) -> Dict[str, Any]:
+    """
+    Build the report of a block from the execution resources of each of its steps.
+
+    The `main` program runs the whole block at once, so it is not added to the total of the
+    segmented steps.
+    """
+    return {
+        "steps": step_resources,
+        "total": sum_resources(
+            resources for step, resources in step_resources.items() if step != "main"
+        ),
+    }
+
+
+def compare_reports(
+    report: Dict[str, Any], baseline: Dict[str, Any], threshold: float
+) -> List[Regression]:
+    """
+    Compare a report against a baseline.
+
+    Every metric of every step (and of the block totals) present in both the report and the
+    baseline is compared. A metric regresses if it increased by more than `threshold`, relative
+    to its baseline value. Blocks, steps and metrics missing from either side are ignored.
+    """
+    regressions = []
+    for block, block_report in report["blocks"].items():
+        baseline_block = baseline["blocks"].get(block)
+        if baseline_block is None:
+            continue
+
+        steps = {**block_report["steps"], "total": block_report["total"]}
+        baseline_steps = {**baseline_block["steps"], "total": baseline_block["total"]}
+        for step, resources in steps.items():
+            baseline_resources = baseline_steps.get(step)
+            if baseline_resources is None:
+                continue
+            for metric, current in resources.items():
+                baseline_value = baseline_resources.get(metric)
+                if baseline_value is None:
+                    continue
+                if current > baseline_value * (1 + threshold):
+                    regressions.append(
+                        Regression(block, step, metric, baseline_value, current)
+                    )
+    return regressions
+
+
+def read_report(path: Path) -> Dict[str, Any]:
+    """Read a benchmark report from a JSON file."""
+    with open(path, "r") as f:
+        return json.load(f)
+
+
+def write_report(report: Dict[str, Any], path: Path) -> None:
+    """Write a benchmark report to a JSON file, with sorted keys for stable diffs."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w") as f:
+        json.dump(report, f, indent=2, sort_keys=True)
+        f.write("\n")
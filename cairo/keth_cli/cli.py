@@ -5,7 +5,7 @@ import logging
 import traceback
 from functools import wraps
 from pathlib import Path
-from typing import Callable, Optional
+from typing import Callable, List, Optional
 
 import typer
 from rich.console import Console
@@ -13,7 +13,7 @@ from rich.logging import RichHandler
 
 from keth_types.patches import apply_patches
 
-from .config import KethConfig
+from .config import KethConfig, SerializationFormat
 from .core import KethContext, validate_block_number
 from .exceptions import (
     CompiledProgramNotFoundError,
@@ -26,6 +26,7 @@ from .exceptions import (
 )
 from .orchestration import (
     run_ar_inputs_pipeline,
+    run_bench_pipeline,
     run_e2e_pipeline,
     run_prove_pipeline,
     run_trace_pipeline,
@@ -150,6 +151,26 @@ def trace(
         "--cairo-pie",
         help="Output Cairo PIE file",
     ),
+    columnar_trace: bool = typer.Option(
+        False,
+        "--columnar-trace",
+        help="Also write the relocated trace as a Parquet file, for out-of-core profiling",
+    ),
+    profile: bool = typer.Option(
+        False,
+        "--profile",
+        help="Also write the steps per call stack as a folded stacks file, for flamegraphs",
+    ),
+    output_format: SerializationFormat = typer.Option(
+        SerializationFormat.JSON,
+        "--format",
+        help="Format of the prover input file: 'json', 'binary' or 'binary-zstd'",
+    ),
+    hint_coverage: bool = typer.Option(
+        False,
+        "--hint-coverage",
+        help="Report the hints executed without a native implementation, with their call counts",
+    ),
 ):
     """
     Runs the KETH trace-generation step for a given Ethereum block.
@@ -180,6 +201,10 @@ def trace(
             branch_index=branch_index,
             output_trace_components=output_trace_components,
             cairo_pie=cairo_pie,
+            columnar_trace=columnar_trace,
+            profile=profile,
+            output_format=output_format,
+            hint_coverage=hint_coverage,
         )
 
     except InvalidBlockNumberError as e:
@@ -229,11 +254,16 @@ def prove(
         "--serde-cairo",
         help="Serialize the proof to a cairo-compatible format",
     ),
+    output_format: SerializationFormat = typer.Option(
+        SerializationFormat.JSON,
+        "--format",
+        help="Format of the proof file: 'json', 'binary' or 'binary-zstd' (ignored with --serde-cairo)",
+    ),
 ):
     """
     Generate a STWO proof from the prover input information file.
 
-    Reads the prover input info generated by the 'trace' command and
+    Reads the prover input info generated by the 'trace' command, in any format, and
     invokes the STWO prover to generate a proof file.
     """
     try:
@@ -242,6 +272,7 @@ def prove(
             proof_path=proof_path,
             data_dir=data_dir,
             serde_cairo=serde_cairo,
+            output_format=output_format,
         )
     except KethError as e:
         console.print(f"[red]Error: {e}[/]")
@@ -256,7 +287,7 @@ def prove(
 def verify(
     proof_path: Path = typer.Option(
         ...,
-        help="Path to proof.json",
+        help="Path to the proof file, in any format",
         exists=True,
         dir_okay=False,
         file_okay=True,
@@ -266,7 +297,7 @@ def verify(
     Run the STWO proof verifier against the specified proof file.
 
     Args:
-        proof_path: Path to the JSON-serialized proof file.
+        proof_path: Path to the proof file, whose format is detected automatically.
     """
     try:
         run_verify_pipeline(proof_path=proof_path)
@@ -341,6 +372,11 @@ def e2e(
         "--serde-cairo",
         help="Serialize the proof to a cairo-compatible format",
     ),
+    output_format: SerializationFormat = typer.Option(
+        SerializationFormat.JSON,
+        "--format",
+        help="Format of the proof file: 'json', 'binary' or 'binary-zstd' (ignored with --serde-cairo)",
+    ),
 ):
     """
     Run the full end-to-end trace generation, proving and verification flow
@@ -372,6 +408,7 @@ def e2e(
             branch_index=branch_index,
             verify_proof=verify_proof,
             serde_cairo=serde_cairo,
+            output_format=output_format,
         )
 
     except InvalidBlockNumberError as e:
@@ -488,5 +525,87 @@ def generate_ar_inputs(
         raise typer.Exit(1)
 
 
+@app.command()
+def bench(
+    fixtures_dir: Path = typer.Option(
+        KethConfig.BENCH_FIXTURES_DIR,
+        help="Directory of the ZKPI fixtures to benchmark, named <block_number>.json",
+        exists=True,
+        dir_okay=True,
+        file_okay=False,
+    ),
+    steps: Optional[List[Step]] = typer.Option(
+        None,
+        "-s",
+        "--step",
+        help="Step to benchmark, can be repeated (defaults to all steps)",
+    ),
+    body_chunk_size: int = typer.Option(
+        KethConfig.DEFAULT_BODY_CHUNK_SIZE,
+        "--body-chunk-size",
+        help="Number of transactions to process in each body chunk",
+    ),
+    report_path: Path = typer.Option(
+        KethConfig.BENCH_REPORT_FILE,
+        "--report",
+        help="Path to write the benchmark report to",
+        dir_okay=False,
+        file_okay=True,
+    ),
+    baseline_path: Path = typer.Option(
+        KethConfig.BENCH_BASELINE_FILE,
+        "--baseline",
+        help="Path of the baseline report to compare against",
+        dir_okay=False,
+        file_okay=True,
+    ),
+    threshold: float = typer.Option(
+        KethConfig.BENCH_DEFAULT_THRESHOLD,
+        help="Maximum relative increase of a metric over the baseline",
+    ),
+    update_baseline: bool = typer.Option(
+        False,
+        "--update-baseline",
+        help="Store the report as the new baseline instead of comparing against it",
+    ),
+):
+    """
+    Benchmark the execution resources of the Keth programs.
+
+    Runs every ZKPI fixture through the selected steps and records the number of steps, memory
+    holes and builtin instances of each run. Exits with an error if a metric increased by more
+    than the threshold compared to the baseline.
+    """
+    try:
+        regressions = run_bench_pipeline(
+            config=KethConfig(),
+            fixtures_dir=fixtures_dir,
+            steps=steps or list(Step),
+            body_chunk_size=body_chunk_size,
+            report_path=report_path,
+            baseline_path=baseline_path,
+            threshold=threshold,
+            update_baseline=update_baseline,
+        )
+    except KethError as e:
+        console.print(f"[red]Error: {e}[/]")
+        raise typer.Exit(1)
+    except Exception as e:
+        console.print(f"[red]Error running benchmarks: {e}[/]")
+        logger.exception("Unexpected error")
+        raise typer.Exit(1)
+
+    if regressions:
+        for regression in regressions:
+            console.print(
+                f"[red]Regression:[/] block {regression.block}, {regression.step}, "
+                f"{regression.metric}: {regression.baseline} -> {regression.current} "
+                f"(+{regression.increase:.2%})"
+            )
+        raise typer.Exit(1)
+    if not update_baseline and baseline_path.exists():
+        console.print("[green]✓[/] No regression compared to the baseline")
+
+
 if __name__ == "__main__":
     app()
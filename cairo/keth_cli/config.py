@@ -1,9 +1,18 @@
 """Centralized configuration for Keth CLI."""
 
+from enum import Enum
 from pathlib import Path
 from typing import Dict
 
 
+class SerializationFormat(str, Enum):
+    """On-disk format of prover inputs and proofs."""
+
+    JSON = "json"
+    BINARY = "binary"
+    BINARY_ZSTD = "binary-zstd"
+
+
 class KethConfig:
     """Centralized configuration for Keth CLI."""
 
@@ -48,6 +57,13 @@ class KethConfig:
     # MPT diff configuration
     MPT_DIFF_BRANCHES = 16
 
+    # Benchmark configuration
+    BENCH_FIXTURES_DIR = Path("test_data")
+    BENCH_BASELINE_FILE = Path("benchmarks/baseline.json")
+    BENCH_REPORT_FILE = Path("build/bench_report.json")
+    # Maximum relative increase of a metric over the baseline before it is a regression
+    BENCH_DEFAULT_THRESHOLD = 0.01
+
     # Logging configuration
     LOG_LEVEL = "INFO"
     LOG_FORMAT = "%(message)s"
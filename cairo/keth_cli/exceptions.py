@@ -74,3 +74,21 @@ class InvalidBranchIndexError(KethError):
     def __init__(self, branch_index: int):
         self.branch_index = branch_index
         super().__init__(f"Branch index {branch_index} is out of range (must be 0-15)")
+
+
+class BenchFixturesNotFoundError(KethError):
+    """Raised when no ZKPI fixture is found to benchmark."""
+
+    def __init__(self, fixtures_dir: str):
+        self.fixtures_dir = fixtures_dir
+        super().__init__(f"No ZKPI fixtures found in {fixtures_dir}")
+
+
+class BenchBaselineNotFoundError(KethError):
+    """Raised when there is no baseline to compare a benchmark report against."""
+
+    def __init__(self, baseline_path: str):
+        self.baseline_path = baseline_path
+        super().__init__(
+            f"No baseline found at {baseline_path}, run with --update-baseline to create it"
+        )
@@ -1,5 +1,8 @@
 """High-level orchestration functions for Keth CLI commands."""
 
+import json
+import shutil
+import tempfile
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
@@ -12,7 +15,21 @@ from cairo_addons.rust_bindings.vm import generate_trace as run_generate_trace
 from cairo_addons.rust_bindings.vm import run_end_to_end
 from utils.fixture_loader import load_zkpi_fixture
 
-from .core import KethContext
+from .bench import (
+    Regression,
+    Resources,
+    build_block_report,
+    compare_reports,
+    read_report,
+    write_report,
+)
+from .config import KethConfig, SerializationFormat
+from .core import KethContext, get_chain_id_from_zkpi, get_zkpi_path
+from .exceptions import (
+    BenchBaselineNotFoundError,
+    BenchFixturesNotFoundError,
+    CompiledProgramNotFoundError,
+)
 from .steps import Step, StepHandler
 
 console = Console()
@@ -30,7 +47,11 @@ def _execute_trace_job(
     cairo_pie: bool,
     status_message: str,
     show_full_path: bool = True,
-) -> None:
+    columnar_trace: bool = False,
+    profile: bool = False,
+    output_format: SerializationFormat = SerializationFormat.JSON,
+    hint_coverage: bool = False,
+) -> Resources:
     """Execute a single trace generation job.
 
     This helper function encapsulates the common logic for running trace generation,
@@ -48,6 +69,14 @@ def _execute_trace_job(
         cairo_pie: Whether to generate Cairo PIE output
         status_message: Message to display while generating the trace
         show_full_path: Whether to show the full path in success message
+        columnar_trace: Whether to also write the relocated trace as a Parquet file
+        profile: Whether to also write the steps per call stack as a folded stacks file
+        output_format: Format of the prover input file
+        hint_coverage: Whether to also write the executions of hints without a native
+            implementation as a JSON file
+
+    Returns:
+        The execution resources of the run
     """
     # Load program input
     program_input = StepHandler.load_program_input(
@@ -56,19 +85,25 @@ def _execute_trace_job(
 
     # Generate trace
     with console.status(status_message):
-        run_generate_trace(
+        resources = run_generate_trace(
             entrypoint="main",
             program_input=program_input,
             compiled_program_path=str(compiled_program),
             output_path=output_path,
             output_trace_components=output_trace_components,
             cairo_pie=cairo_pie,
+            columnar_trace=columnar_trace,
+            profile=profile,
+            prover_input_format=output_format.value,
+            hint_coverage=hint_coverage,
         )
 
     # Show success message only if requested
     if show_full_path:
         console.print(f"[green]✓[/] Trace generated successfully in {output_path}")
 
+    return resources
+
 
 @dataclass
 class TraceJob:
@@ -94,6 +129,10 @@ def run_trace_pipeline(
     branch_index: Optional[int],
     output_trace_components: bool,
     cairo_pie: bool,
+    columnar_trace: bool = False,
+    profile: bool = False,
+    output_format: SerializationFormat = SerializationFormat.JSON,
+    hint_coverage: bool = False,
 ) -> None:
     """Run the trace generation pipeline."""
     # Validate step parameters
@@ -131,7 +170,32 @@ def run_trace_pipeline(
         output_trace_components=output_trace_components,
         cairo_pie=cairo_pie,
         status_message=status_message,
+        columnar_trace=columnar_trace,
+        profile=profile,
+        output_format=output_format,
+        hint_coverage=hint_coverage,
+    )
+
+    if hint_coverage:
+        _print_hint_coverage(output_path.with_suffix(".hint_coverage.json"))
+
+
+def _print_hint_coverage(report_path: Path) -> None:
+    """Print the hints executed without a native implementation, as written by the trace run."""
+    with open(report_path, "r") as f:
+        hint_counts: Dict[str, int] = json.load(f)
+
+    if not hint_counts:
+        console.print("[green]✓[/] All executed hints have a native implementation")
+        return
+
+    console.print(
+        f"[yellow]{len(hint_counts)} hints without a native implementation were executed "
+        f"as Python (report in {report_path}):[/]"
     )
+    for hint, count in sorted(hint_counts.items(), key=lambda item: -item[1]):
+        # Inline hints span several lines, their first line is enough to locate them
+        console.print(f"  {count:>10}  {hint.strip().splitlines()[0]}")
 
 
 def run_prove_pipeline(
@@ -139,6 +203,7 @@ def run_prove_pipeline(
     proof_path: Optional[Path],
     data_dir: Path,
     serde_cairo: bool,
+    output_format: SerializationFormat = SerializationFormat.JSON,
 ) -> None:
     """Run the proof generation pipeline."""
     # If proof_path is not provided, determine it from the input prover_inputs_path
@@ -162,6 +227,7 @@ def run_prove_pipeline(
             prover_input_path=prover_inputs_path,
             proof_path=proof_path,
             serde_cairo=serde_cairo,
+            proof_format=output_format.value,
         )
         console.print(f"[green]✓[/] Proof generated successfully at {proof_path}")
 
@@ -182,6 +248,7 @@ def run_e2e_pipeline(
     branch_index: Optional[int],
     verify_proof: bool,
     serde_cairo: bool,
+    output_format: SerializationFormat = SerializationFormat.JSON,
 ) -> None:
     """Run the end-to-end pipeline."""
     # Validate step parameters
@@ -212,6 +279,7 @@ def run_e2e_pipeline(
             proof_path,
             serde_cairo,
             verify_proof,
+            output_format.value,
         )
         console.print("[green]✓[/] Pipeline completed successfully")
         console.print(f"[green]✓[/] Proof written to {proof_path}")
@@ -234,7 +302,26 @@ def run_ar_inputs_pipeline(
     console.print(f"[blue]Total transactions: {total_transactions}[/]")
     console.print(f"[blue]Body chunk size: {body_chunk_size}[/]")
 
-    # Build list of steps to generate
+    steps_to_generate = _build_ar_steps(
+        total_transactions, body_chunk_size, ctx.config.MPT_DIFF_BRANCHES
+    )
+
+    total_steps = len(steps_to_generate)
+    console.print(f"[blue]Total steps to generate: {total_steps}[/]")
+
+    # Use sequential generation to avoid pickling issues
+    _generate_traces_sequentially(
+        ctx,
+        steps_to_generate,
+        output_trace_components,
+        cairo_pie,
+    )
+
+
+def _build_ar_steps(
+    total_transactions: int, body_chunk_size: int, mpt_diff_branches: int
+) -> List[Tuple[str, Step, Optional[int], Optional[int], Optional[int]]]:
+    """Build the list of steps proving a block, in execution order."""
     steps_to_generate: List[
         Tuple[str, Step, Optional[int], Optional[int], Optional[int]]
     ] = []
@@ -251,22 +338,13 @@ def run_ar_inputs_pipeline(
     steps_to_generate.append(("teardown", Step.TEARDOWN, None, None, None))
 
     # Step 4: Generate mpt_diff traces (16 branches)
-    for branch_index in range(ctx.config.MPT_DIFF_BRANCHES):
+    for branch_index in range(mpt_diff_branches):
         steps_to_generate.append(("mpt_diff", Step.MPT_DIFF, None, None, branch_index))
 
     # Step 5: Generate aggregator trace
     steps_to_generate.append(("aggregator", Step.AGGREGATOR, None, None, None))
 
-    total_steps = len(steps_to_generate)
-    console.print(f"[blue]Total steps to generate: {total_steps}[/]")
-
-    # Use sequential generation to avoid pickling issues
-    _generate_traces_sequentially(
-        ctx,
-        steps_to_generate,
-        output_trace_components,
-        cairo_pie,
-    )
+    return steps_to_generate
 
 
 def _generate_traces_sequentially(
@@ -334,3 +412,122 @@ def _generate_traces_sequentially(
     console.print(
         f"[green]✓[/] All AR inputs generated successfully in {ctx.proving_run_dir}"
     )
+
+
+def run_bench_pipeline(
+    config: KethConfig,
+    fixtures_dir: Path,
+    steps: List[Step],
+    body_chunk_size: int,
+    report_path: Path,
+    baseline_path: Path,
+    threshold: float,
+    update_baseline: bool,
+) -> List[Regression]:
+    """
+    Run the benchmark pipeline.
+
+    Every ZKPI fixture of `fixtures_dir` (named `<block_number>.json`, other JSON files are
+    skipped) is run through the given steps, and the execution resources of each step are written
+    to `report_path`. The report is then either stored as the new baseline, or compared against
+    the existing one, which must exist.
+
+    Returns:
+        The metrics that regressed compared to the baseline
+    """
+    fixtures = []
+    for fixture in sorted(fixtures_dir.glob("*.json")):
+        if not fixture.stem.isdigit():
+            console.print(
+                f"[yellow]Skipping {fixture}: not named after a block number[/]"
+            )
+            continue
+        fixtures.append(fixture)
+    if not fixtures:
+        raise BenchFixturesNotFoundError(str(fixtures_dir))
+    if not update_baseline and not baseline_path.exists():
+        raise BenchBaselineNotFoundError(str(baseline_path))
+
+    report: Dict[str, Any] = {"blocks": {}}
+    for fixture in fixtures:
+        block_number = int(fixture.stem)
+        console.print(f"[blue]Benchmarking block {block_number}[/]")
+
+        # Lay out the fixture as a data directory, so that the steps find their inputs and the
+        # outputs of the previous steps where they expect them.
+        with tempfile.TemporaryDirectory() as temp_dir:
+            data_dir = Path(temp_dir)
+            chain_id = get_chain_id_from_zkpi(fixture)
+            zkpi_path = get_zkpi_path(data_dir, chain_id, block_number)
+            zkpi_path.parent.mkdir(parents=True)
+            shutil.copy2(fixture, zkpi_path)
+
+            ctx = KethContext.create(
+                config=config,
+                data_dir=data_dir,
+                block_number=block_number,
+                chain_id=chain_id,
+            )
+            step_resources = _bench_block(ctx, steps, body_chunk_size)
+
+        report["blocks"][str(block_number)] = build_block_report(step_resources)
+
+    write_report(report, report_path)
+    console.print(f"[green]✓[/] Benchmark report written to {report_path}")
+
+    if update_baseline:
+        write_report(report, baseline_path)
+        console.print(f"[green]✓[/] Baseline updated at {baseline_path}")
+        return []
+
+    return compare_reports(report, read_report(baseline_path), threshold)
+
+
+def _bench_block(
+    ctx: KethContext, steps: List[Step], body_chunk_size: int
+) -> Dict[str, Resources]:
+    """Run the given steps on a block and return the execution resources of each run."""
+    steps_to_generate = []
+    if Step.MAIN in steps:
+        steps_to_generate.append(("main", Step.MAIN, None, None, None))
+    total_transactions = len(load_zkpi_fixture(ctx.zkpi_path)["block"].transactions)
+    steps_to_generate += [
+        job
+        for job in _build_ar_steps(
+            total_transactions, body_chunk_size, ctx.config.MPT_DIFF_BRANCHES
+        )
+        if job[1] in steps
+    ]
+
+    step_resources: Dict[str, Resources] = {}
+    for step_name, step, start_index, chunk_size, branch_index in steps_to_generate:
+        compiled_program = StepHandler.get_default_program(step, ctx.config)
+        if not compiled_program.exists():
+            raise CompiledProgramNotFoundError(str(compiled_program))
+
+        if step == Step.BODY:
+            step_name = f"body_{start_index}_{chunk_size}"
+        elif step == Step.MPT_DIFF:
+            step_name = f"mpt_diff_{branch_index}"
+
+        output_filename = StepHandler.get_output_filename(
+            step, ctx.block_number, ctx.config, start_index, chunk_size, branch_index
+        )
+        step_resources[step_name] = _execute_trace_job(
+            ctx=ctx,
+            step=step,
+            compiled_program=compiled_program,
+            output_path=ctx.proving_run_dir / output_filename,
+            start_index=start_index,
+            chunk_size=chunk_size,
+            branch_index=branch_index,
+            output_trace_components=False,
+            cairo_pie=False,
+            status_message=f"[bold green]Benchmarking {step_name} step...",
+            show_full_path=False,
+        )
+        console.print(
+            f"[green]✓[/] {step_name}: {step_resources[step_name].get('n_steps', 0)} steps"
+        )
+
+    return step_resources
@@ -128,6 +128,26 @@ func hashdict_read{range_check_ptr, dict_ptr: DictAccess*}(
     }
 
     local value;
+    // The hint registers the preimage of `felt_key`, without hashing the key again.
+    %{ hashdict_read %}
+    dict_ptr.key = felt_key;
+    dict_ptr.prev_value = value;
+    dict_ptr.new_value = value;
+    let dict_ptr = dict_ptr + DictAccess.SIZE;
+    return (value=value);
+}
+
+// Same as `hashdict_read`, for a compound key already hashed by the caller.
+// @dev `felt_key` must be `blake2s_hash_many(key_len, key)`: it is the key the dict is squashed on.
+// @param key_len: The number of felt values used to represent the key.
+// @param key: The key to access the dictionary.
+// @param felt_key: The hash of the key.
+func hashdict_read_hashed{dict_ptr: DictAccess*}(key_len: felt, key: felt*, felt_key: felt) -> (
+    value: felt
+) {
+    alloc_locals;
+    local value;
+    // The hint registers the preimage of `felt_key`, without hashing the key again.
     %{ hashdict_read %}
     dict_ptr.key = felt_key;
     dict_ptr.prev_value = value;
@@ -154,6 +174,7 @@ func hashdict_write{range_check_ptr, dict_ptr: DictAccess*}(
         assert felt_key = felt_key_;
         tempvar range_check_ptr = range_check_ptr;
     }
+    // The hint registers the preimage of `felt_key`, without hashing the key again.
     %{ hashdict_write %}
     dict_ptr.key = felt_key;
     dict_ptr.new_value = new_value;
@@ -165,6 +186,8 @@ func hashdict_write{range_check_ptr, dict_ptr: DictAccess*}(
 // updates the original dict segment with the new values from the given dict segment.
 // @dev If the drop flag is set to false, the new values are added to the existing values.
 // @dev If the drop flag is set to true, the new values are discarded, and only the prev_values are appended to the original dict segment.
+// @dev The dict segment must be a fork of the parent made with `copy_tracker_to_new_ptr`: its
+// tracker is moved into the parent's.
 // @param drop: If false, the new values are added to the existing values.
 // @return new_dict_start: The start of the updated dict segment.
 // @return new_dict_end: The end of the updated dict segment.
@@ -184,7 +207,7 @@ func dict_update{range_check_ptr}(
             squashed_dict_start, squashed_dict_end
         );
     } else {
-        %{ merge_dict_tracker_with_parent %}
+        %{ move_dict_tracker_to_parent %}
         tempvar range_check_ptr = range_check_ptr;
         tempvar dict_ptr_start = dict_ptr_start;
         tempvar dict_ptr = dict_ptr;
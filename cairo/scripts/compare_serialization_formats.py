@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+Compare the size and (de)serialization time of the prover input formats.
+
+Writes a prover input file (in any format) as JSON, binary and zstd-compressed binary,
+reads each of them back, and prints the file size and timings of every format.
+
+Usage:
+    python cairo/scripts/compare_serialization_formats.py --prover-input-path <path>
+"""
+
+import tempfile
+from pathlib import Path
+from typing import Optional
+
+import typer
+from rich.console import Console
+from rich.table import Table
+
+from cairo_addons.rust_bindings.stwo_bindings import compare_serialization_formats
+
+console = Console()
+
+app = typer.Typer(no_args_is_help=True)
+
+
+@app.command()
+def compare(
+    prover_input_path: Path = typer.Option(
+        ...,
+        help="Path to a prover input file",
+        exists=True,
+        dir_okay=False,
+        file_okay=True,
+    ),
+    output_dir: Optional[Path] = typer.Option(
+        None,
+        help="Directory to write the serialized files to (defaults to a temporary directory)",
+        dir_okay=True,
+        file_okay=False,
+    ),
+):
+    """Compare the serialization formats on a prover input file."""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        with console.status("[bold green]Serializing prover input..."):
+            results = compare_serialization_formats(
+                prover_input_path, output_dir or Path(tmp_dir)
+            )
+
+    table = Table(title=f"Serialization formats for {prover_input_path.name}")
+    table.add_column("Format")
+    table.add_column("Size (MB)", justify="right")
+    table.add_column("Write (s)", justify="right")
+    table.add_column("Read (s)", justify="right")
+    for name, size, write_time, read_time in results:
+        table.add_row(
+            name, f"{size / 1024**2:.2f}", f"{write_time:.3f}", f"{read_time:.3f}"
+        )
+    console.print(table)
+
+
+if __name__ == "__main__":
+    app()
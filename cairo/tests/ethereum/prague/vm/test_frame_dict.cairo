@@ -0,0 +1,123 @@
+%builtins range_check
+
+from starkware.cairo.common.default_dict import default_dict_new
+from starkware.cairo.common.dict_access import DictAccess
+from ethereum_types.bytes import Bytes
+from ethereum_types.numeric import U256, U256Struct
+from ethereum.prague.vm.frame_dict import (
+    FrameDict,
+    FrameDictImpl,
+    FRAME_DICT_KIND_STACK,
+    FRAME_DICT_KIND_MEMORY,
+)
+from ethereum.prague.vm.runtime import get_valid_jump_destinations, finalize_jumpdests
+from legacy.utils.dict import dict_read, dict_write, dict_squash, default_dict_finalize
+
+func test__frame_dict{range_check_ptr}(
+    bytecode: Bytes, pcs_len: felt, pcs: felt*, is_valid: felt*, words_len: felt, words: felt*
+) {
+    alloc_locals;
+    let frame_dict = FrameDictImpl.init(bytecode);
+    with frame_dict {
+        _check_jumpdests(pcs_len, pcs, is_valid);
+        _write_words(words_len, words);
+        _check_words(words_len, words);
+    }
+    FrameDictImpl.finalize(frame_dict, bytecode);
+    return ();
+}
+
+func _check_jumpdests{frame_dict: FrameDict}(pcs_len: felt, pcs: felt*, is_valid: felt*) {
+    if (pcs_len == 0) {
+        return ();
+    }
+    let value = FrameDictImpl.is_valid_jumpdest(pcs[0]);
+    assert value = is_valid[0];
+    return _check_jumpdests(pcs_len - 1, pcs + 1, is_valid + 1);
+}
+
+func _write_words{frame_dict: FrameDict}(words_len: felt, words: felt*) {
+    if (words_len == 0) {
+        return ();
+    }
+    FrameDictImpl.memory_write(words_len - 1, words[0]);
+    FrameDictImpl.stack_write(words_len - 1, U256(new U256Struct(words[0], 0)));
+    return _write_words(words_len - 1, words + 1);
+}
+
+func _check_words{frame_dict: FrameDict}(words_len: felt, words: felt*) {
+    if (words_len == 0) {
+        return ();
+    }
+    let word = FrameDictImpl.memory_read(words_len - 1);
+    assert word = words[0];
+    let stack_item = FrameDictImpl.stack_read(words_len - 1);
+    assert stack_item.value.low = words[0];
+    return _check_words(words_len - 1, words + 1);
+}
+
+// Benchmarks of `n_frames` short call frames, each reading one jump destination and writing then
+// reading `n_words` stack and memory words. Run with `--profile-cairo` to compare their steps.
+
+func bench__separate_dicts{range_check_ptr}(bytecode: Bytes, n_frames: felt, n_words: felt) {
+    alloc_locals;
+    if (n_frames == 0) {
+        return ();
+    }
+
+    let (stack_start) = default_dict_new(0);
+    let (memory_start) = default_dict_new(0);
+    let valid_jumpdests = get_valid_jump_destinations(bytecode);
+    let stack = stack_start;
+    let memory = memory_start;
+    let jumpdests = cast(valid_jumpdests.value.dict_ptr, DictAccess*);
+    dict_read{dict_ptr=jumpdests}(0);
+    _bench_words{stack=stack, memory=memory}(n_words);
+
+    default_dict_finalize(stack_start, stack, 0);
+    default_dict_finalize(memory_start, memory, 0);
+    let (jumpdests_start, jumpdests_end) = dict_squash(
+        cast(valid_jumpdests.value.dict_ptr_start, DictAccess*), jumpdests
+    );
+    finalize_jumpdests(0, jumpdests_start, jumpdests_end, bytecode);
+
+    return bench__separate_dicts(bytecode, n_frames - 1, n_words);
+}
+
+func _bench_words{stack: DictAccess*, memory: DictAccess*}(n_words: felt) {
+    if (n_words == 0) {
+        return ();
+    }
+    dict_write{dict_ptr=stack}(n_words, n_words);
+    dict_write{dict_ptr=memory}(n_words, n_words);
+    dict_read{dict_ptr=stack}(n_words);
+    dict_read{dict_ptr=memory}(n_words);
+    return _bench_words(n_words - 1);
+}
+
+func bench__frame_dict{range_check_ptr}(bytecode: Bytes, n_frames: felt, n_words: felt) {
+    alloc_locals;
+    if (n_frames == 0) {
+        return ();
+    }
+
+    let frame_dict = FrameDictImpl.init(bytecode);
+    with frame_dict {
+        FrameDictImpl.is_valid_jumpdest(0);
+        _bench_frame_dict_words(n_words);
+    }
+    FrameDictImpl.finalize(frame_dict, bytecode);
+
+    return bench__frame_dict(bytecode, n_frames - 1, n_words);
+}
+
+func _bench_frame_dict_words{frame_dict: FrameDict}(n_words: felt) {
+    if (n_words == 0) {
+        return ();
+    }
+    FrameDictImpl.write(FRAME_DICT_KIND_STACK, n_words, n_words);
+    FrameDictImpl.write(FRAME_DICT_KIND_MEMORY, n_words, n_words);
+    FrameDictImpl.read(FRAME_DICT_KIND_STACK, n_words);
+    FrameDictImpl.read(FRAME_DICT_KIND_MEMORY, n_words);
+    return _bench_frame_dict_words(n_words - 1);
+}
@@ -0,0 +1,45 @@
+import pytest
+from ethereum.prague.vm.runtime import get_valid_jump_destinations
+from ethereum_types.bytes import Bytes
+from ethereum_types.numeric import Uint
+
+from tests.utils.solidity import get_contract
+
+COUNTER = get_contract("Counter", "Counter").bytecode_runtime
+WORDS = [0, 1, 42, 2**128 - 1]
+
+
+class TestFrameDict:
+    @pytest.mark.parametrize(
+        "bytecode",
+        [Bytes(), Bytes([0x5B]), Bytes([0x60, 0x5B, 0x5B]), COUNTER],
+    )
+    @pytest.mark.parametrize("words", [[], WORDS])
+    def test_frame_dict(self, cairo_run, bytecode: Bytes, words):
+        valid_jumpdests = get_valid_jump_destinations(bytecode)
+        pcs = list(range(len(bytecode)))
+        cairo_run(
+            "test__frame_dict",
+            bytecode=bytecode,
+            pcs_len=len(pcs),
+            pcs=pcs,
+            is_valid=[int(Uint(pc) in valid_jumpdests) for pc in pcs],
+            words_len=len(words),
+            words=words,
+        )
+
+
+class TestFrameDictBenchmarks:
+    @pytest.mark.parametrize(
+        "n_frames,n_words",
+        [
+            (1, 0),
+            (10, 10),
+            pytest.param(5_000, 4, marks=pytest.mark.slow),
+        ],
+    )
+    @pytest.mark.parametrize(
+        "entrypoint", ["bench__separate_dicts", "bench__frame_dict"]
+    )
+    def test_bench(self, cairo_run, entrypoint, n_frames, n_words):
+        cairo_run(entrypoint, bytecode=COUNTER, n_frames=n_frames, n_words=n_words)
@@ -36,6 +36,19 @@ def memory_read_strategy(draw):
     return memory, start_position, size
 
 
+@composite
+def memory_word_strategy(draw):
+    memory_size = draw(st.integers(min_value=32, max_value=2**10))
+    memory = draw(st.binary(min_size=memory_size, max_size=memory_size).map(bytearray))
+
+    # Generate a start position with a 32-byte word in bounds, aligned or not
+    start_position = draw(
+        st.integers(min_value=0, max_value=memory_size - 32).map(U256)
+    )
+
+    return memory, start_position
+
+
 class TestMemory:
     @given(memory_write_strategy())
     def test_memory_write(self, cairo_run, params):
@@ -54,6 +67,27 @@ class TestMemory:
         assert cairo_memory == memory
         assert cairo_value == python_value
 
+    @given(memory_word_strategy(), st.integers(min_value=0, max_value=2**256 - 1))
+    def test_memory_write_u256(self, cairo_run, params, value: int):
+        memory, start_position = params
+        cairo_memory = cairo_run(
+            "memory_write_u256", memory, start_position, U256(value)
+        )
+        memory_write(memory, start_position, U256(value).to_be_bytes32())
+        assert cairo_memory == memory
+
+    @given(memory_word_strategy())
+    def test_memory_read_u256(self, cairo_run, params):
+        memory, start_position = params
+        (cairo_memory, cairo_value) = cairo_run(
+            "memory_read_u256", memory, start_position
+        )
+        python_value = U256.from_be_bytes(
+            memory_read_bytes(memory, start_position, U256(32))
+        )
+        assert cairo_memory == memory
+        assert cairo_value == python_value
+
     @given(
         buffer=st.binary(min_size=0, max_size=2**10).map(Bytes),
         start_position=...,
@@ -1,12 +1,19 @@
 from starkware.cairo.common.dict_access import DictAccess
 from starkware.cairo.common.alloc import alloc
-from ethereum_types.numeric import Uint
+from ethereum_types.numeric import Uint, U256, U256Struct
+from ethereum.prague.fork_types import TupleAddressBytes32
 from ethereum.prague.state import (
     MappingTupleAddressBytes32U256,
     MappingTupleAddressBytes32U256Struct,
     TupleAddressBytes32U256DictAccess,
 )
-from legacy.utils.dict import prev_values, dict_update, squash_and_update, dict_squash
+from legacy.utils.dict import (
+    prev_values,
+    dict_update,
+    squash_and_update,
+    dict_squash,
+    hashdict_read,
+)
 
 func test_prev_values{range_check_ptr}() -> (prev_values_start_ptr: felt*) {
     alloc_locals;
@@ -92,3 +99,30 @@ func test_squash_and_update{range_check_ptr}(
     );
     return new_dst_dict;
 }
+
+func test_squash_and_update_read_dst_key{range_check_ptr}(
+    src_dict: MappingTupleAddressBytes32U256,
+    dst_dict: MappingTupleAddressBytes32U256,
+    key: TupleAddressBytes32,
+) -> U256 {
+    alloc_locals;
+
+    let src_start = src_dict.value.dict_ptr_start;
+    let src_end = src_dict.value.dict_ptr;
+    let dst = dst_dict.value.dict_ptr;
+    let new_dst_end = squash_and_update(
+        cast(src_start, DictAccess*), cast(src_end, DictAccess*), cast(dst, DictAccess*)
+    );
+
+    // Read a key of the dst dict after the update, and squash to check the value read
+    let (local key_buffer) = alloc();
+    assert key_buffer[0] = key.value.address.value;
+    assert key_buffer[1] = key.value.bytes32.value.low;
+    assert key_buffer[2] = key.value.bytes32.value.high;
+    let dict_ptr = new_dst_end;
+    let (value) = hashdict_read{dict_ptr=dict_ptr}(3, key_buffer);
+    dict_squash(cast(dst_dict.value.dict_ptr_start, DictAccess*), dict_ptr);
+
+    tempvar res = U256(cast(value, U256Struct*));
+    return res;
+}
@@ -118,3 +118,33 @@ def test_squash_and_update(
     )
     dst_dict.update(src_dict)
     assert new_dst_dict == dst_dict
+
+
+@given(
+    src_dict=st.dictionaries(
+        keys=st.tuples(st.from_type(Address), st.from_type(Bytes32)),
+        values=st.from_type(U256),
+        max_size=10,
+    ),
+    dst_dict=st.dictionaries(
+        keys=st.tuples(st.from_type(Address), st.from_type(Bytes32)),
+        values=st.from_type(U256),
+        min_size=1,
+        max_size=10,
+    ),
+)
+def test_squash_and_update_keeps_dst_entries(
+    cairo_run,
+    src_dict: Mapping[Tuple[Address, Bytes32], U256],
+    dst_dict: Mapping[Tuple[Address, Bytes32], U256],
+):
+    # A key only written in the dst dict must still be readable after the update.
+    key = next(iter(dst_dict))
+    src_dict.pop(key, None)
+    value = cairo_run(
+        "test_squash_and_update_read_dst_key",
+        defaultdict(lambda: U256(0), src_dict),
+        defaultdict(lambda: U256(0), dst_dict),
+        key,
+    )
+    assert value == dst_dict[key]
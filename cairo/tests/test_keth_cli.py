@@ -15,6 +15,7 @@ from typing import Any, Dict
 from unittest.mock import patch
 
 import pytest
+from keth_cli.bench import build_block_report, compare_reports, sum_resources
 from keth_cli.cli import app
 from keth_cli.config import KethConfig
 from keth_cli.core import (
@@ -447,6 +448,55 @@ class TestStepHandler:
             assert filename == expected
 
 
+@pytest.mark.unit
+class TestBench:
+    """Test the benchmark report helpers."""
+
+    def test_sum_resources(self):
+        """Test that resources are summed metric by metric."""
+        total = sum_resources(
+            [{"n_steps": 10, "range_check": 2}, {"n_steps": 5, "bitwise": 1}]
+        )
+        assert total == {"n_steps": 15, "range_check": 2, "bitwise": 1}
+
+    def test_build_block_report_excludes_main_from_total(self):
+        """Test that the main program is not added to the total of the segmented steps."""
+        report = build_block_report(
+            {
+                "main": {"n_steps": 100},
+                "init": {"n_steps": 10},
+                "teardown": {"n_steps": 20},
+            }
+        )
+        assert report["total"] == {"n_steps": 30}
+
+    def test_compare_reports(self):
+        """Test that only metrics increasing above the threshold are regressions."""
+        baseline = {
+            "blocks": {
+                "1": build_block_report(
+                    {"init": {"n_steps": 100, "range_check": 10, "bitwise": 5}}
+                )
+            }
+        }
+        report = {
+            "blocks": {
+                "1": build_block_report(
+                    {"init": {"n_steps": 101, "range_check": 20, "bitwise": 1}}
+                ),
+                "2": build_block_report({"init": {"n_steps": 1000}}),
+            }
+        }
+
+        regressions = compare_reports(report, baseline, threshold=0.05)
+
+        assert [(r.block, r.step, r.metric) for r in regressions] == [
+            ("1", "init", "range_check"),
+            ("1", "total", "range_check"),
+        ]
+        assert regressions[0].increase == 1.0
+
+
 # ============================================================================
 # CLI INTEGRATION TESTS
 # ============================================================================
@@ -616,6 +666,85 @@ class TestTraceCommand(TestKethCLIBase):
         call_args = mock_trace.call_args
         assert call_args[1]["cairo_pie"] is True
 
+    def test_trace_command_with_columnar_trace(self, temp_data_dir, mock_all_programs):
+        """Test trace command with columnar trace output."""
+        programs, patch_get_default_program = mock_all_programs
+        with (
+            patch("keth_cli.orchestration.run_generate_trace") as mock_trace,
+            patch_get_default_program(),
+        ):
+            result = self.runner.invoke(
+                app,
+                [
+                    "trace",
+                    "-b",
+                    str(TEST_BLOCK_NUMBER),
+                    "--data-dir",
+                    str(temp_data_dir),
+                    "--columnar-trace",
+                ],
+            )
+
+        self.helper.assert_success_with_message(result, "Trace generated successfully")
+        mock_trace.assert_called_once()
+        assert mock_trace.call_args[1]["columnar_trace"] is True
+
+    def test_trace_command_with_profile(self, temp_data_dir, mock_all_programs):
+        """Test trace command with call-stack profile output."""
+        programs, patch_get_default_program = mock_all_programs
+        with (
+            patch("keth_cli.orchestration.run_generate_trace") as mock_trace,
+            patch_get_default_program(),
+        ):
+            result = self.runner.invoke(
+                app,
+                [
+                    "trace",
+                    "-b",
+                    str(TEST_BLOCK_NUMBER),
+                    "--data-dir",
+                    str(temp_data_dir),
+                    "--profile",
+                ],
+            )
+
+        self.helper.assert_success_with_message(result, "Trace generated successfully")
+        mock_trace.assert_called_once()
+        assert mock_trace.call_args[1]["profile"] is True
+
+    def test_trace_command_with_hint_coverage(self, temp_data_dir, mock_all_programs):
+        """Test trace command reporting the hints without a native implementation."""
+        programs, patch_get_default_program = mock_all_programs
+
+        def write_hint_coverage(**kwargs):
+            report_path = kwargs["output_path"].with_suffix(".hint_coverage.json")
+            report_path.write_text(json.dumps({"python_only_hint": 42}))
+            return {}
+
+        with (
+            patch(
+                "keth_cli.orchestration.run_generate_trace",
+                side_effect=write_hint_coverage,
+            ) as mock_trace,
+            patch_get_default_program(),
+        ):
+            result = self.runner.invoke(
+                app,
+                [
+                    "trace",
+                    "-b",
+                    str(TEST_BLOCK_NUMBER),
+                    "--data-dir",
+                    str(temp_data_dir),
+                    "--hint-coverage",
+                ],
+            )
+
+        self.helper.assert_success_with_message(result, "python_only_hint")
+        mock_trace.assert_called_once()
+        assert mock_trace.call_args[1]["hint_coverage"] is True
+        assert "42" in result.stdout
+
     def test_trace_command_mpt_diff_step_validation(self, temp_data_dir):
         """Test that mpt_diff step requires branch-index parameter."""
         result = self.runner.invoke(
@@ -690,6 +819,31 @@ class TestProveCommand(TestKethCLIBase):
         self.helper.assert_success_with_message(result, "Proof generated successfully")
         mock_prove.assert_called_once()
 
+    def test_prove_command_with_binary_format(self, temp_data_dir):
+        """Test the prove command with a compressed binary proof format."""
+        prover_inputs_path = (
+            temp_data_dir / f"prover_input_info_{TEST_BLOCK_NUMBER}.json"
+        )
+        self.helper.create_mock_file(prover_inputs_path, {"test": "data"})
+
+        with patch("keth_cli.orchestration.run_prove") as mock_prove:
+            result = self.runner.invoke(
+                app,
+                [
+                    "prove",
+                    "--prover-inputs-path",
+                    str(prover_inputs_path),
+                    "--data-dir",
+                    str(temp_data_dir),
+                    "--format",
+                    "binary-zstd",
+                ],
+            )
+
+        self.helper.assert_success_with_message(result, "Proof generated successfully")
+        mock_prove.assert_called_once()
+        assert mock_prove.call_args[1]["proof_format"] == "binary-zstd"
+
 
 @pytest.mark.integration
 class TestVerifyCommand(TestKethCLIBase):
@@ -1158,3 +1312,133 @@ class TestGenerateArPiesCommand(TestKethCLIBase):
             assert filename.startswith("cairo_pie_") and filename.endswith(
                 ".zip"
             ), f"Expected Cairo PIE filename pattern, got: {filename}"
+
+
+@pytest.mark.integration
+class TestBenchCommand(TestKethCLIBase):
+    """Test suite for the bench command."""
+
+    def test_bench_command_update_and_compare_baseline(
+        self, tmp_path, mock_generate_ar_setup
+    ):
+        """Test writing a baseline, then detecting a regression against it."""
+        programs, patch_all_for_generate_ar = mock_generate_ar_setup
+        fixtures_dir = tmp_path / "fixtures"
+        fixtures_dir.mkdir()
+        shutil.copy2(TEST_ZKPI_FILE, fixtures_dir / f"{TEST_BLOCK_NUMBER}.json")
+        report_path = tmp_path / "report.json"
+        baseline_path = tmp_path / "baseline.json"
+        args = [
+            "bench",
+            "--fixtures-dir",
+            str(fixtures_dir),
+            "-s",
+            "init",
+            "-s",
+            "teardown",
+            "--report",
+            str(report_path),
+            "--baseline",
+            str(baseline_path),
+        ]
+
+        with (
+            patch(
+                "keth_cli.orchestration.run_generate_trace",
+                return_value={"n_steps": 100, "n_memory_holes": 0},
+            ) as mock_trace,
+            patch_all_for_generate_ar(),
+        ):
+            result = self.runner.invoke(app, args + ["--update-baseline"])
+
+        self.helper.assert_success_with_message(result, "Baseline updated")
+        assert mock_trace.call_count == 2
+        baseline = json.loads(baseline_path.read_text())
+        assert baseline["blocks"][str(TEST_BLOCK_NUMBER)]["total"] == {
+            "n_steps": 200,
+            "n_memory_holes": 0,
+        }
+
+        with (
+            patch(
+                "keth_cli.orchestration.run_generate_trace",
+                return_value={"n_steps": 110, "n_memory_holes": 0},
+            ),
+            patch_all_for_generate_ar(),
+        ):
+            result = self.runner.invoke(app, args)
+
+        self.helper.assert_error_with_message(result, "Regression")
+        assert report_path.exists()
+
+    def test_bench_command_without_baseline(self, tmp_path, mock_generate_ar_setup):
+        """Test that comparing against a missing baseline fails before running anything."""
+        programs, patch_all_for_generate_ar = mock_generate_ar_setup
+        fixtures_dir = tmp_path / "fixtures"
+        fixtures_dir.mkdir()
+        shutil.copy2(TEST_ZKPI_FILE, fixtures_dir / f"{TEST_BLOCK_NUMBER}.json")
+        args = [
+            "bench",
+            "--fixtures-dir",
+            str(fixtures_dir),
+            "-s",
+            "init",
+            "--report",
+            str(tmp_path / "report.json"),
+            "--baseline",
+            str(tmp_path / "baseline.json"),
+        ]
+
+        with (
+            patch("keth_cli.orchestration.run_generate_trace") as mock_trace,
+            patch_all_for_generate_ar(),
+        ):
+            result = self.runner.invoke(app, args)
+
+        self.helper.assert_error_with_message(result, "No baseline found")
+        mock_trace.assert_not_called()
+
+    def test_bench_command_skips_non_block_fixtures(
+        self, tmp_path, mock_generate_ar_setup
+    ):
+        """Test that JSON files not named after a block number are not benchmarked."""
+        programs, patch_all_for_generate_ar = mock_generate_ar_setup
+        fixtures_dir = tmp_path / "fixtures"
+        fixtures_dir.mkdir()
+        (fixtures_dir / "notes.json").write_text("{}")
+        args = [
+            "bench",
+            "--fixtures-dir",
+            str(fixtures_dir),
+            "-s",
+            "init",
+            "--report",
+            str(tmp_path / "report.json"),
+            "--baseline",
+            str(tmp_path / "baseline.json"),
+            "--update-baseline",
+        ]
+
+        with (
+            patch("keth_cli.orchestration.run_generate_trace") as mock_trace,
+            patch_all_for_generate_ar(),
+        ):
+            result = self.runner.invoke(app, args)
+
+        self.helper.assert_error_with_message(result, "No ZKPI fixtures found")
+        mock_trace.assert_not_called()
+
+        shutil.copy2(TEST_ZKPI_FILE, fixtures_dir / f"{TEST_BLOCK_NUMBER}.json")
+        with (
+            patch(
+                "keth_cli.orchestration.run_generate_trace",
+                return_value={"n_steps": 100, "n_memory_holes": 0},
+            ) as mock_trace,
+            patch_all_for_generate_ar(),
+        ):
+            result = self.runner.invoke(app, args)
+
+        self.helper.assert_success_with_message(result, "Baseline updated")
+        assert mock_trace.call_count == 1
+        report = json.loads((tmp_path / "report.json").read_text())
+        assert list(report["blocks"]) == [str(TEST_BLOCK_NUMBER)]
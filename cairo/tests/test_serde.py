@@ -79,6 +79,7 @@ from tests.utils.args_gen import (
     G1Compressed,
     G1Uncompressed,
     Memory,
+    NodeStore,
     Stack,
     StorageDiffEntry,
     _cairo_struct_to_python_type,
@@ -118,6 +119,9 @@ def to_cairo_type(cairo_program):
 
 
 def get_type(instance: Any) -> Type:
+    if isinstance(instance, NodeStore):
+        return NodeStore
+
     if isinstance(instance, Mapping):
         # Get key and value types from the first item in the mapping
         if instance:
@@ -346,7 +350,7 @@ class TestSerde:
             BNP,
             BNP2,
             Mapping[Bytes32, Address],
-            Mapping[Hash32, Bytes],
+            NodeStore,
             Mapping[Bytes32, Bytes32],
             BLSFieldElement,
             AddressAccountDiffEntry,
@@ -168,6 +168,7 @@ from keth_types.types import (
     Memory,
     MutableBloom,
     Node,
+    NodeStore,
     Stack,
     StorageDiffEntry,
 )
@@ -505,7 +506,7 @@ _cairo_struct_to_python_type: Dict[Tuple[str, ...], Any] = {
     ("ethereum", "crypto", "alt_bn128", "BNP2"): BNP2,
     ("mpt", "types", "MappingBytes32Address"): Mapping[Bytes32, Address],
     ("mpt", "types", "MappingBytes32Bytes32"): Mapping[Bytes32, Bytes32],
-    ("mpt", "types", "NodeStore"): Mapping[Hash32, Bytes],
+    ("mpt", "types", "NodeStore"): NodeStore,
     ("cairo_core", "bytes", "HashedBytes32"): int,
     ("mpt", "types", "UnionInternalNodeExtended"): Union[InternalNode, Extended],
     ("mpt", "types", "OptionalUnionInternalNodeExtended"): Optional[
@@ -714,7 +715,17 @@ def _gen_arg(
         # Collection types are represented as a Dict[felt, V] along with a length field.
         # Get the concrete type parameter. For bytearray, the value type is int.
         value_type = next(iter(get_args(arg_type)), int)
-        data = defaultdict(int, {k: v for k, v in enumerate(arg)})
+        if arg_type_origin is Memory:
+            # Memory is stored as 16-byte big-endian words keyed by word index.
+            data = defaultdict(
+                int,
+                {
+                    i // 16: int.from_bytes(arg[i : i + 16].ljust(16, b"\x00"), "big")
+                    for i in range(0, len(arg), 16)
+                },
+            )
+        else:
+            data = defaultdict(int, {k: v for k, v in enumerate(arg)})
         base = generate_dict_arg(
             dict_manager,
             segments,
@@ -789,6 +800,16 @@ def _gen_arg(
         segments.load_data(struct_ptr, [instances_ptr, len(arg)])
         return struct_ptr
 
+    if arg_type_origin is NodeStore:
+        return generate_dict_arg(
+            dict_manager,
+            segments,
+            Mapping[Hash32, Bytes],
+            arg_type_origin,
+            arg,
+            for_dict_key=for_dict_key,
+        )
+
     if arg_type_origin in (dict, ChainMap, abc.Mapping, set):
         return generate_dict_arg(
             dict_manager,
@@ -1146,32 +1167,34 @@ def generate_dict_arg(
     # In case of a dict update, we need to get the prev_value from the dict_tracker of the parent_ptr.
     # For consistency purposes when we drop the dict and put its prev values back in the parent_ptr.
     parent_dict_end_ptr = segments.memory.get(parent_ptr + 1) if parent_ptr else None
+    # Fetch the parent data once: with the Rust DictManager, `data` converts the whole tracker.
+    parent_data = (
+        dict_manager.get_tracker(parent_dict_end_ptr).data
+        if parent_dict_end_ptr
+        else None
+    )
     # The initial dict segment should be sorted by key - as if it was squashed.
     processed_items = []
+    all_preimages = {}
     key_type = get_args(arg_type)[0]
     is_hashed_key = key_type in HASHED_TYPES
 
     for k, v in data.items():
-        if is_hashed_key:
-            cairo_key = k[0] if len(k) == 1 else blake2s_hash_many(k)
-        else:
-            cairo_key = k
+        # Each key is hashed once, for both the preimages and the Cairo key.
+        hashed_key = k[0] if len(k) == 1 else blake2s_hash_many(k)
+        all_preimages[hashed_key] = k
+        cairo_key = hashed_key if is_hashed_key else k
 
-        prev_value = (
-            dict_manager.get_tracker(parent_dict_end_ptr).data.get(k, v)
-            if parent_dict_end_ptr
-            else (data.default_factory() if isinstance(data, defaultdict) else v)
-        )
+        if parent_data is not None:
+            prev_value = parent_data.get(k, v)
+        else:
+            prev_value = data.default_factory() if isinstance(data, defaultdict) else v
 
         processed_items.append((cairo_key, prev_value, v))
 
     # Sort by Cairo key and flatten the inner tuples
     initial_data = flatten(sorted(processed_items, key=lambda item: item[0]))
 
-    all_preimages = {
-        blake2s_hash_many(k) if len(k) != 1 else k[0]: k for k in data.keys()
-    }
-
     segments.load_data(dict_ptr, initial_data)
     current_ptr = dict_ptr + len(initial_data)
 
@@ -1199,8 +1222,11 @@ def generate_dict_arg(
     # The last element is the original_segment_stop pointer.
     # Because this is a new dict, this is 0 (null ptr).
     # This does not apply to Stack, Memory and MutableBloom, in which case there's only 2 elements.
+    # For a NodeStore, the last element is the decoded nodes cache: null, which disables caching.
     if arg_type_origin in (Stack, Memory, MutableBloom):
         data_to_load = [dict_ptr, current_ptr]
+    elif arg_type_origin is NodeStore:
+        data_to_load = [dict_ptr, current_ptr, 0]
     else:
         data_to_load = [dict_ptr, current_ptr, parent_ptr or 0]
     segments.load_data(base, data_to_load)
@@ -98,6 +98,7 @@ from tests.utils.args_gen import (
     G1Compressed,
     Memory,
     MutableBloom,
+    NodeStore,
     Stack,
     builtins_exception_classes,
     ethereum_exception_classes,
@@ -282,10 +283,12 @@ class Serde:
                 for i in range(0, segment_size, 3)
             }
             if python_cls is Memory:
-                # For bytearray, convert Bytes1 objects to integers
+                # Memory is stored as 16-byte big-endian words keyed by word index
                 return Memory(
-                    int.from_bytes(dict_repr.get(i, b"\x00"), "little")
-                    for i in range(data_len)
+                    b"".join(
+                        int(dict_repr.get(i, 0)).to_bytes(16, "big")
+                        for i in range(-(-data_len // 16))
+                    )[:data_len]
                 )
 
             if python_cls is MutableBloom:
@@ -356,6 +359,21 @@ class Serde:
                     ]
                 )
 
+        if python_cls is NodeStore:
+            mapping_struct_ptr = self.serialize_pointers(path, ptr)["value"]
+            mapping_struct_path = (
+                get_struct_definition(self.program_identifiers, path)
+                .members["value"]
+                .cairo_type.pointee.scope.path
+            )
+            # The decoded nodes cache is not part of the Python type: only the node store is
+            # serialized.
+            return NodeStore(
+                self._serialize_mapping_struct(
+                    mapping_struct_path, mapping_struct_ptr, Mapping
+                )
+            )
+
         if origin_cls in (Mapping, abc.Mapping, set):
             mapping_struct_ptr = self.serialize_pointers(path, ptr)["value"]
             mapping_struct_path = (
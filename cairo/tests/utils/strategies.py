@@ -93,6 +93,7 @@ from keth_types.types import (
     G1Compressed,
     Memory,
     MutableBloom,
+    NodeStore,
     Stack,
 )
 from tests.utils.constants import BLOCK_GAS_LIMIT, MAX_BLOB_GAS_PER_BLOCK
@@ -891,6 +892,9 @@ def register_type_strategies():
     st.register_type_strategy(State, state_strategy())
     st.register_type_strategy(TransientStorage, transient_storage)
     st.register_type_strategy(MutableBloom, bloom.map(MutableBloom))
+    st.register_type_strategy(
+        NodeStore, st.dictionaries(hash32, small_bytes, max_size=10).map(NodeStore)
+    )
     st.register_type_strategy(BlockEnvironment, block_environment_lite)
     st.register_type_strategy(TransactionEnvironment, transaction_environment_lite)
     st.register_type_strategy(Header, header)
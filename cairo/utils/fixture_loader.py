@@ -41,7 +41,6 @@ from ethereum.utils.hexadecimal import (
     hex_to_bytes,
     hex_to_bytes32,
     hex_to_hash,
-    hex_to_u256,
     hex_to_uint,
 )
 from ethereum_spec_tools.evm_tools.loaders.fixture_loader import Load
@@ -208,7 +207,7 @@ def load_zkpi_fixture(zkpi_path: Union[Path, str]) -> Dict[str, Any]:
             del ancestor["requestsHash"]
 
     block_transactions = input_block["transaction"]
-    transactions = process_block_transactions(block_transactions)
+    transactions = load_block_transactions(zkpi_path, block_transactions)
 
     # Convert block
     block = Block(
@@ -564,51 +563,57 @@ def normalize_transaction(tx: Dict[str, Any]) -> Dict[str, Any]:
     return tx
 
 
+def decode_block_transaction(tx: Dict[str, Any]) -> Union[LegacyTransaction, Bytes]:
+    """
+    Decode a ZKPI transaction into the type expected by Keth: a `LegacyTransaction`
+    for legacy transactions, the encoded transaction bytes otherwise.
+    """
+    transaction = TransactionLoad(normalize_transaction(tx), ForkLoad("prague")).read()
+    if isinstance(transaction, LegacyTransaction):
+        decoded = LegacyTransaction(
+            nonce=U256(transaction.nonce),
+            gas_price=Uint(transaction.gas_price),
+            gas=Uint(transaction.gas),
+            to=Address(transaction.to) if transaction.to else Bytes0(),
+            value=U256(transaction.value),
+            data=Bytes(transaction.data),
+            v=U256(transaction.v),
+            r=U256(transaction.r),
+            s=U256(transaction.s),
+        )
+    else:
+        decoded = Bytes(encode_transaction(transaction))
+
+    return decoded
+
+
 def process_block_transactions(
     block_transactions: List[Dict[str, Any]],
-) -> Tuple[Tuple[LegacyTransaction, ...], Tuple[Dict[str, Any], ...]]:
+) -> Tuple[Union[LegacyTransaction, Bytes], ...]:
+    return tuple(decode_block_transaction(tx) for tx in block_transactions)
 
-    transactions = tuple(
-        TransactionLoad(normalize_transaction(tx), ForkLoad("prague")).read()
-        for tx in block_transactions
-    )
-    encoded_transactions = tuple(
-        (
-            "0x" + encode_transaction(tx).hex()
-            if not isinstance(tx, LegacyTransaction)
-            else {
-                "nonce": hex(tx.nonce),
-                "gasPrice": hex(tx.gas_price),
-                "gas": hex(tx.gas),
-                "to": "0x" + tx.to.hex() if tx.to else "",
-                "value": hex(tx.value),
-                "data": "0x" + tx.data.hex(),
-                "v": hex(tx.v),
-                "r": hex(tx.r),
-                "s": hex(tx.s),
-            }
-        )
-        for tx in transactions
-    )
-    transactions = tuple(
-        (
-            LegacyTransaction(
-                nonce=hex_to_u256(tx["nonce"]),
-                gas_price=hex_to_uint(tx["gasPrice"]),
-                gas=hex_to_uint(tx["gas"]),
-                to=Address(hex_to_bytes(tx["to"])) if tx["to"] else Bytes0(),
-                value=hex_to_u256(tx["value"]),
-                data=Bytes(hex_to_bytes(tx["data"])),
-                v=hex_to_u256(tx["v"]),
-                r=hex_to_u256(tx["r"]),
-                s=hex_to_u256(tx["s"]),
-            )
-            if isinstance(tx, dict)
-            else Bytes(hex_to_bytes(tx))
-        )
-        for tx in encoded_transactions
-    )
 
+# Decoded transactions of the last loaded fixture, keyed by its path and modification
+# time. Every step of a block run loads the fixture again: they are decoded once per
+# block, and only one block is kept in memory.
+_decoded_transactions: Dict[
+    Tuple[str, int], Tuple[Union[LegacyTransaction, Bytes], ...]
+] = {}
+
+
+def load_block_transactions(
+    zkpi_path: Union[Path, str], block_transactions: List[Dict[str, Any]]
+) -> Tuple[Union[LegacyTransaction, Bytes], ...]:
+    """
+    Decode the transactions of the block of a ZKPI fixture, reusing the decoded
+    transactions of the previous load of the same fixture.
+    """
+    key = (str(Path(zkpi_path).resolve()), Path(zkpi_path).stat().st_mtime_ns)
+    transactions = _decoded_transactions.get(key)
+    if transactions is None:
+        transactions = process_block_transactions(block_transactions)
+        _decoded_transactions.clear()
+        _decoded_transactions[key] = transactions
     return transactions
 
 
@@ -14,6 +14,7 @@ use tracing_subscriber::{
 #[global_allocator]
 static ALLOCATOR: dhat::Alloc = dhat::Alloc;
 
+mod serialization;
 mod stwo_bindings;
 mod vm;
 
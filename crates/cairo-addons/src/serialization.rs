@@ -0,0 +1,113 @@
+use std::{
+    fs::File,
+    io::{self, Write},
+    path::Path,
+    str::FromStr,
+};
+
+use bincode::enc::write::Writer;
+use serde::{de::DeserializeOwned, Serialize};
+
+/// Magic bytes prefixing binary-serialized files, used to detect their format when reading them.
+const BINARY_MAGIC: &[u8; 4] = b"KBIN";
+/// Magic bytes of a zstd frame.
+const ZSTD_MAGIC: &[u8; 4] = &[0x28, 0xb5, 0x2f, 0xfd];
+/// Default zstd compression level, favouring speed over ratio.
+const ZSTD_LEVEL: i32 = 3;
+
+/// On-disk format of the prover inputs and proofs.
+///
+/// - `json`: pretty JSON, readable and compatible with external tools.
+/// - `binary`: bincode, prefixed with `KBIN` magic bytes.
+/// - `binary-zstd`: zstd-compressed `binary`.
+#[derive(Clone, Copy, Debug, Default, PartialEq, Eq)]
+pub enum SerializationFormat {
+    #[default]
+    Json,
+    Binary,
+    BinaryZstd,
+}
+
+impl FromStr for SerializationFormat {
+    type Err = anyhow::Error;
+
+    fn from_str(s: &str) -> Result<Self, Self::Err> {
+        match s {
+            "json" => Ok(Self::Json),
+            "binary" => Ok(Self::Binary),
+            "binary-zstd" => Ok(Self::BinaryZstd),
+            _ => Err(anyhow::anyhow!(
+                "Unknown serialization format {}, expected one of: json, binary, binary-zstd",
+                s
+            )),
+        }
+    }
+}
+
+/// Adapts a `std::io::Write` to a bincode `Writer`.
+struct IoWriter<W: Write> {
+    inner: W,
+    bytes_written: usize,
+}
+
+impl<W: Write> Writer for IoWriter<W> {
+    fn write(&mut self, bytes: &[u8]) -> Result<(), bincode::error::EncodeError> {
+        self.inner
+            .write_all(bytes)
+            .map_err(|e| bincode::error::EncodeError::Io { inner: e, index: self.bytes_written })?;
+        self.bytes_written += bytes.len();
+        Ok(())
+    }
+}
+
+fn write_binary<T: Serialize, W: Write>(value: &T, mut writer: W) -> anyhow::Result<W> {
+    writer.write_all(BINARY_MAGIC)?;
+    let mut writer = IoWriter { inner: writer, bytes_written: 0 };
+    bincode::serde::encode_into_writer(value, &mut writer, bincode::config::standard())
+        .map_err(|e| anyhow::anyhow!("Failed to encode binary: {}", e))?;
+    Ok(writer.inner)
+}
+
+/// Serializes `value` to `file_path` in the given format.
+pub fn write_serialized<T: Serialize>(
+    value: &T,
+    file_path: &Path,
+    format: SerializationFormat,
+) -> anyhow::Result<()> {
+    let file = File::create(file_path)
+        .map_err(|e| anyhow::anyhow!("Failed to create file {:?}: {}", file_path, e))?;
+    let writer = io::BufWriter::with_capacity(3 * 1024 * 1024, file);
+    let mut writer = match format {
+        SerializationFormat::Json => {
+            let mut writer = writer;
+            writer.write_all(sonic_rs::to_string_pretty(value)?.as_bytes())?;
+            writer
+        }
+        SerializationFormat::Binary => write_binary(value, writer)?,
+        SerializationFormat::BinaryZstd => {
+            write_binary(value, zstd::Encoder::new(writer, ZSTD_LEVEL)?)?.finish()?
+        }
+    };
+    writer.flush()?;
+    Ok(())
+}
+
+/// Deserializes a value from `file_path`, detecting whether it was written as JSON, binary or
+/// zstd-compressed binary.
+pub fn read_serialized<T: DeserializeOwned>(file_path: &Path) -> anyhow::Result<T> {
+    let mut bytes = std::fs::read(file_path)
+        .map_err(|e| anyhow::anyhow!("Failed to read file {:?}: {}", file_path, e))?;
+    if bytes.starts_with(ZSTD_MAGIC) {
+        bytes = zstd::decode_all(bytes.as_slice())?;
+    }
+
+    match bytes.strip_prefix(BINARY_MAGIC) {
+        Some(payload) => {
+            let (value, _) =
+                bincode::serde::decode_from_slice(payload, bincode::config::standard())
+                    .map_err(|e| anyhow::anyhow!("Failed to decode binary: {}", e))?;
+            Ok(value)
+        }
+        None => Ok(sonic_rs::from_slice(&bytes)?),
+    }
+}
@@ -1,6 +1,14 @@
-use std::{io::Write, path::PathBuf};
+use std::{
+    io::Write,
+    path::{Path, PathBuf},
+    time::Instant,
+};
 
-use crate::{setup_logging, vm::to_pyerr};
+use crate::{
+    serialization::{read_serialized, write_serialized, SerializationFormat},
+    setup_logging,
+    vm::to_pyerr,
+};
 use cairo_air::{verifier::verify_cairo, CairoProof, PreProcessedTraceVariant};
 use pyo3::{
     prelude::*,
@@ -28,24 +36,31 @@ fn get_keth_proof_config() -> ProverParameters {
 }
 
 /// Python binding to generate a proof from prover inputs
+///
+/// The format of the prover inputs (JSON, binary or zstd-compressed binary) is detected
+/// automatically. The proof is written in `proof_format`, unless `serde_cairo` is set.
 #[pyfunction]
-pub fn prove(prover_input_path: PathBuf, proof_path: PathBuf, serde_cairo: bool) -> PyResult<()> {
+#[pyo3(signature = (prover_input_path, proof_path, serde_cairo, proof_format="json"))]
+pub fn prove(
+    prover_input_path: PathBuf,
+    proof_path: PathBuf,
+    serde_cairo: bool,
+    proof_format: &str,
+) -> PyResult<()> {
     #[cfg(feature = "dhat-heap")]
     let _profiler = dhat::Profiler::new_heap();
 
     let _ = setup_logging();
-    let serialized_prover_input = std::fs::read_to_string(&prover_input_path)?;
-    let prover_input = sonic_rs::from_str(&serialized_prover_input).map_err(to_pyerr)?;
-    prove_with_stwo(prover_input, proof_path, serde_cairo, false).map_err(to_pyerr)
+    let proof_format: SerializationFormat = proof_format.parse().map_err(to_pyerr)?;
+    let prover_input = read_serialized(&prover_input_path).map_err(to_pyerr)?;
+    prove_with_stwo(prover_input, proof_path, serde_cairo, proof_format, false).map_err(to_pyerr)
 }
 
-/// Python binding to verify a proof
+/// Python binding to verify a proof, whose format is detected automatically.
 #[pyfunction]
 pub fn verify(proof_path: PathBuf) -> PyResult<()> {
     let _ = setup_logging();
-    let proof_str = std::fs::read_to_string(&proof_path)?;
-    let proof: CairoProof<Blake2sMerkleHasher> =
-        sonic_rs::from_str(&proof_str).map_err(to_pyerr)?;
+    let proof: CairoProof<Blake2sMerkleHasher> = read_serialized(&proof_path).map_err(to_pyerr)?;
     let ProverParameters { channel_hash: _, pcs_config: _, preprocessed_trace } =
         get_keth_proof_config();
     verify_cairo::<Blake2sMerkleChannel>(proof, preprocessed_trace).map_err(to_pyerr)?;
@@ -58,6 +73,7 @@ pub fn verify(proof_path: PathBuf) -> PyResult<()> {
 pub fn stwo_bindings(module: &Bound<'_, PyModule>) -> PyResult<()> {
     module.add_function(wrap_pyfunction!(prove, module)?)?;
     module.add_function(wrap_pyfunction!(verify, module)?)?;
+    module.add_function(wrap_pyfunction!(compare_serialization_formats, module)?)?;
     init(module)
 }
 
@@ -79,20 +95,21 @@ fn init(m: &Bound<'_, PyModule>) -> PyResult<()> {
 ///
 /// * `prover_input` - The prover input to prove
 /// * `proof_path` - The path to save the proof
-/// * `serde_cairo` - If false, the proof is serialized to a JSON format to be used by the Rust
-///   Verifier. If true, the proof is serialized as an array of field elements serialized as hex
+/// * `serde_cairo` - If false, the proof is serialized in `proof_format` to be used by the Rust
+///   Verifier. If true, the proof is serialized as a JSON array of field elements serialized as hex
 ///   strings, compatible with `scarb execute`.
+/// * `proof_format` - The format of the proof when `serde_cairo` is false.
 /// * `verify` - Whether to verify the proof as well
 pub fn prove_with_stwo(
     prover_input: ProverInput,
     proof_path: PathBuf,
     serde_cairo: bool,
+    proof_format: SerializationFormat,
     verify: bool,
 ) -> Result<(), Box<dyn std::error::Error>> {
     let ProverParameters { channel_hash: _, pcs_config, preprocessed_trace } =
         get_keth_proof_config();
     let proof = prove_cairo::<Blake2sMerkleChannel>(prover_input, pcs_config, preprocessed_trace)?;
-    let mut proof_file = create_file(&proof_path)?;
     if serde_cairo {
         let mut serialized: Vec<starknet_ff::FieldElement> = Vec::new();
         CairoSerialize::serialize(&proof, &mut serialized);
@@ -100,12 +117,57 @@ pub fn prove_with_stwo(
         let hex_strings: Vec<String> =
             serialized.into_iter().map(|felt| format!("0x{:x}", felt)).collect();
 
+        let mut proof_file = create_file(&proof_path)?;
         proof_file.write_all(sonic_rs::to_string_pretty(&hex_strings)?.as_bytes())?;
     } else {
-        proof_file.write_all(sonic_rs::to_string_pretty(&proof)?.as_bytes())?;
+        write_serialized(&proof, &proof_path, proof_format)?;
     }
     if verify {
         verify_cairo::<Blake2sMerkleChannel>(proof, preprocessed_trace)?;
     }
     Ok(())
 }
+
+/// Benchmarks the serialization formats on a prover input file.
+///
+/// Writes the prover input in every format to `output_dir` and reads it back, returning for each
+/// format its name, the file size in bytes, and the write and read durations in seconds.
+#[pyfunction]
+pub fn compare_serialization_formats(
+    prover_input_path: PathBuf,
+    output_dir: PathBuf,
+) -> PyResult<Vec<(String, u64, f64, f64)>> {
+    let prover_input: ProverInput = read_serialized(&prover_input_path).map_err(to_pyerr)?;
+    std::fs::create_dir_all(&output_dir)?;
+
+    [
+        ("json", SerializationFormat::Json),
+        ("binary", SerializationFormat::Binary),
+        ("binary-zstd", SerializationFormat::BinaryZstd),
+    ]
+    .into_iter()
+    .map(|(name, format)| {
+        let path = output_dir.join(format!("prover_input.{}", name));
+        let (size, write_time, read_time) =
+            time_serialization(&prover_input, &path, format).map_err(to_pyerr)?;
+        Ok((name.to_string(), size, write_time, read_time))
+    })
+    .collect()
+}
+
+/// Returns the file size, write and read durations of `prover_input` serialized in `format`.
+fn time_serialization(
+    prover_input: &ProverInput,
+    path: &Path,
+    format: SerializationFormat,
+) -> anyhow::Result<(u64, f64, f64)> {
+    let start = Instant::now();
+    write_serialized(prover_input, path, format)?;
+    let write_time = start.elapsed().as_secs_f64();
+
+    let start = Instant::now();
+    let _: ProverInput = read_serialized(path)?;
+    let read_time = start.elapsed().as_secs_f64();
+
+    Ok((std::fs::metadata(path)?.len(), write_time, read_time))
+}
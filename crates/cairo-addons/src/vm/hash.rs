@@ -1,6 +1,7 @@
 use blake2::{Blake2s256, Digest};
 use num_bigint::BigUint;
-use pyo3::pyfunction;
+use pyo3::{exceptions::PyValueError, prelude::*, types::PyBytes};
+use revm::primitives::{hex, keccak256, B256};
 use starknet_crypto::poseidon_hash_many as poseidon_hash_many_native;
 use starknet_types_core::felt::Felt;
 
@@ -29,3 +30,56 @@ pub fn blake2s_hash_many(elements: Vec<BigUint>) -> BigUint {
     let hash = hasher.finalize();
     BigUint::from_bytes_le(&hash[..31])
 }
+
+/// Minimum number of elements hashed by a thread of `keccak256_hex_many`, so that small batches
+/// don't spawn a thread per element.
+const KECCAK256_HEX_MIN_CHUNK_SIZE: usize = 256;
+
+/// Hex-decodes each element and hashes it with keccak256, returning `(hash, preimage)` pairs
+/// in the input order. Elements may be `0x`-prefixed.
+///
+/// Decoding and hashing run without holding the GIL, split across at most `num_threads` threads,
+/// each hashing at least `KECCAK256_HEX_MIN_CHUNK_SIZE` elements.
+#[pyfunction]
+#[pyo3(signature = (elements, num_threads=1))]
+pub fn keccak256_hex_many(
+    py: Python<'_>,
+    elements: Vec<String>,
+    num_threads: usize,
+) -> PyResult<Vec<(Py<PyBytes>, Py<PyBytes>)>> {
+    let hashed = py
+        .allow_threads(|| {
+            let chunk_size =
+                elements.len().div_ceil(num_threads.max(1)).max(KECCAK256_HEX_MIN_CHUNK_SIZE);
+            std::thread::scope(|scope| {
+                let handles = elements
+                    .chunks(chunk_size)
+                    .map(|chunk| {
+                        scope.spawn(move || {
+                            chunk
+                                .iter()
+                                .map(|element| {
+                                    let preimage = hex::decode(element)?;
+                                    Ok((keccak256(&preimage), preimage))
+                                })
+                                .collect::<Result<Vec<(B256, Vec<u8>)>, hex::FromHexError>>()
+                        })
+                    })
+                    .collect::<Vec<_>>();
+
+                let mut hashed = Vec::with_capacity(elements.len());
+                for handle in handles {
+                    hashed.extend(handle.join().expect("keccak256 worker panicked")?);
+                }
+                Ok(hashed)
+            })
+        })
+        .map_err(|e: hex::FromHexError| PyValueError::new_err(e.to_string()))?;
+
+    Ok(hashed
+        .into_iter()
+        .map(|(hash, preimage)| {
+            (PyBytes::new(py, hash.as_slice()).unbind(), PyBytes::new(py, &preimage).unbind())
+        })
+        .collect())
+}
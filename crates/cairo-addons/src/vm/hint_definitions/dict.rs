@@ -2,9 +2,12 @@ use std::collections::HashMap;
 
 use cairo_vm::{
     hint_processor::{
-        builtin_hint_processor::hint_utils::{
-            get_integer_from_var_name, get_ptr_from_var_name, insert_value_from_var_name,
-            insert_value_into_ap,
+        builtin_hint_processor::{
+            dict_manager::Dictionary,
+            hint_utils::{
+                get_integer_from_var_name, get_ptr_from_var_name, insert_value_from_var_name,
+                insert_value_into_ap,
+            },
         },
         hint_processor_definition::HintReference,
     },
@@ -22,6 +25,7 @@ pub const HINTS: &[fn() -> Hint] = &[
     dict_squash,
     copy_tracker_to_new_ptr,
     merge_dict_tracker_with_parent,
+    move_dict_tracker_to_parent,
     update_dict_tracker,
 ];
 
@@ -191,6 +195,41 @@ pub fn merge_dict_tracker_with_parent() -> Hint {
     )
 }
 
+/// Same as `merge_dict_tracker_with_parent`, for a dict forked from the parent with
+/// `copy_tracker_to_new_ptr`. The parent is not written to while the fork is alive, so the fork's
+/// data is the parent's data plus its own writes: it is moved into the parent instead of copying
+/// every entry.
+pub fn move_dict_tracker_to_parent() -> Hint {
+    Hint::new(
+        String::from("move_dict_tracker_to_parent"),
+        |vm: &mut VirtualMachine,
+         exec_scopes: &mut ExecutionScopes,
+         ids_data: &HashMap<String, HintReference>,
+         ap_tracking: &ApTracking,
+         _constants: &HashMap<String, Felt252>|
+         -> Result<(), HintError> {
+            let dict_ptr = get_ptr_from_var_name("dict_ptr", vm, ids_data, ap_tracking)?;
+            let parent_dict_end =
+                get_ptr_from_var_name("parent_dict_end", vm, ids_data, ap_tracking)?;
+
+            let dict_manager_ref = exec_scopes.get_dict_manager()?;
+            let mut dict_manager = dict_manager_ref.borrow_mut();
+
+            let current_tracker = dict_manager.get_tracker_mut(dict_ptr)?;
+            current_tracker.is_squashed = true;
+            let current_data = std::mem::replace(
+                &mut current_tracker.data,
+                Dictionary::SimpleDictionary(HashMap::new()),
+            );
+            let parent_tracker = dict_manager.get_tracker_mut(parent_dict_end)?;
+            parent_tracker.is_squashed = false;
+            parent_tracker.data = current_data;
+
+            Ok(())
+        },
+    )
+}
+
 pub fn update_dict_tracker() -> Hint {
     Hint::new(
         String::from("update_dict_tracker"),
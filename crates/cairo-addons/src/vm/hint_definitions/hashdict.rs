@@ -22,10 +22,8 @@ use cairo_vm::{
     },
     Felt252,
 };
-use num_bigint::BigUint;
-use num_traits::Zero;
 
-use crate::vm::{hash::blake2s_hash_many, hints::Hint};
+use crate::vm::hints::Hint;
 
 pub const HINTS: &[fn() -> Hint] = &[
     hashdict_read,
@@ -33,7 +31,6 @@ pub const HINTS: &[fn() -> Hint] = &[
     hashdict_read_from_key,
     get_preimage_for_key,
     copy_hashdict_tracker_entry,
-    get_storage_keys_for_address,
     get_default_value,
 ];
 
@@ -67,7 +64,7 @@ pub fn hashdict_read() -> Hint {
                 insert_value_from_var_name("value", value.clone(), vm, ids_data, ap_tracking)
             })?;
 
-            let hashed_key = compute_hash_key(&dict_key, key_len);
+            let hashed_key = get_hashed_key(vm, ids_data, ap_tracking, &dict_key, key_len)?;
             dict_manager.preimages.insert(hashed_key.into(), dict_key);
             Ok(())
         },
@@ -111,106 +108,13 @@ pub fn hashdict_write() -> Hint {
             })?;
             tracker.insert_value(&dict_key, &new_value);
 
-            let hashed_key = compute_hash_key(&dict_key, key_len);
+            let hashed_key = get_hashed_key(vm, ids_data, ap_tracking, &dict_key, key_len)?;
             dict_manager.preimages.insert(hashed_key.into(), dict_key);
             Ok(())
         },
     )
 }
 
-/// Same as above but skips keys with value 0 (empty storage)
-pub fn get_storage_keys_for_address() -> Hint {
-    Hint::new(
-        String::from("get_storage_keys_for_address"),
-        |vm: &mut VirtualMachine,
-         exec_scopes: &mut ExecutionScopes,
-         ids_data: &HashMap<String, HintReference>,
-         ap_tracking: &ApTracking,
-         _constants: &HashMap<String, Felt252>|
-         -> Result<(), HintError> {
-            // Get dictionary tracker
-            let dict_ptr = get_ptr_from_var_name("dict_ptr", vm, ids_data, ap_tracking)?;
-            let dict_manager_ref = exec_scopes.get_dict_manager()?;
-            let dict = dict_manager_ref.borrow();
-            let tracker = dict.get_tracker(dict_ptr)?;
-
-            // Build prefix from memory
-            let prefix_ptr = get_ptr_from_var_name("prefix", vm, ids_data, ap_tracking)?;
-            let prefix_len_felt: Felt252 =
-                get_integer_from_var_name("prefix_len", vm, ids_data, ap_tracking)?;
-            let prefix_len: usize = prefix_len_felt
-                .try_into()
-                .map_err(|_| MathError::Felt252ToUsizeConversion(Box::new(prefix_len_felt)))?;
-
-            let prefix: Vec<MaybeRelocatable> = (0..prefix_len)
-                .map(|i| {
-                    let addr = (prefix_ptr + i)?;
-                    vm.get_maybe(&addr).ok_or_else(|| {
-                        HintError::Memory(MemoryError::UnknownMemoryCell(Box::new(addr)))
-                    })
-                })
-                .collect::<Result<_, _>>()?;
-
-            // Find matching preimages
-            let matching_preimages: Vec<&Vec<MaybeRelocatable>> = tracker
-                .get_dictionary_ref()
-                .iter()
-                .filter_map(|(key, value)| {
-                    let DictKey::Compound(key_parts) = key else { return None };
-
-                    // Check if key_parts has enough elements and matches the prefix
-                    if key_parts.len() < prefix.len() || key_parts[..prefix.len()] != prefix[..] {
-                        return None;
-                    }
-
-                    // Return None if value is zero integer (deleted storage)
-                    match value.get_int() {
-                        Some(value) if value == Zero::zero() => None,
-                        _ => Some(key_parts),
-                    }
-                })
-                .collect();
-
-            // Allocate memory segments and write results
-            let base = vm.add_memory_segment();
-            for (i, preimage) in matching_preimages.iter().enumerate() {
-                let ptr = vm.add_memory_segment();
-                let bytes32_base = vm.add_memory_segment();
-
-                // Write the rest of preimage (excluding first element) to bytes32_base
-                for (j, value) in preimage[1..].iter().enumerate() {
-                    vm.insert_value((bytes32_base + j)?, value.clone())?;
-                }
-
-                // Write [first_element, bytes32_base] to ptr
-                vm.insert_value(ptr, preimage[0].clone())?;
-                vm.insert_value((ptr + 1)?, MaybeRelocatable::from(bytes32_base))?;
-
-                // Write ptr to base[i]
-                vm.insert_value((base + i)?, MaybeRelocatable::from(ptr))?;
-            }
-
-            // Set output values
-            insert_value_from_var_name(
-                "keys_len",
-                Felt252::from(matching_preimages.len()),
-                vm,
-                ids_data,
-                ap_tracking,
-            )?;
-            insert_value_from_var_name(
-                "keys",
-                MaybeRelocatable::from(base),
-                vm,
-                ids_data,
-                ap_tracking,
-            )?;
-
-            Ok(())
-        },
-    )
-}
-
 pub fn hashdict_read_from_key() -> Hint {
     Hint::new(
         String::from("hashdict_read_from_key"),
@@ -308,13 +212,13 @@ pub fn copy_hashdict_tracker_entry() -> Hint {
             let dest_ptr = get_ptr_from_var_name("dest_ptr", vm, ids_data, ap_tracking)?;
             let dict_manager_ref = exec_scopes.get_dict_manager()?;
             let mut dict_manager = dict_manager_ref.borrow_mut();
-            let preimages = &dict_manager.preimages.clone();
-
-            let source_tracker = dict_manager.get_tracker_mut(source_ptr_stop)?;
 
             // Find matching preimage from source tracker data
             let key_hash = get_integer_from_var_name("source_key", vm, ids_data, ap_tracking)?;
-            let preimage = _get_preimage_for_hashed_key(key_hash.into(), preimages)?.clone();
+            let preimage =
+                _get_preimage_for_hashed_key(key_hash.into(), &dict_manager.preimages)?.clone();
+
+            let source_tracker = dict_manager.get_tracker_mut(source_ptr_stop)?;
 
             // The default behavior of `get_value` is to mark the tracker as unsquashed, as we're
             // accessing an internal value. However, in this specific case, we're not
@@ -395,22 +299,23 @@ fn _get_preimage_for_hashed_key(
     })
 }
 
-/// Helper function to compute the hash key from a DictKey
-fn compute_hash_key(dict_key: &DictKey, key_len: usize) -> Felt252 {
+/// Helper function to get the hash key of a DictKey
+///
+/// Compound keys are hashed by the Cairo caller before the hint runs, so their hash is read from
+/// `felt_key` rather than recomputed.
+fn get_hashed_key(
+    vm: &VirtualMachine,
+    ids_data: &HashMap<String, HintReference>,
+    ap_tracking: &ApTracking,
+    dict_key: &DictKey,
+    key_len: usize,
+) -> Result<Felt252, HintError> {
     if key_len != 1 {
-        match dict_key {
-            DictKey::Compound(values) => {
-                let ints: Vec<BigUint> =
-                    values.iter().map(|v| v.get_int().unwrap().to_biguint()).collect();
-                let hash = blake2s_hash_many(ints);
-                Felt252::from(hash)
-            }
-            DictKey::Simple(_) => panic!("Unreachable"),
-        }
-    } else {
-        match dict_key {
-            DictKey::Compound(values) => values[0].get_int().unwrap(),
-            DictKey::Simple(value) => value.get_int().unwrap(),
-        }
+        return get_integer_from_var_name("felt_key", vm, ids_data, ap_tracking);
     }
+    let value = match dict_key {
+        DictKey::Compound(values) => &values[0],
+        DictKey::Simple(value) => value,
+    };
+    value.get_int().ok_or_else(|| HintError::CustomHint("Key is not an integer".into()))
 }
@@ -1,6 +1,6 @@
 use lazy_static::lazy_static;
 use revm::primitives::Address;
-use std::collections::HashMap;
+use std::{collections::HashMap, rc::Rc};
 
 use cairo_vm::{
     hint_processor::{
@@ -37,9 +37,21 @@ pub const HINTS: &[fn() -> Hint] = &[
     jumpdest_check_push_last_32_bytes,
     jumpdest_continue_general_case,
     jumpdest_continue_no_push_case,
+    frame_dict_jumpdests_len,
     compare_relocatable_segment_index,
 ];
 
+/// Name of the execution scope variable caching the valid jump destinations of the bytecodes
+/// already analysed in the current run.
+const JUMPDESTS_CACHE: &str = "__jumpdests_cache__";
+
+/// Valid jump destinations keyed by bytecode data pointer and length.
+///
+/// VM memory is write-once, so a given bytecode segment always holds the same code. Code loaded
+/// from the state is cached in the account and shared by every call to that contract, so only the
+/// first call to a contract analyses its bytecode.
+type JumpdestsCache = HashMap<(MaybeRelocatable, usize), Rc<Vec<usize>>>;
+
 lazy_static! {
     static ref PRECOMPILE_INDICES: HashMap<Address, Felt252> = {
         let mut map = HashMap::new();
@@ -220,31 +232,56 @@ pub fn initialize_jumpdests() -> Hint {
     Hint::new(
         String::from("initialize_jumpdests"),
         |vm: &mut VirtualMachine,
-         _exec_scopes: &mut ExecutionScopes,
+         exec_scopes: &mut ExecutionScopes,
          ids_data: &HashMap<String, HintReference>,
          ap_tracking: &ApTracking,
          _constants: &HashMap<String, Felt252>|
          -> Result<(), HintError> {
             // Get bytecode pointer and length
-            let bytecode = serialize_sequence("bytecode", vm, ids_data, ap_tracking)?
-                .into_iter()
-                .map(|b| b.try_into().unwrap())
-                .collect::<Vec<u8>>();
-
-            // Get valid jump destinations
-            let valid_jumpdest = get_valid_jump_destinations(&bytecode);
+            let bytecode_ptr = get_ptr_from_var_name("bytecode", vm, ids_data, ap_tracking)?;
+            let bytecode_len_felt = vm.get_integer((bytecode_ptr + 1)?)?.into_owned();
+            let bytecode_len: usize = bytecode_len_felt
+                .try_into()
+                .map_err(|_| MathError::Felt252ToUsizeConversion(Box::new(bytecode_len_felt)))?;
+            let bytecode_data = vm
+                .get_maybe(&bytecode_ptr)
+                .ok_or_else(|| HintError::CustomHint(Box::from("Bytecode data is not set")))?;
+            let cache_key = (bytecode_data, bytecode_len);
+
+            // Get valid jump destinations, analysing the bytecode only if not done yet in this run
+            let cached = exec_scopes
+                .get_ref::<JumpdestsCache>(JUMPDESTS_CACHE)
+                .ok()
+                .and_then(|cache| cache.get(&cache_key).cloned());
+            let valid_jumpdest = match cached {
+                Some(valid_jumpdest) => valid_jumpdest,
+                None => {
+                    let bytecode = serialize_sequence("bytecode", vm, ids_data, ap_tracking)?
+                        .into_iter()
+                        .map(|b| b.try_into().unwrap())
+                        .collect::<Vec<u8>>();
+                    let valid_jumpdest = Rc::new(get_valid_jump_destinations(&bytecode));
+                    if exec_scopes.get_ref::<JumpdestsCache>(JUMPDESTS_CACHE).is_err() {
+                        exec_scopes.insert_value(JUMPDESTS_CACHE, JumpdestsCache::new());
+                    }
+                    exec_scopes
+                        .get_mut_ref::<JumpdestsCache>(JUMPDESTS_CACHE)?
+                        .insert(cache_key, valid_jumpdest.clone());
+                    valid_jumpdest
+                }
+            };
 
             // Create dictionary data with valid jump destinations
             let mut data = HashMap::new();
-            for dest in valid_jumpdest {
-                data.insert(vec![Felt252::from(dest).into()].into(), Felt252::ONE.into());
+            for dest in valid_jumpdest.iter() {
+                data.insert(vec![Felt252::from(*dest).into()].into(), Felt252::ONE.into());
             }
 
             // Create new segment for the dictionary
             let base = vm.add_memory_segment();
 
             // Get dict manager and verify segment doesn't exist
-            let dict_manager_ref = _exec_scopes.get_dict_manager()?;
+            let dict_manager_ref = exec_scopes.get_dict_manager()?;
             let mut dict_manager = dict_manager_ref.borrow_mut();
             if dict_manager.trackers.contains_key(&base.segment_index) {
                 return Err(HintError::CustomHint(Box::from(
@@ -411,6 +448,39 @@ pub fn jumpdest_continue_no_push_case() -> Hint {
     )
 }
 
+pub fn frame_dict_jumpdests_len() -> Hint {
+    Hint::new(
+        String::from("frame_dict_jumpdests_len"),
+        |vm: &mut VirtualMachine,
+         _exec_scopes: &mut ExecutionScopes,
+         ids_data: &HashMap<String, HintReference>,
+         ap_tracking: &ApTracking,
+         _constants: &HashMap<String, Felt252>|
+         -> Result<(), HintError> {
+            // The jump destinations are the keys of the squashed frame dict below 2**128.
+            let squashed_start =
+                get_ptr_from_var_name("squashed_start", vm, ids_data, ap_tracking)?;
+            let squashed_end = get_ptr_from_var_name("squashed_end", vm, ids_data, ap_tracking)?;
+            let n_accesses = (squashed_end - squashed_start)? / 3;
+            let mut n_jumpdests = n_accesses;
+            for i in 0..n_accesses {
+                if vm.get_integer((squashed_start + 3 * i)?)?.bits() > 128 {
+                    n_jumpdests = i;
+                    break;
+                }
+            }
+            insert_value_from_var_name(
+                "n_jumpdests",
+                MaybeRelocatable::from(n_jumpdests),
+                vm,
+                ids_data,
+                ap_tracking,
+            )?;
+            Ok(())
+        },
+    )
+}
+
 pub fn compare_relocatable_segment_index() -> Hint {
     Hint::new(
         String::from("compare_relocatable_segment_index"),
@@ -47,34 +47,6 @@ pub fn serialize_sequence(
     values.map_err(|_| HintError::CustomHint(Box::from("Could not serialize sequence")))
 }
 
-pub fn deserialize_sequence<T>(
-    sequence: Vec<T>,
-    vm: &mut VirtualMachine,
-) -> Result<Relocatable, HintError>
-where
-    Felt252: From<T>,
-    T: Copy,
-    T: std::fmt::Debug,
-{
-    // Allocate memory segments and write results
-    let base = vm.add_memory_segment();
-    let data_ptr = vm.add_memory_segment();
-    let len = sequence.len();
-
-    // Convert values and write to memory
-    let relocatable_values = sequence
-        .iter()
-        .map(|value| MaybeRelocatable::Int((*value).into()))
-        .collect::<Vec<MaybeRelocatable>>();
-
-    vm.segments.write_arg(data_ptr, &relocatable_values)?;
-    vm.segments.write_arg(
-        base,
-        &vec![MaybeRelocatable::from(data_ptr), MaybeRelocatable::Int(len.into())],
-    )?;
-    Ok(base)
-}
-
 pub(crate) struct Uint384<'a> {
     pub limbs: [Cow<'a, Felt252>; 4],
 }
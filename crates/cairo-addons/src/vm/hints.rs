@@ -54,6 +54,21 @@ impl Hint {
     }
 }
 
+/// The kind of a hint, determined the first time it is executed in a run.
+#[derive(Clone)]
+enum HintKind {
+    /// A hint implemented in Rust in this crate, called directly.
+    Native(Rc<HintFunc>),
+    /// A hint implemented by the builtin hint processor of the VM.
+    Builtin,
+    /// A hint only logging traces, skipped unless traces are enabled.
+    TraceOnly,
+    /// A hint executed as Python code by the dynamic hint executor.
+    Python,
+    /// An unknown hint, ignored as dynamic Python hints are disabled.
+    NoOp,
+}
+
 /// A wrapper around [`BuiltinHintProcessor`] to manage hint registration.
 pub struct HintProcessor {
     inner: BuiltinHintProcessor,
@@ -65,6 +80,13 @@ pub struct HintProcessor {
     /// Whether to enable execution of hints containing log traces.
     /// Enabling this considerably slows down the execution speed.
     enable_traces: bool,
+    /// The kind of each hint executed in the current run, keyed by hint code. Avoids trying the
+    /// builtin hint processor and classifying unknown hints on every execution, which matters for
+    /// hints executed on every EVM opcode.
+    hint_kinds: HashMap<String, HintKind>,
+    /// The number of executions of each hint without a native implementation in the current run,
+    /// keyed by hint code.
+    non_native_hint_counts: HashMap<String, usize>,
 }
 
 impl HintProcessor {
@@ -78,6 +100,8 @@ impl HintProcessor {
             python_hints,
             pythonic_hint_executor: None,
             enable_traces: false,
+            hint_kinds: HashMap::new(),
+            non_native_hint_counts: HashMap::new(),
         }
     }
 
@@ -99,6 +123,10 @@ impl HintProcessor {
         self
     }
 
+    /// Set the run resources of the next run.
+    ///
+    /// The hint kinds are reset, as the hint data of a new run is allocated anew, and so are the
+    /// counts of non-native hints.
     #[must_use]
     pub fn with_run_resources(self, run_resources: RunResources) -> Self {
         Self {
@@ -106,6 +134,8 @@ impl HintProcessor {
             python_hints: self.python_hints,
             pythonic_hint_executor: self.pythonic_hint_executor,
             enable_traces: self.enable_traces,
+            hint_kinds: HashMap::new(),
+            non_native_hint_counts: HashMap::new(),
         }
     }
 
@@ -127,14 +157,88 @@ impl HintProcessor {
             python_hints: self.python_hints,
             pythonic_hint_executor: self.pythonic_hint_executor,
             enable_traces: self.enable_traces,
+            hint_kinds: self.hint_kinds,
+            non_native_hint_counts: self.non_native_hint_counts,
+        }
+    }
+
+    /// The number of executions of each hint without a native implementation in the current run,
+    /// keyed by hint code.
+    ///
+    /// These hints are executed as Python code, or skipped if no Python hint executor is installed.
+    /// Hints only logging traces are not counted.
+    pub fn non_native_hint_counts(&self) -> &HashMap<String, usize> {
+        &self.non_native_hint_counts
+    }
+
+    /// Classifies a hint unknown to the builtin hint processor.
+    fn classify_unknown_hint(&self, hint_code: &str) -> HintKind {
+        if hint_code.contains("logger.trace") {
+            HintKind::TraceOnly
+        } else if self.pythonic_hint_executor.is_none() {
+            HintKind::NoOp
+        } else {
+            HintKind::Python
         }
     }
+
+    /// Counts an execution of a hint without a native implementation.
+    fn count_non_native_hint(&mut self, hint_code: &str) {
+        match self.non_native_hint_counts.get_mut(hint_code) {
+            Some(count) => *count += 1,
+            None => {
+                self.non_native_hint_counts.insert(hint_code.to_string(), 1);
+            }
+        }
+    }
+
+    /// Executes a hint as Python code with the dynamic hint executor.
+    fn execute_python_hint(
+        &self,
+        vm: &mut VirtualMachine,
+        exec_scopes: &mut ExecutionScopes,
+        hint_data: &HintProcessorData,
+        constants: &HashMap<String, Felt252>,
+    ) -> Result<(), HintError> {
+        let Some(pythonic_hint_func) = &self.pythonic_hint_executor else {
+            return Ok(());
+        };
+        exec_scopes.assign_or_update_variable("__hint_code__", Box::new(hint_data.code.clone()));
+
+        // Dump the accessible scopes in an execution scope object to access in the hint
+        let hint_accessible_scopes = hint_data.accessible_scopes.clone();
+        exec_scopes.assign_or_update_variable(
+            "__hint_accessible_scopes__",
+            Box::new(hint_accessible_scopes),
+        );
+        // Execute the dynamic hint
+        let pythonic_hint_func = pythonic_hint_func.0.as_ref();
+        let dynamic_result = pythonic_hint_func(
+            vm,
+            exec_scopes,
+            &hint_data.ids_data,
+            &hint_data.ap_tracking,
+            constants,
+        );
+
+        dynamic_result.map_err(|e| {
+            // Wrap the error with context about which hint failed
+            HintError::CustomHint(Box::from(format!(
+                "Dynamic hint execution failed for hint: '{}'. Error: {}",
+                hint_data.code, e
+            )))
+        })
+    }
 }
 
 impl HintProcessorLogic for HintProcessor {
     /// Executes a hint. If the hint is not found and dynamic hints are enabled, it will try to
     /// execute the hint as Python code. If dynamic hints are disabled, it will silently ignore
-    /// unknown hints.
+    /// unknown hints. Hints containing log traces are skipped unless traces are enabled.
+    ///
+    /// Each hint is classified the first time it is executed in a run, and dispatched directly
+    /// according to its kind afterwards. Executions of hints without a native implementation are
+    /// counted, see [`HintProcessor::non_native_hint_counts`].
     fn execute_hint(
         &mut self,
         vm: &mut VirtualMachine,
@@ -142,60 +246,47 @@ impl HintProcessorLogic for HintProcessor {
         hint_data: &Box<dyn std::any::Any>,
         constants: &HashMap<String, Felt252>,
     ) -> Result<(), HintError> {
-        // Try to execute the hint with the inner processor
-        let result = self.inner.execute_hint(vm, exec_scopes, hint_data, constants);
-
-        match result {
-            Ok(_) => Ok(()),
-            Err(HintError::UnknownHint(_hint_str)) => {
-                // If the hint is unknown and we have a dynamic hint executor, try it
-                if let Some(pythonic_hint_func) = &self.pythonic_hint_executor {
-                    // Extract the hint code from the hint_data
-                    let hint_data = match hint_data.downcast_ref::<HintProcessorData>() {
-                        Some(data) => data,
-                        None => {
-                            return Err(HintError::CustomHint(Box::from(
-                                "Failed to downcast hint_data to HintProcessorData".to_string(),
-                            )))
+        let Some(data) = hint_data.downcast_ref::<HintProcessorData>() else {
+            return Err(HintError::CustomHint(Box::from(
+                "Failed to downcast hint_data to HintProcessorData".to_string(),
+            )));
+        };
+        let kind = match self.hint_kinds.get(&data.code) {
+            Some(kind) => kind.clone(),
+            None => {
+                let kind = match self.inner.extra_hints.get(&data.code) {
+                    Some(func) => HintKind::Native(func.clone()),
+                    // Let the builtin hint processor try the hint to know whether it handles it
+                    None => match self.inner.execute_hint(vm, exec_scopes, hint_data, constants) {
+                        Err(HintError::UnknownHint(_)) => self.classify_unknown_hint(&data.code),
+                        result => {
+                            self.hint_kinds.insert(data.code.clone(), HintKind::Builtin);
+                            return result;
                         }
-                    };
-                    let hint_code = hint_data.code.clone();
-                    if hint_code.contains("logger.trace") && !self.enable_traces {
-                        // Skip execution of hints containing log traces
-                        // This significantly improves performance when running in production
-                        return Ok(())
-                    }
-                    exec_scopes.assign_or_update_variable("__hint_code__", Box::new(hint_code));
-
-                    // Dump the accessible scopes in an execution scope object to access in the hint
-                    let hint_accessible_scopes = hint_data.accessible_scopes.clone();
-                    exec_scopes.assign_or_update_variable(
-                        "__hint_accessible_scopes__",
-                        Box::new(hint_accessible_scopes),
-                    );
-                    // Execute the dynamic hint
-                    let pythonic_hint_func = pythonic_hint_func.0.as_ref();
-                    let dynamic_result = pythonic_hint_func(
-                        vm,
-                        exec_scopes,
-                        &hint_data.ids_data,
-                        &hint_data.ap_tracking,
-                        constants,
-                    );
+                    },
+                };
+                self.hint_kinds.insert(data.code.clone(), kind.clone());
+                kind
+            }
+        };
 
-                    dynamic_result.map_err(|e| {
-                        // Wrap the error with context about which hint failed
-                        HintError::CustomHint(Box::from(format!(
-                            "Dynamic hint execution failed for hint: '{}'. Error: {}",
-                            hint_data.code, e
-                        )))
-                    })
-                } else {
-                    // If dynamic hints are disabled, silently ignore unknown hints
-                    Ok(())
-                }
+        match kind {
+            HintKind::Native(func) => {
+                (func.0)(vm, exec_scopes, &data.ids_data, &data.ap_tracking, constants)
+            }
+            HintKind::Builtin => self.inner.execute_hint(vm, exec_scopes, hint_data, constants),
+            // Skip execution of hints containing log traces
+            // This significantly improves performance when running in production
+            HintKind::TraceOnly if !self.enable_traces => Ok(()),
+            HintKind::TraceOnly => self.execute_python_hint(vm, exec_scopes, data, constants),
+            HintKind::Python => {
+                self.count_non_native_hint(&data.code);
+                self.execute_python_hint(vm, exec_scopes, data, constants)
+            }
+            HintKind::NoOp => {
+                self.count_non_native_hint(&data.code);
+                Ok(())
             }
-            Err(err) => Err(err),
         }
     }
 }
@@ -11,6 +11,7 @@ mod layout;
 mod maybe_relocatable;
 mod memory_segments;
 mod mod_builtin_runner;
+mod profiler;
 mod program;
 mod pythonic_hint;
 mod relocatable;
@@ -50,6 +51,7 @@ pub fn vm(module: &Bound<'_, PyModule>) -> PyResult<()> {
     module.add_class::<PyModBuiltinRunner>()?;
     module.add_function(wrap_pyfunction!(hash::poseidon_hash_many, module)?).unwrap();
     module.add_function(wrap_pyfunction!(hash::blake2s_hash_many, module)?).unwrap();
+    module.add_function(wrap_pyfunction!(hash::keccak256_hex_many, module)?).unwrap();
     module.add_function(wrap_pyfunction!(runner::generate_trace, module)?)?;
     module.add_function(wrap_pyfunction!(runner::run_end_to_end, module)?).unwrap();
 
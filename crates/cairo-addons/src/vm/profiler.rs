@@ -0,0 +1,289 @@
+use cairo_vm::{vm::trace::trace_entry::RelocatedTraceEntry, Felt252};
+use serde::Deserialize;
+use std::{
+    collections::HashMap,
+    io::{self, Write},
+    path::Path,
+};
+
+/// The offset of the flags in an encoded instruction.
+const FLAGS_OFFSET: u64 = 48;
+/// The bias of the 16-bit offsets of an encoded instruction.
+const OFFSET_BIAS: i64 = 1 << 15;
+/// The register and operand source flags of an encoded instruction.
+const DST_REG_FP: u64 = 1;
+const OP0_REG_FP: u64 = 1 << 1;
+const OP1_SRC_IMM: u64 = 1 << 2;
+const OP1_SRC_FP: u64 = 1 << 3;
+const OP1_SRC_AP: u64 = 1 << 4;
+/// The opcode flags of the `call` and `ret` instructions.
+const OPCODE_CALL: u64 = 1 << 12;
+const OPCODE_RET: u64 = 1 << 13;
+
+/// The relocated memory range of a builtin segment.
+#[derive(Debug, Clone)]
+pub struct BuiltinSegment {
+    pub name: String,
+    pub start: usize,
+    pub end: usize,
+    pub cells_per_instance: usize,
+}
+
+/// A node of the calling context tree: the function entry pc and the node of its caller.
+#[derive(Debug)]
+struct CallNode {
+    parent: Option<usize>,
+    pc: usize,
+}
+
+/// Aggregated steps and builtin instances per unique call stack.
+///
+/// A call stack is the list of the (relocated) entry pcs of the functions being executed,
+/// from the entrypoint to the innermost call. The stack is maintained natively while walking
+/// the execution, pushing the callee on `call` and popping it on `ret`, so that the per-stack
+/// counts are exact and don't rely on reconstructing frames from `fp` afterwards.
+///
+/// A builtin instance is attributed to the call stack of the first instruction accessing one of
+/// its cells, i.e. the function writing its inputs.
+///
+/// The cells allocated by an instruction, i.e. the cells between its `ap` and the `ap` of the
+/// next instruction, belong to the frame of the function executing it. A memory hole is a cell of
+/// a frame that is never accessed by any instruction of the run, and is attributed to the call
+/// stack of that frame, e.g. locals allocated with `alloc_locals` and left unused.
+#[derive(Debug, Default)]
+pub struct CallStackProfile {
+    nodes: Vec<CallNode>,
+    steps: Vec<u64>,
+    builtins: HashMap<String, Vec<u64>>,
+    memory_holes: Vec<u64>,
+}
+
+impl CallStackProfile {
+    /// Builds the profile in a single pass over the relocated trace, decoding each executed
+    /// instruction from the relocated memory.
+    pub fn from_trace(
+        trace: &[RelocatedTraceEntry],
+        memory: &[Option<Felt252>],
+        builtin_segments: &[BuiltinSegment],
+    ) -> Self {
+        let mut profile = Self::default();
+        let Some(first) = trace.first() else {
+            return profile;
+        };
+
+        let mut children: HashMap<(usize, usize), usize> = HashMap::new();
+        let mut used_instances: Vec<Vec<bool>> = builtin_segments
+            .iter()
+            .map(|segment| {
+                vec![false; (segment.end - segment.start).div_ceil(segment.cells_per_instance)]
+            })
+            .collect();
+        // Whether each cell is accessed by an instruction, and the ranges of cells allocated by
+        // each node, in address order. Holes are only known once the whole trace is walked, as a
+        // cell can be read after its frame returned, e.g. a return value.
+        let mut accessed = vec![false; memory.len()];
+        let mut allocations: Vec<(usize, usize, usize)> = Vec::new();
+        let mut frontier = first.fp;
+        profile.nodes.push(CallNode { parent: None, pc: first.pc });
+        profile.steps.push(0);
+        let mut node = 0;
+
+        for (i, entry) in trace.iter().enumerate() {
+            profile.steps[node] += 1;
+
+            if let Some(next) = trace.get(i + 1) {
+                if next.ap > frontier {
+                    match allocations.last_mut() {
+                        Some((_, end, last)) if *last == node && *end == frontier => *end = next.ap,
+                        _ => allocations.push((frontier, next.ap, node)),
+                    }
+                    frontier = next.ap;
+                }
+            }
+
+            let Some(Some(instruction)) = memory.get(entry.pc) else {
+                continue;
+            };
+            let encoded = instruction.to_le_digits()[0];
+            let flags = encoded >> FLAGS_OFFSET;
+
+            for address in operand_addresses(entry, encoded, memory).into_iter().flatten() {
+                if let Some(cell) = accessed.get_mut(address) {
+                    *cell = true;
+                }
+                let Some((index, segment)) = builtin_segments
+                    .iter()
+                    .enumerate()
+                    .find(|(_, segment)| (segment.start..segment.end).contains(&address))
+                else {
+                    continue;
+                };
+                let instance = (address - segment.start) / segment.cells_per_instance;
+                if !used_instances[index][instance] {
+                    used_instances[index][instance] = true;
+                    let counts = profile.builtins.entry(segment.name.clone()).or_default();
+                    counts.resize(profile.nodes.len(), 0);
+                    counts[node] += 1;
+                }
+            }
+
+            if flags & OPCODE_CALL != 0 {
+                if let Some(next) = trace.get(i + 1) {
+                    node = *children.entry((node, next.pc)).or_insert_with(|| {
+                        profile.nodes.push(CallNode { parent: Some(node), pc: next.pc });
+                        profile.steps.push(0);
+                        profile.nodes.len() - 1
+                    });
+                }
+            } else if flags & OPCODE_RET != 0 {
+                node = profile.nodes[node].parent.unwrap_or(node);
+            }
+        }
+
+        profile.memory_holes = vec![0; profile.nodes.len()];
+        for (start, end, node) in allocations {
+            // Cells past the end of the memory are never written, hence never accessed.
+            let accessed_cells = accessed
+                .get(start.min(accessed.len())..end.min(accessed.len()))
+                .map_or(0, |cells| cells.iter().filter(|accessed| **accessed).count());
+            profile.memory_holes[node] += (end - start - accessed_cells) as u64;
+        }
+        profile
+    }
+
+    /// Writes the steps per call stack to `file_path` in the folded stacks format
+    /// (`frame;frame;frame count` per line), as consumed by flamegraph tools, and the builtin
+    /// instances per call stack next to it, in one `<stem>.<builtin>.folded` file per builtin.
+    /// The memory holes per call stack are written to `<stem>.memory_holes.folded`.
+    /// Frames without a name are written as `pc_<pc>`.
+    pub fn write_folded(
+        &self,
+        file_path: &Path,
+        frame_names: &HashMap<usize, String>,
+    ) -> anyhow::Result<()> {
+        let stacks = self.folded_stacks(frame_names);
+        write_folded_counts(file_path, &stacks, &self.steps)?;
+        for (builtin, counts) in &self.builtins {
+            let builtin_path = file_path.with_extension(format!("{}.folded", builtin));
+            write_folded_counts(&builtin_path, &stacks, counts)?;
+        }
+        let memory_holes_path = file_path.with_extension("memory_holes.folded");
+        write_folded_counts(&memory_holes_path, &stacks, &self.memory_holes)?;
+        Ok(())
+    }
+
+    /// Returns the folded representation of the call stack of each node.
+    fn folded_stacks(&self, frame_names: &HashMap<usize, String>) -> Vec<String> {
+        let mut stacks: Vec<String> = Vec::with_capacity(self.nodes.len());
+        // Parents are always created before their children, so their stack is already known.
+        for node in &self.nodes {
+            let frame =
+                frame_names.get(&node.pc).cloned().unwrap_or_else(|| format!("pc_{}", node.pc));
+            let stack = match node.parent {
+                Some(parent) => format!("{};{}", stacks[parent], frame),
+                None => frame,
+            };
+            stacks.push(stack);
+        }
+        stacks
+    }
+}
+
+/// Returns the memory addresses of the dst, op0 and op1 operands of an instruction.
+fn operand_addresses(
+    entry: &RelocatedTraceEntry,
+    encoded: u64,
+    memory: &[Option<Felt252>],
+) -> [Option<usize>; 3] {
+    let offset = |shift: u64| ((encoded >> shift) & 0xffff) as i64 - OFFSET_BIAS;
+    let address = |base: usize, offset: i64| usize::try_from(base as i64 + offset).ok();
+    let flags = encoded >> FLAGS_OFFSET;
+
+    let dst = address(if flags & DST_REG_FP != 0 { entry.fp } else { entry.ap }, offset(0));
+    let op0 = address(if flags & OP0_REG_FP != 0 { entry.fp } else { entry.ap }, offset(16));
+    let op1_base = if flags & OP1_SRC_IMM != 0 {
+        Some(entry.pc)
+    } else if flags & OP1_SRC_FP != 0 {
+        Some(entry.fp)
+    } else if flags & OP1_SRC_AP != 0 {
+        Some(entry.ap)
+    } else {
+        op0.and_then(|op0| memory.get(op0).cloned().flatten())
+            .and_then(|value| usize::try_from(value.to_le_digits()[0]).ok())
+    };
+    let op1 = op1_base.and_then(|base| address(base, offset(32)));
+    [dst, op0, op1]
+}
+
+/// Writes one `stack count` line per call stack with a non-zero count, sorted by stack.
+fn write_folded_counts(file_path: &Path, stacks: &[String], counts: &[u64]) -> anyhow::Result<()> {
+    let file = std::fs::File::create(file_path)
+        .map_err(|e| anyhow::anyhow!("Failed to create profile file {:?}: {}", file_path, e))?;
+    let mut writer = io::BufWriter::new(file);
+
+    // Distinct stacks can share the same folded representation (e.g. unnamed frames).
+    let mut lines = stacks
+        .iter()
+        .zip(counts.iter())
+        .filter(|(_, count)| **count > 0)
+        .fold(HashMap::<&str, u64>::new(), |mut lines, (stack, count)| {
+            *lines.entry(stack.as_str()).or_default() += count;
+            lines
+        })
+        .into_iter()
+        .collect::<Vec<_>>();
+    lines.sort();
+
+    for (stack, count) in lines {
+        writeln!(writer, "{} {}", stack, count)?;
+    }
+    writer.flush()?;
+    Ok(())
+}
+
+#[derive(Deserialize)]
+struct CompiledProgramDebugInfo {
+    debug_info: Option<DebugInfo>,
+}
+
+#[derive(Deserialize)]
+struct DebugInfo {
+    instruction_locations: HashMap<String, InstructionLocation>,
+}
+
+#[derive(Deserialize)]
+struct InstructionLocation {
+    accessible_scopes: Vec<String>,
+}
+
+/// Reads the frame names, i.e. the innermost accessible scope of each instruction, from the debug
+/// info of a compiled program, keyed by relocated pc.
+///
+/// Returns an empty map if the program was compiled without debug info.
+pub fn frame_names_from_compiled_program(
+    compiled_program_path: &Path,
+    program_base: usize,
+) -> anyhow::Result<HashMap<usize, String>> {
+    let program_json = std::fs::read_to_string(compiled_program_path).map_err(|e| {
+        anyhow::anyhow!("Failed to read compiled program {:?}: {}", compiled_program_path, e)
+    })?;
+    let compiled_program: CompiledProgramDebugInfo = sonic_rs::from_str(&program_json)
+        .map_err(|e| anyhow::anyhow!("Failed to parse program debug info: {}", e))?;
+
+    let Some(debug_info) = compiled_program.debug_info else {
+        return Ok(HashMap::new());
+    };
+    debug_info
+        .instruction_locations
+        .into_iter()
+        .filter_map(|(pc, location)| {
+            location.accessible_scopes.last().cloned().map(|scope| (pc, scope))
+        })
+        .map(|(pc, scope)| {
+            let pc: usize = pc
+                .parse()
+                .map_err(|e| anyhow::anyhow!("Invalid pc {} in debug info: {}", pc, e))?;
+            Ok((pc + program_base, scope))
+        })
+        .collect()
+}
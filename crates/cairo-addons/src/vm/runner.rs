@@ -1,8 +1,12 @@
 use super::{
-    dict_manager::PyDictManager, hints::HintProcessor, memory_segments::PyMemorySegmentManager,
+    dict_manager::PyDictManager,
+    hints::HintProcessor,
+    memory_segments::PyMemorySegmentManager,
+    profiler::{frame_names_from_compiled_program, BuiltinSegment, CallStackProfile},
     to_pyerr,
 };
 use crate::{
+    serialization::{write_serialized, SerializationFormat},
     setup_logging,
     stwo_bindings::prove_with_stwo,
     vm::{
@@ -36,11 +40,12 @@ use pyo3::{
 use pyo3_polars::PyDataFrame;
 use std::{
     cell::RefCell,
-    collections::HashMap,
+    collections::{BTreeMap, HashMap},
     ffi::CString,
     io::{self, Write},
     path::{Path, PathBuf},
     rc::Rc,
+    time::Instant,
 };
 use stwo_cairo_adapter::{
     builtins::MemorySegmentAddresses,
@@ -72,6 +77,14 @@ pub struct PyCairoRunner {
     /// Whether to enable execution of hints containing logger.
     enable_traces: bool,
     output_path: Option<PathBuf>,
+    /// The layout the runner was created with, used to re-create the runner on `reset`.
+    layout: LayoutName,
+    /// A copy of the Python context as prepared by `prepare_context`, without any run-specific
+    /// data. Used to start every reused run from a pristine context.
+    context_template: Py<PyDict>,
+    /// The hint processor of the previous run, kept to avoid re-registering all hints when the
+    /// runner is reused.
+    hint_processor: Option<HintProcessor>,
 }
 
 #[pymethods]
@@ -120,7 +133,7 @@ impl PyCairoRunner {
 
         // Initialize a python context object that will be accessible throughout the execution of
         // all hints, but only load identifiers if logger is enabled
-        Python::with_gil(|py| {
+        let context_template = Python::with_gil(|py| {
             let context = PyDict::new(py);
 
             let identifiers = program
@@ -176,14 +189,87 @@ except Exception as e:
                 ))
             })?;
 
+            // Keep a copy of the prepared context, without the run-specific program input, to be
+            // able to reset the runner without preparing the context again.
+            let context_template = context.copy()?;
+            if context_template.contains("program_input")? {
+                context_template.del_item("program_input")?;
+            }
+
             // Store the context object in the exec_scopes regardless of logger status
             // This ensures the pythonic hint executor has a context to work with
             let unbounded_context: Py<PyDict> = context.into_py_dict(py)?.into();
             inner.exec_scopes.insert_value("__context__", unbounded_context);
+            Ok::<Py<PyDict>, PyErr>(context_template.unbind())
+        })?;
+
+        Ok(Self {
+            inner,
+            allow_missing_builtins,
+            return_data_info,
+            enable_traces,
+            output_path,
+            layout,
+            context_template,
+            hint_processor: None,
+        })
+    }
+
+    /// Resets the runner so that it can be reused for another run of the same program.
+    ///
+    /// The underlying Rust runner is re-created, which gives fresh memory segments, builtin
+    /// runners, trace and dict manager. The program identifiers, the prepared Python context and
+    /// the hint processor are kept from the previous run, so that reusing a runner skips the
+    /// costly `prepare_context` initialization and hint registration.
+    ///
+    /// # Arguments
+    /// * `program_input` - The input of the next run, exposed to hints as `program_input`.
+    /// * `return_data_info` - The return_data information of the next entrypoint.
+    /// * `output_path` - The output path of the next run.
+    #[pyo3(signature = (program_input=None, return_data_info=vec![], output_path=None))]
+    fn reset(
+        &mut self,
+        program_input: Option<PyObject>,
+        return_data_info: Vec<(String, Option<usize>)>,
+        output_path: Option<PathBuf>,
+    ) -> PyResult<()> {
+        let program = self.inner.get_program().clone();
+        let proof_mode = self.inner.is_proof_mode();
+        let mut inner = RustCairoRunner::new(
+            &program,
+            self.layout,
+            None, // dynamic_layout_params
+            proof_mode,
+            true,       // trace_enabled
+            proof_mode, // disable_trace_padding can only be used in proof_mode
+        )
+        .map_err(|e| PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(e.to_string()))?;
+
+        let dict_manager = DictManager::new();
+        inner.exec_scopes.insert_value("dict_manager", Rc::new(RefCell::new(dict_manager)));
+
+        // Move the identifiers collected in `new` instead of collecting them again.
+        if let Some(identifiers) = self.inner.exec_scopes.data[0].remove("__program_identifiers__")
+        {
+            inner.exec_scopes.data[0].insert("__program_identifiers__".to_string(), identifiers);
+        }
+
+        Python::with_gil(|py| {
+            // Hints run with the context as globals: start from a copy of the template so that
+            // variables set by the hints of the previous run do not leak into this one.
+            let context = self.context_template.bind(py).copy()?;
+            if let Some(program_input) = program_input {
+                context.set_item("program_input", program_input)?;
+            }
+            let unbounded_context: Py<PyDict> = context.unbind();
+            inner.exec_scopes.insert_value("__context__", unbounded_context);
             Ok::<(), PyErr>(())
         })?;
 
-        Ok(Self { inner, allow_missing_builtins, return_data_info, enable_traces, output_path })
+        self.inner = inner;
+        self.return_data_info = return_data_info;
+        self.output_path = output_path;
+        Ok(())
     }
 
     /// Initializes the runner's segments, including program_base, execution_base, and all builtins.
@@ -322,6 +408,16 @@ except Exception as e:
         Ok(PyDictManager { inner: dict_manager })
     }
 
+    /// The number of executions of each hint without a native implementation in the last run,
+    /// keyed by hint code.
+    #[getter]
+    fn non_native_hint_counts(&self) -> HashMap<String, usize> {
+        self.hint_processor
+            .as_ref()
+            .map(|hint_processor| hint_processor.non_native_hint_counts().clone())
+            .unwrap_or_default()
+    }
+
     /// Returns a dictionary of builtin runners with their state information.
     /// For each builtin, includes whether it's included in the program, its base address,
     /// name, initial stack, and final stack (for unused builtins).
@@ -377,17 +473,29 @@ except Exception as e:
     /// 0` until the steps is a power of 2.
     #[pyo3(signature = (address, resources))]
     fn run_until_pc(&mut self, address: PyRelocatable, resources: PyRunResources) -> PyResult<()> {
-        let mut hint_processor = HintProcessor::default()
-            .with_run_resources(resources.inner)
-            .with_dynamic_python_hints(self.enable_traces)
-            .build();
-        self.inner
+        // Reuse the hint processor of a previous run if any, only swapping the run resources.
+        let mut hint_processor = match self.hint_processor.take() {
+            Some(hint_processor) => hint_processor.with_run_resources(resources.inner),
+            None => HintProcessor::default()
+                .with_run_resources(resources.inner)
+                .with_dynamic_python_hints(self.enable_traces)
+                .build(),
+        };
+        let run_result = self
+            .inner
             .run_until_pc(address.inner, &mut hint_processor)
             .map_err(|e| VmException::from_vm_error(&self.inner, e))
-            .map_err(|e| PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(e.to_string()))?;
-        self.inner
+            .map_err(|e| PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(e.to_string()));
+        if let Err(e) = run_result {
+            self.hint_processor = Some(hint_processor);
+            return Err(e);
+        }
+        let end_result = self
+            .inner
             .end_run(false, false, &mut hint_processor, false)
-            .map_err(|e| PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(e.to_string()))?;
+            .map_err(|e| PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(e.to_string()));
+        self.hint_processor = Some(hint_processor);
+        end_result?;
 
         if self.inner.is_proof_mode() {
             if let Some(output_path) = &self.output_path {
@@ -467,6 +575,23 @@ except Exception as e:
         Ok(())
     }
 
+    /// Writes the number of steps spent in each call stack of the run to `path`, in the folded
+    /// stacks format consumed by flamegraph tools, and the builtin instances used by each call
+    /// stack next to it, in one `<stem>.<builtin>.folded` file per builtin. The memory holes left
+    /// in the frames of each call stack are written to `<stem>.memory_holes.folded`.
+    ///
+    /// The call stacks are built natively from the relocated trace and memory, without going
+    /// through `trace_df`. Frames are named after `frame_names` (relocated pc of the function
+    /// entry to name), falling back to `pc_<pc>`. Requires the runner to be relocated.
+    #[pyo3(signature = (path, frame_names=HashMap::new()))]
+    fn write_call_stack_profile(
+        &self,
+        path: PathBuf,
+        frame_names: HashMap<usize, String>,
+    ) -> PyResult<()> {
+        write_call_stack_profile(&self.inner, &path, &frame_names).map_err(to_pyerr)
+    }
+
     /// Returns the execution trace as a Polars DataFrame.
     /// The DataFrame contains columns for pc, ap, and fp values at each step.
     #[getter]
@@ -696,7 +821,24 @@ except Exception as e:
 }
 
 /// Generate trace and related artifacts from program input.
+///
+/// When `columnar_trace` is set, the relocated trace is also written as a columnar (Parquet) file
+/// next to the output, which can be scanned lazily by the profiler without loading the whole
+/// trace in memory.
+///
+/// When `profile` is set, the steps spent in each call stack are written next to the output in the
+/// folded stacks format, with frames named from the debug info of the compiled program.
+///
+/// The prover input is written in `prover_input_format`: `json`, `binary` or `binary-zstd`.
+///
+/// If `hint_coverage` is set, the number of executions of each hint without a native
+/// implementation, which are executed as Python, is written as JSON next to the prover input.
+///
+/// Returns the execution resources of the run: `n_steps`, `n_memory_holes` and the number of
+/// instances of each builtin, keyed by builtin name.
 #[pyfunction]
+#[pyo3(signature = (entrypoint, program_input, compiled_program_path, output_path, output_trace_components, cairo_pie, columnar_trace=false, profile=false, prover_input_format="json", hint_coverage=false))]
+#[allow(clippy::too_many_arguments)]
 pub fn generate_trace(
     entrypoint: String,
     program_input: PyObject,
@@ -704,7 +846,14 @@ pub fn generate_trace(
     output_path: PathBuf,
     output_trace_components: bool,
     cairo_pie: bool,
-) -> PyResult<()> {
+    columnar_trace: bool,
+    profile: bool,
+    prover_input_format: &str,
+    hint_coverage: bool,
+) -> PyResult<HashMap<String, usize>> {
+    let prover_input_format: SerializationFormat = prover_input_format.parse().map_err(to_pyerr)?;
+    #[cfg(feature = "dhat-heap")]
+    let _profiler = dhat::Profiler::new_heap();
     setup_logging().map_err(|e| {
         PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(format!("Failed to setup logging: {}", e))
     })?;
@@ -720,6 +869,7 @@ pub fn generate_trace(
     let run_span = tracing::span!(tracing::Level::INFO, "cairo_run_program");
     let _run_span_guard = run_span.enter();
     let mut hint_processor = HintProcessor::default().with_dynamic_python_hints(false).build();
+    let run_start = Instant::now();
     let cairo_runner = match cairo_run::cairo_run_program_with_initial_scope(
         &program,
         &cairo_run_config,
@@ -732,11 +882,13 @@ pub fn generate_trace(
             panic!("Failed to run block, exiting");
         }
     };
+    let run_duration = run_start.elapsed();
     drop(_run_span_guard);
 
     let execution_resources = cairo_runner.get_execution_resources().unwrap();
     tracing::info!(
         n_steps = execution_resources.n_steps,
+        steps_per_second = execution_resources.n_steps as f64 / run_duration.as_secs_f64(),
         n_memory_holes = execution_resources.n_memory_holes,
         builtin_output = execution_resources
             .builtin_instance_counter
@@ -780,6 +932,13 @@ pub fn generate_trace(
             .unwrap_or(0),
         "Execution resources"
     );
+    let mut resources: HashMap<String, usize> = execution_resources
+        .builtin_instance_counter
+        .iter()
+        .map(|(name, count)| (name.to_str().to_string(), *count))
+        .collect();
+    resources.insert("n_steps".to_string(), execution_resources.n_steps);
+    resources.insert("n_memory_holes".to_string(), execution_resources.n_memory_holes);
 
     // Create output directory if needed
     if let Some(parent) = output_path.parent() {
@@ -817,10 +976,6 @@ pub fn generate_trace(
                 e
             ))
         })?;
-    } else {
-        // Output prover input info
-        let prover_input_info = prover_input_from_runner(&cairo_runner_mut);
-        std::fs::write(&output_path, sonic_rs::to_string_pretty(&prover_input_info).unwrap())?;
     }
 
     if output_trace_components {
@@ -845,11 +1000,54 @@ pub fn generate_trace(
         )
         .map_err(to_pyerr)?;
     }
-    Ok(())
+
+    if columnar_trace {
+        write_columnar_trace(
+            &cairo_runner_mut,
+            &output_path.with_extension("trace.parquet"),
+            COLUMNAR_TRACE_CHUNK_SIZE,
+        )
+        .map_err(to_pyerr)?;
+    }
+
+    if profile {
+        // The program segment is relocated right after the reserved first memory cell.
+        let frame_names = frame_names_from_compiled_program(Path::new(&compiled_program_path), 1)
+            .map_err(to_pyerr)?;
+        if frame_names.is_empty() {
+            tracing::warn!("Compiled program has no debug info, profile frames are named by pc");
+        }
+        write_call_stack_profile(
+            &cairo_runner_mut,
+            &output_path.with_extension("folded"),
+            &frame_names,
+        )
+        .map_err(to_pyerr)?;
+    }
+
+    if !cairo_pie {
+        // Output prover input info. This consumes the runner, so it must come after all the
+        // outputs reading from it.
+        let prover_input_info = prover_input_from_runner(cairo_runner_mut);
+        write_serialized(&prover_input_info, &output_path, prover_input_format)
+            .map_err(to_pyerr)?;
+    }
+
+    if hint_coverage {
+        let hint_counts: BTreeMap<_, _> = hint_processor.non_native_hint_counts().iter().collect();
+        write_serialized(
+            &hint_counts,
+            &output_path.with_extension("hint_coverage.json"),
+            SerializationFormat::Json,
+        )
+        .map_err(to_pyerr)?;
+    }
+    Ok(resources)
 }
 
 /// Run the full trace-generation, proving and verification pipeline
 #[pyfunction]
+#[pyo3(signature = (entrypoint, program_input, compiled_program_path, proof_path, serde_cairo, verify, proof_format="json"))]
 pub fn run_end_to_end(
     entrypoint: String,
     program_input: PyObject,
@@ -857,7 +1055,9 @@ pub fn run_end_to_end(
     proof_path: PathBuf,
     serde_cairo: bool,
     verify: bool,
+    proof_format: &str,
 ) -> PyResult<()> {
+    let proof_format: SerializationFormat = proof_format.parse().map_err(to_pyerr)?;
     #[cfg(feature = "dhat-heap")]
     let _profiler = dhat::Profiler::new_heap();
 
@@ -872,6 +1072,7 @@ pub fn run_end_to_end(
         prepare_cairo_execution(&entrypoint, program_input, &compiled_program_path, true, false)?;
 
     let mut hint_processor = HintProcessor::default().with_dynamic_python_hints(false).build();
+    let run_start = Instant::now();
     let mut cairo_runner = match cairo_run::cairo_run_program_with_initial_scope(
         &program,
         &run_config,
@@ -884,11 +1085,13 @@ pub fn run_end_to_end(
             panic!("Failed to run block, exiting");
         }
     };
+    let run_duration = run_start.elapsed();
     drop(_run_span_guard);
 
     let execution_resources = cairo_runner.get_execution_resources().unwrap();
     tracing::info!(
         n_steps = execution_resources.n_steps,
+        steps_per_second = execution_resources.n_steps as f64 / run_duration.as_secs_f64(),
         n_memory_holes = execution_resources.n_memory_holes,
         builtin_output = execution_resources
             .builtin_instance_counter
@@ -939,9 +1142,9 @@ pub fn run_end_to_end(
     let run_output_path = proof_path.with_file_name("run_output.txt");
     std::fs::write(run_output_path, output_buffer)?;
 
-    let cairo_input = prover_input_from_runner(&cairo_runner);
+    let cairo_input = prover_input_from_runner(cairo_runner);
 
-    prove_with_stwo(cairo_input, proof_path, serde_cairo, verify).map_err(to_pyerr)
+    prove_with_stwo(cairo_input, proof_path, serde_cairo, proof_format, verify).map_err(to_pyerr)
 }
 
 /// Writes the execution trace to a binary file.
@@ -960,6 +1163,80 @@ fn write_binary_trace(cairo_runner: &RustCairoRunner, file_path: &PathBuf) -> an
     }
 }
 
+/// Writes the call-stack profile of a relocated run: the steps per call stack to `file_path`, and
+/// the builtin instances and memory holes per call stack next to it.
+fn write_call_stack_profile(
+    cairo_runner: &RustCairoRunner,
+    file_path: &Path,
+    frame_names: &HashMap<usize, String>,
+) -> anyhow::Result<()> {
+    let relocation_table = cairo_runner
+        .vm
+        .segments
+        .relocate_segments()
+        .map_err(|e| anyhow::anyhow!("Failed to relocate segments: {}", e))?;
+    let builtin_segments = cairo_runner
+        .vm
+        .builtin_runners
+        .iter()
+        .filter_map(|builtin_runner| {
+            let segment_index = builtin_runner.base();
+            let start = *relocation_table.get(segment_index)?;
+            let size = cairo_runner.vm.segments.get_segment_used_size(segment_index)?;
+            Some(BuiltinSegment {
+                name: builtin_runner.name().to_str().to_string(),
+                start,
+                end: start + size,
+                cells_per_instance: builtin_runner.cells_per_instance() as usize,
+            })
+        })
+        .collect::<Vec<_>>();
+
+    let relocated_trace = cairo_runner.relocated_trace.as_deref().unwrap_or_default();
+    CallStackProfile::from_trace(relocated_trace, &cairo_runner.relocated_memory, &builtin_segments)
+        .write_folded(file_path, frame_names)
+}
+
+/// Number of trace entries written per row group of the columnar trace.
+const COLUMNAR_TRACE_CHUNK_SIZE: usize = 1 << 20;
+
+/// Writes the relocated execution trace to a Parquet file with `pc`, `ap` and `fp` columns.
+/// The trace is written in row groups of `chunk_size` entries, so that only one chunk is
+/// materialized as a DataFrame at a time and readers can scan the file lazily.
+fn write_columnar_trace(
+    cairo_runner: &RustCairoRunner,
+    file_path: &PathBuf,
+    chunk_size: usize,
+) -> anyhow::Result<()> {
+    let trace_entries = cairo_runner
+        .relocated_trace
+        .as_ref()
+        .ok_or_else(|| anyhow::anyhow!("No relocated trace available"))?;
+    let trace_file = std::fs::File::create(file_path)
+        .map_err(|e| anyhow::anyhow!("Failed to create trace file {:?}: {}", file_path, e))?;
+    let schema = Schema::from_iter([
+        Field::new("pc".into(), DataType::UInt64),
+        Field::new("ap".into(), DataType::UInt64),
+        Field::new("fp".into(), DataType::UInt64),
+    ]);
+    let mut writer = ParquetWriter::new(io::BufWriter::with_capacity(3 * 1024 * 1024, trace_file))
+        .batched(&schema)
+        .map_err(|e| anyhow::anyhow!("Failed to create Parquet writer: {}", e))?;
+
+    for chunk in trace_entries.chunks(chunk_size.max(1)) {
+        let df = df!(
+            "pc" => chunk.iter().map(|entry| entry.pc as u64).collect::<Vec<_>>(),
+            "ap" => chunk.iter().map(|entry| entry.ap as u64).collect::<Vec<_>>(),
+            "fp" => chunk.iter().map(|entry| entry.fp as u64).collect::<Vec<_>>()
+        )?;
+        writer
+            .write_batch(&df)
+            .map_err(|e| anyhow::anyhow!("Failed to write trace chunk: {}", e))?;
+    }
+    writer.finish().map_err(|e| anyhow::anyhow!("Failed to finish Parquet trace: {}", e))?;
+    Ok(())
+}
+
 /// Writes the memory contents to a binary file.
 /// Used in proof mode to generate input for the prover.
 fn write_binary_memory(
@@ -1058,32 +1335,41 @@ impl FileWriter {
 // Note: this should be imported from `cairo-prove` - but due to stwo version conflicts, we
 // re-define it here. Using `adapter(runner) -> ProverInput` is also not working due to bad memory
 // conversions.
-pub fn prover_input_from_runner(runner: &RustCairoRunner) -> ProverInput {
-    let public_input = runner.get_air_public_input().unwrap();
-    let addresses =
-        public_input.public_memory.iter().map(|entry| entry.address as u32).collect::<Vec<_>>();
-    let segments = public_input
-        .memory_segments
-        .iter()
-        .map(|(&k, v)| {
-            (k, MemorySegmentAddresses { begin_addr: v.begin_addr, stop_ptr: v.stop_ptr })
-        })
-        .collect::<HashMap<_, _>>();
-    let trace = runner
-        .relocated_trace
-        .as_ref()
-        .unwrap()
-        .iter()
+//
+// The runner is consumed: the relocated trace and memory are moved out of it and the runner is
+// dropped before the prover input is built, so that the VM memory, the trace and their relocated
+// copies are not all alive at the same time as the adapted input.
+pub fn prover_input_from_runner(mut runner: RustCairoRunner) -> ProverInput {
+    let (addresses, segments) = {
+        let public_input = runner.get_air_public_input().unwrap();
+        let addresses =
+            public_input.public_memory.iter().map(|entry| entry.address as u32).collect::<Vec<_>>();
+        let segments = public_input
+            .memory_segments
+            .iter()
+            .map(|(&k, v)| {
+                (k, MemorySegmentAddresses { begin_addr: v.begin_addr, stop_ptr: v.stop_ptr })
+            })
+            .collect::<HashMap<_, _>>();
+        (addresses, segments)
+    };
+    let main_args = runner.get_program().iter_builtins().copied().collect::<Vec<_>>();
+    let relocated_trace = runner.relocated_trace.take().unwrap();
+    let relocated_memory = std::mem::take(&mut runner.relocated_memory);
+    drop(runner);
+
+    // Both entry types have the same layout, so the conversion reuses the trace allocation.
+    let trace = relocated_trace
+        .into_iter()
         .map(|x| RelocatedTraceEntry { ap: x.ap, fp: x.fp, pc: x.pc })
         .collect::<Vec<_>>();
-    let mem = runner.relocated_memory.iter().enumerate().filter_map(|(i, x)| {
-        x.as_ref().map(|value| MemoryEntry {
+    let mem = relocated_memory.into_iter().enumerate().filter_map(|(i, x)| {
+        x.map(|value| MemoryEntry {
             address: i as u64,
             value: unsafe { std::mem::transmute::<[u8; 32], [u32; 8]>(value.to_bytes_le()) },
         })
     });
     let mem = MemoryBuilder::from_iter(MemoryConfig::default(), mem);
-    let main_args = runner.get_program().iter_builtins().copied().collect::<Vec<_>>();
 
     let main_args_slice: &[BuiltinName] = &main_args;
     let public_segment_context = PublicSegmentContext::new(main_args_slice);
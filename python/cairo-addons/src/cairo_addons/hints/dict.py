@@ -92,6 +92,23 @@ def merge_dict_tracker_with_parent(
     parent_dict_tracker.data.update(current_dict_tracker.data)
 
 
+@register_hint
+def move_dict_tracker_to_parent(
+    dict_manager: DictManager,
+    ids: VmConsts,
+):
+    from collections import defaultdict
+
+    current_dict_tracker = dict_manager.get_tracker(ids.dict_ptr)
+    parent_dict_tracker = dict_manager.get_tracker(ids.parent_dict_end)
+    # The current dict is a fork of the parent holding the parent's data plus its own writes.
+    data = current_dict_tracker.data
+    parent_dict_tracker.data = data
+    current_dict_tracker.data = (
+        defaultdict(data.default_factory) if isinstance(data, defaultdict) else {}
+    )
+
+
 @register_hint
 def update_dict_tracker(
     dict_manager: DictManager,
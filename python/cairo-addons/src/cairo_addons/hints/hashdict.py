@@ -8,8 +8,6 @@ from cairo_addons.hints.decorator import register_hint
 
 @register_hint
 def hashdict_read(dict_manager: DictManager, ids: VmConsts, memory: MemoryDict):
-    from cairo_addons.rust_bindings.vm import blake2s_hash_many
-
     dict_tracker = dict_manager.get_tracker(ids.dict_ptr)
     dict_tracker.current_ptr += ids.DictAccess.SIZE
     preimage = tuple([memory[ids.key + i] for i in range(ids.key_len)])
@@ -20,7 +18,8 @@ def hashdict_read(dict_manager: DictManager, ids: VmConsts, memory: MemoryDict):
     else:
         ids.value = dict_tracker.data.default_factory()
 
-    hashed_key = blake2s_hash_many(preimage) if len(preimage) != 1 else preimage[0]
+    # Compound keys were already hashed by the Cairo caller.
+    hashed_key = ids.felt_key if len(preimage) != 1 else preimage[0]
     dict_manager.preimages[hashed_key] = preimage
 
 
@@ -42,8 +41,6 @@ def hashdict_read_from_key(
 
 @register_hint
 def hashdict_write(dict_manager: DictManager, ids: VmConsts, memory: MemoryDict):
-    from cairo_addons.rust_bindings.vm import blake2s_hash_many
-
     dict_tracker = dict_manager.get_tracker(ids.dict_ptr)
     dict_tracker.current_ptr += ids.DictAccess.SIZE
     preimage = tuple([memory[ids.key + i] for i in range(ids.key_len)])
@@ -54,7 +51,8 @@ def hashdict_write(dict_manager: DictManager, ids: VmConsts, memory: MemoryDict)
         ids.dict_ptr.prev_value = dict_tracker.data.default_factory()
     dict_tracker.data[preimage] = ids.new_value
 
-    hashed_key = blake2s_hash_many(preimage) if len(preimage) != 1 else preimage[0]
+    # Compound keys were already hashed by the Cairo caller.
+    hashed_key = ids.felt_key if len(preimage) != 1 else preimage[0]
     dict_manager.preimages[hashed_key] = preimage
 
 
@@ -63,31 +61,6 @@ def get_default_value(dict_manager: DictManager, ids: VmConsts):
     ids.default_value = dict_manager.get_tracker(ids.dict_ptr).data.default_factory()
 
 
-@register_hint
-def get_storage_keys_for_address(
-    dict_manager: DictManager,
-    ids: VmConsts,
-    segments: MemorySegmentManager,
-    memory: MemoryDict,
-):
-    dict_tracker = dict_manager.get_tracker(ids.dict_ptr)
-    prefix = tuple([memory[ids.prefix + i] for i in range(ids.prefix_len)])
-    matching_preimages = [
-        key
-        for key, value in dict_tracker.data.items()
-        if key[: len(prefix)] == prefix and value != 0
-    ]
-    base = segments.add()
-    for i, preimage in enumerate(matching_preimages):
-        ptr = segments.add()
-        bytes32_base = segments.add()
-        segments.load_data(bytes32_base, preimage[1:])
-        segments.load_data(ptr, [preimage[0], bytes32_base])
-        memory[base + i] = ptr
-    ids.keys_len = len(matching_preimages)
-    ids.keys = base
-
-
 def get_preimage_for_key(
     dict_manager: DictManager, ids: VmConsts, segments: MemorySegmentManager
 ):
@@ -16,14 +16,16 @@ def main_inputs(ids: VmConsts, program_input: dict, gen_arg: Callable):
     from ethereum.prague.fork_types import Address
     from ethereum.prague.trie import InternalNode
     from ethereum_rlp import Extended
-    from ethereum_types.bytes import Bytes, Bytes32
+    from ethereum_types.bytes import Bytes32
+
+    from keth_types.types import NodeStore
 
     # Program inputs for STF function
     ids.chain = gen_arg(BlockChain, program_input["blockchain"])
     ids.block = gen_arg(Block, program_input["block"])
 
     # Program inputs for Trie diffs
-    ids.node_store = gen_arg(Mapping[Hash32, Bytes], program_input["node_store"])
+    ids.node_store = gen_arg(NodeStore, program_input["node_store"])
     ids.address_preimages = gen_arg(
         Mapping[Hash32, Address], program_input["address_preimages"]
     )
@@ -101,12 +103,12 @@ def aggregator_inputs(
     memory: MemoryDict,
     gen_arg: Callable,
 ):
-    from typing import Mapping, Optional, Union
+    from typing import Optional, Union
 
-    from ethereum.crypto.hash import Hash32
     from ethereum.prague.trie import InternalNode
     from ethereum_rlp import Extended
-    from ethereum_types.bytes import Bytes
+
+    from keth_types.types import NodeStore
 
     # Python hint to load data from program_input
     # Assuming program_input is a dict as described in the design doc:
@@ -127,7 +129,7 @@ def aggregator_inputs(
     ids.mpt_diff_program_hash = keth_hashes.get("mpt_diff", keth_hashes["teardown"])
     ids.left_mpt = gen_arg(Optional[Union[InternalNode, Extended]], left_mpt)
     ids.right_mpt = gen_arg(Optional[Union[InternalNode, Extended]], right_mpt)
-    ids.node_store = gen_arg(Mapping[Hash32, Bytes], node_store)
+    ids.node_store = gen_arg(NodeStore, node_store)
 
     # Allocate memory for the serialized outputs and get pointers
     ids.serialized_init_output = segments.gen_arg(keth_outputs_list[0])
@@ -163,13 +165,13 @@ def mpt_diff_inputs(ids: VmConsts, program_input: dict, gen_arg: Callable):
     from ethereum.prague.fork_types import Address
     from ethereum.prague.trie import InternalNode
     from ethereum_rlp import Extended
-    from ethereum_types.bytes import Bytes, Bytes32
+    from ethereum_types.bytes import Bytes32
 
-    from keth_types.types import AddressAccountDiffEntry, StorageDiffEntry
+    from keth_types.types import AddressAccountDiffEntry, NodeStore, StorageDiffEntry
 
     # Map of field names to their types and attribute names
     field_mappings = [
-        ("node_store", Mapping[Hash32, Bytes], "node_store"),
+        ("node_store", NodeStore, "node_store"),
         ("address_preimages", Mapping[Hash32, Address], "address_preimages"),
         ("storage_key_preimages", Mapping[Hash32, Bytes32], "storage_key_preimages"),
         ("post_state_root", Optional[Union[InternalNode, Extended]], "post_state_root"),
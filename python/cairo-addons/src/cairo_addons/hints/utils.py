@@ -154,6 +154,20 @@ def jumpdest_continue_no_push_case(
     ids.cond = 0 if ids.offset > 32 or ids.valid_jumpdest.key < ids.offset else 1
 
 
+@register_hint
+def frame_dict_jumpdests_len(ids: VmConsts, memory: MemoryDict):
+    # The jump destinations are the keys of the squashed frame dict below 2**128.
+    n_accesses = (ids.squashed_end.address_ - ids.squashed_start.address_) // 3
+    ids.n_jumpdests = next(
+        (
+            i
+            for i in range(n_accesses)
+            if memory[ids.squashed_start.address_ + 3 * i] >= 2**128
+        ),
+        n_accesses,
+    )
+
+
 @register_hint
 def compare_relocatable_segment_index(ids: VmConsts):
     ids.segment_equal = 1 if ids.lhs.segment_index == ids.rhs.segment_index else 0
@@ -1,5 +1,7 @@
 import logging
+from pathlib import Path
 from time import perf_counter
+from typing import Dict, Tuple, Union
 
 import polars as pl
 from starkware.cairo.lang.compiler.program import Program
@@ -7,11 +9,89 @@ from starkware.cairo.lang.compiler.program import Program
 logging.basicConfig(format="%(levelname)-8s %(message)s")
 logger = logging.getLogger("timer")
 
+# Number of trace rows loaded in memory at once when reducing the trace.
+TRACE_CHUNK_SIZE = 10_000_000
 
-def profile_from_trace(program: Program, trace: pl.DataFrame, program_base: int):
+
+def _reduce_trace(
+    trace: pl.LazyFrame, chunk_size: int
+) -> Tuple[pl.DataFrame, pl.DataFrame]:
+    """
+    Reduce the trace to the run-length encoding of `fp` and to the first `pc` of each `fp`,
+    loading at most `chunk_size` rows in memory at once.
+
+    Both outputs have one row per function call (or return), which is orders of magnitude
+    smaller than the trace itself.
+    """
+    n_rows = trace.select(pl.len()).collect().item()
+    runs = []
+    first_pcs = []
+    for offset in range(0, n_rows, chunk_size):
+        chunk = trace.slice(offset, chunk_size).select(["fp", "pc"]).collect()
+        runs.append(chunk["fp"].rle().struct.unnest())
+        first_pcs.append(chunk.unique(subset=["fp"], keep="first", maintain_order=True))
+
+    if not runs:
+        return (
+            pl.DataFrame(schema=[("len", pl.UInt64), ("value", pl.UInt64)]),
+            pl.DataFrame(schema=[("fp", pl.UInt64), ("pc", pl.UInt64)]),
+        )
+
+    # A run spanning a chunk boundary is split in two: merge consecutive runs of the same fp.
+    fp_runs = (
+        pl.concat(runs)
+        .with_columns(
+            run_id=(pl.col("value") != pl.col("value").shift())
+            .fill_null(True)
+            .cum_sum()
+        )
+        .group_by("run_id", maintain_order=True)
+        .agg(
+            len=pl.col("len").cast(pl.UInt64).sum(),
+            value=pl.col("value").first(),
+        )
+        .drop("run_id")
+    )
+    fp_to_first_pc = pl.concat(first_pcs).unique(
+        subset=["fp"], keep="first", maintain_order=True
+    )
+    return fp_runs, fp_to_first_pc
+
+
+def frame_names(program: Program, program_base: int) -> Dict[int, str]:
+    """
+    Map each (relocated) pc of the program to the innermost scope it belongs to, used to name
+    the frames of a call-stack profile.
+    """
     if program.debug_info is None:
         raise ValueError("Program debug info is not available")
 
+    return {
+        pc + program_base: str(instruction_location.accessible_scopes[-1])
+        for pc, instruction_location in program.debug_info.instruction_locations.items()
+        if instruction_location.accessible_scopes
+    }
+
+
+def profile_from_trace(
+    program: Program,
+    trace: Union[pl.DataFrame, pl.LazyFrame, str, Path],
+    program_base: int,
+    chunk_size: int = TRACE_CHUNK_SIZE,
+):
+    """
+    Profile a run from its relocated (pc, ap, fp) trace.
+
+    The trace is either an in-memory DataFrame, a LazyFrame, or the path to a columnar trace file
+    (as written by `generate_trace` with `columnar_trace=True`), which is scanned lazily so that
+    traces larger than the available memory can be profiled.
+    """
+    if program.debug_info is None:
+        raise ValueError("Program debug info is not available")
+
+    if isinstance(trace, (str, Path)):
+        trace = pl.scan_parquet(trace)
+
     logger.info("Begin profiling")
     start = perf_counter()
 
@@ -42,19 +122,17 @@ def profile_from_trace(program: Program, trace: pl.DataFrame, program_base: int)
 
     # --- Step 2: Reduce Trace Size Before Joining ---
     # Since fp is constant across many pcs within a function call, select unique fp-pc pairs
-    # This reduces the trace from potentially millions of rows to the number of function calls only
-    fp_to_first_pc = (
-        trace.lazy()
-        .select(["fp", "pc"])
-        .unique(
-            subset=["fp"], keep="first"
-        )  # Take first pc for each fp; all pcs per fp share the same scope
-    )
+    # (all pcs per fp share the same scope) and run-length encode fp.
+    # This reduces the trace from potentially millions of rows to the number of function calls only,
+    # processing the trace chunk by chunk so that it never has to be fully loaded in memory.
+    fp_runs, fp_to_first_pc = _reduce_trace(trace.lazy(), chunk_size)
 
     # --- Step 3: Join to Build Debug Info per fp ---
     # Join reduced trace with debug info on pc to map each fp to its scope and source info
     debug_info = (
-        fp_to_first_pc.join(
+        fp_to_first_pc.lazy()
+        .with_columns(pl.col("pc").cast(pl.Int64))
+        .join(
             debug_info_pc, on="pc", how="left"
         )  # All remaining pcs are supposed to be in debug_info_pc
         .drop("pc")  # Drop pc immediately as it's no longer needed
@@ -63,11 +141,9 @@ def profile_from_trace(program: Program, trace: pl.DataFrame, program_base: int)
 
     # --- Step 4: Analyze Frames ---
     # Compute frame statistics using run-length encoding to identify consecutive fp sequences
+    # fp_runs: sequences of consecutive fps, len (sequence length) and value (fp)
     frames = (
-        trace["fp"]
-        .rle()  # Run-length encode fp to get sequences of consecutive fps
-        .struct.unnest()  # Unnest into len (sequence length) and value (fp)
-        .rename({"value": "fp"})
+        fp_runs.rename({"value": "fp"})
         .with_columns(
             prev_fp=pl.col("fp").shift(),  # Previous fp for parent identification
             steps=pl.col("len").cum_sum(),  # Cumulative steps up to each sequence
@@ -25,6 +25,7 @@ from cairo_addons.testing.caching import (
     CACHED_TESTS_FILE,
     CAIRO_DIR_TIMESTAMP_FILE,
     HASH_DIR,
+    NON_NATIVE_HINTS_FILE,
     file_hash,
     get_dump_path,
     has_cairo_dir_changed,
@@ -112,6 +113,18 @@ def pytest_addoption(parser):
         default=False,
         help="Do not collect coverage",
     )
+    parser.addoption(
+        "--warm-runner",
+        action="store_true",
+        default=False,
+        help="Reuse one Rust VM runner per program and builtins in each worker, resetting it between runs",
+    )
+    parser.addoption(
+        "--hint-coverage",
+        action="store_true",
+        default=False,
+        help="Report the hints executed without a native implementation in the Rust VM, and fail if any",
+    )
 
 
 @pytest.fixture(autouse=True, scope="session")
@@ -126,6 +139,8 @@ def seed(request):
 
 def pytest_sessionstart(session):
     session.results = dict()
+    # Executions of each hint without a native implementation, keyed by hint code
+    session.non_native_hints = dict()
     session.build_dir = BUILD_DIR
     session.hash_dir = HASH_DIR
 
@@ -146,7 +161,53 @@ def pytest_sessionstart(session):
         shutil.rmtree(session.hash_dir, ignore_errors=True)
 
 
+def report_non_native_hints(session):
+    """
+    Report the hints executed as Python code by the Rust VM during the session, with their number
+    of executions, and fail the session if any.
+
+    Workers store their counts in the cache, and the controller aggregates them.
+    """
+    if xdist.is_xdist_worker(session):
+        worker_id = xdist.get_xdist_worker_id(session)
+        session.config.cache.set(
+            f"cairo_run/{worker_id}/{NON_NATIVE_HINTS_FILE}", session.non_native_hints
+        )
+        return
+
+    non_native_hints = dict(session.non_native_hints)
+    if xdist.is_xdist_controller(session):
+        for worker_id in range(session.config.option.numprocesses):
+            worker_hints = session.config.cache.get(
+                f"cairo_run/gw{worker_id}/{NON_NATIVE_HINTS_FILE}", {}
+            )
+            for hint, count in worker_hints.items():
+                non_native_hints[hint] = non_native_hints.get(hint, 0) + count
+
+    report_path = session.build_dir / NON_NATIVE_HINTS_FILE
+    report_path.parent.mkdir(parents=True, exist_ok=True)
+    with report_path.open("w") as f:
+        json.dump(non_native_hints, f, indent=2, sort_keys=True)
+
+    if not non_native_hints:
+        logger.info("All hints executed have a native implementation ✅")
+        return
+
+    lines = [
+        f"{count:>10}  {hint.strip().splitlines()[0]}"
+        for hint, count in sorted(non_native_hints.items(), key=lambda item: -item[1])
+    ]
+    logger.error(
+        f"{len(non_native_hints)} hints without a native implementation were executed "
+        f"(report in {report_path}):\n" + "\n".join(lines)
+    )
+    session.exitstatus = pytest.ExitCode.TESTS_FAILED
+
+
 def pytest_sessionfinish(session):
+    if session.config.getoption("hint_coverage"):
+        report_non_native_hints(session)
+
     if xdist.is_xdist_controller(session):
         logger.info("Controller worker: collecting tests to skip")
         tests_to_skip = session.config.cache.get(f"cairo_run/{CACHED_TESTS_FILE}", [])
@@ -405,8 +466,10 @@ def pytest_collection_modifyitems(session, config, items):
             item.own_markers = [
                 mark for mark in item.own_markers if mark.name != "skip"
             ]
+        # Cached tests don't run, so their hints would be missing from the hint coverage
         if (
             config.getoption("skip_cached_tests")
+            and not config.getoption("hint_coverage")
             and session.test_hashes.get(item.nodeid) in tests_to_skip
         ):
             item.add_marker(pytest.mark.skip(reason="Cached results"))
@@ -47,7 +47,7 @@ from starkware.cairo.lang.vm.utils import RunResources
 from starkware.cairo.lang.vm.vm import VirtualMachine
 
 from cairo_addons.hints.injected import prepare_context
-from cairo_addons.profiler import profile_from_trace
+from cairo_addons.profiler import frame_names, profile_from_trace
 from cairo_addons.rust_bindings.vm import CairoRunner as RustCairoRunner
 from cairo_addons.rust_bindings.vm import Program as RustProgram
 from cairo_addons.rust_bindings.vm import RunResources as RustRunResources
@@ -196,6 +196,15 @@ def is_actual_builtin(arg_name: str) -> bool:
     )
 
 
+def record_non_native_hints(request: FixtureRequest, runner: RustCairoRunner):
+    """Adds the hints the Rust VM executed as Python code in the last run to the session counts."""
+    if not request.config.getoption("hint_coverage"):
+        return
+    non_native_hints = request.session.non_native_hints
+    for hint, count in runner.non_native_hint_counts.items():
+        non_native_hints[hint] = non_native_hints.get(hint, 0) + count
+
+
 def run_python_vm(
     cairo_programs: List[Program],
     cairo_files: List[Path],
@@ -571,6 +580,11 @@ def run_rust_vm(
     request: FixtureRequest,
     coverage: Optional[Callable[[pl.DataFrame, int], pl.DataFrame]],
 ):
+    # When --warm-runner is set, runners are kept warm for the lifetime of the fixture and reset
+    # between runs instead of being re-created. They are keyed by program and builtins, as the
+    # builtins of a runner are fixed at creation.
+    warm_runners = {}
+
     def _run(entrypoint, *args, verify_squashed_dicts: bool = False, **kwargs):
         # ============================================================================
         # STEP 1: SELECT PROGRAM AND PREPARE ENTRYPOINT METADATA
@@ -624,21 +638,34 @@ def run_rust_vm(
         output_stem = Path(
             f"{output_stem[:160]}_{int(time_ns())}_{md5(output_stem.encode()).digest().hex()[:8]}"
         )
-        runner = RustCairoRunner(
-            program=rust_program,
-            py_identifiers=cairo_program.identifiers,
-            program_input=kwargs,
-            layout=getattr(LAYOUTS, request.config.getoption("layout")).layout_name,
-            proof_mode=proof_mode,
-            allow_missing_builtins=False,
-            enable_traces=enable_traces,
-            return_data_info=[
-                (item["name"] or "", item["size"]) for item in return_data_info
-            ],
-            cairo_file=cairo_file,
-            py_debug_info=cairo_program.debug_info,
-            output_path=output_stem,
-        )
+        runner_return_data_info = [
+            (item["name"] or "", item["size"]) for item in return_data_info
+        ]
+        warm_runner = request.config.getoption("warm_runner")
+        runner_key = (id(rust_program), tuple(rust_program.builtins))
+        if warm_runner and runner_key in warm_runners:
+            runner = warm_runners[runner_key]
+            runner.reset(
+                program_input=kwargs,
+                return_data_info=runner_return_data_info,
+                output_path=output_stem,
+            )
+        else:
+            runner = RustCairoRunner(
+                program=rust_program,
+                py_identifiers=cairo_program.identifiers,
+                program_input=kwargs,
+                layout=getattr(LAYOUTS, request.config.getoption("layout")).layout_name,
+                proof_mode=proof_mode,
+                allow_missing_builtins=False,
+                enable_traces=enable_traces,
+                return_data_info=runner_return_data_info,
+                cairo_file=cairo_file,
+                py_debug_info=cairo_program.debug_info,
+                output_path=output_stem,
+            )
+            if warm_runner:
+                warm_runners[runner_key] = runner
         serde = Serde(
             runner.segments, cairo_program.identifiers, runner.dict_manager, cairo_file
         )
@@ -765,6 +792,7 @@ def run_rust_vm(
         try:
             runner.run_until_pc(end, run_resources)
         except Exception as e:
+            record_non_native_hints(request, runner)
             runner.relocate()
             if not request.config.getoption("no_coverage"):
                 coverage(cairo_file, runner.trace_df)
@@ -784,6 +812,7 @@ def run_rust_vm(
         if not isinstance(first_return_data_offset, int):
             raise ValueError("First return data offset is not an int")
 
+        record_non_native_hints(request, runner)
         runner.verify_auto_deductions()
         pointer = runner.read_return_values()
 
@@ -817,6 +846,10 @@ def run_rust_vm(
             logger.info(stats)
             stats.write_csv(output_stem.with_suffix(".csv"))
             marshal.dump(prof_dict, open(output_stem.with_suffix(".prof"), "wb"))
+            runner.write_call_stack_profile(
+                output_stem.with_suffix(".folded"),
+                frame_names(cairo_program, PROGRAM_BASE),
+            )
 
         # ============================================================================
         # STEP 8: SERIALIZE AND RETURN OUTPUT
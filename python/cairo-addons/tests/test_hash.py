@@ -0,0 +1,35 @@
+import pytest
+from ethereum.crypto.hash import keccak256
+
+from cairo_addons.rust_bindings.vm import keccak256_hex_many
+
+# More elements than the minimum chunk size, so that they are split across several threads.
+PREIMAGES = [bytes([i % 256]) * (i % 40) for i in range(1_000)]
+
+
+class TestKeccak256HexMany:
+    def test_empty(self):
+        assert keccak256_hex_many([], num_threads=4) == []
+
+    @pytest.mark.parametrize("prefix", ["", "0x"])
+    @pytest.mark.parametrize("num_threads", [1, 4, 64])
+    def test_hashes_in_input_order(self, prefix, num_threads):
+        elements = [prefix + preimage.hex() for preimage in PREIMAGES]
+        assert keccak256_hex_many(elements, num_threads=num_threads) == [
+            (keccak256(preimage), preimage) for preimage in PREIMAGES
+        ]
+
+    def test_mixed_prefixes(self):
+        elements = ["0x" + PREIMAGES[1].hex(), PREIMAGES[1].hex()]
+        (hash_0x, preimage_0x), (hash_bare, preimage_bare) = keccak256_hex_many(
+            elements
+        )
+        assert hash_0x == hash_bare == keccak256(PREIMAGES[1])
+        assert preimage_0x == preimage_bare == PREIMAGES[1]
+
+    @pytest.mark.parametrize("invalid", ["0xzz", "abc", "0x0"])
+    def test_invalid_hex_raises_value_error(self, invalid):
+        # The invalid element is in the last chunk.
+        elements = [preimage.hex() for preimage in PREIMAGES] + [invalid]
+        with pytest.raises(ValueError):
+            keccak256_hex_many(elements, num_threads=4)
@@ -0,0 +1,141 @@
+import json
+
+import polars as pl
+import pytest
+from starkware.cairo.lang.cairo_constants import DEFAULT_PRIME
+from starkware.cairo.lang.compiler.cairo_compile import compile_cairo, get_module_reader
+from starkware.cairo.lang.compiler.preprocessor.default_pass_manager import (
+    default_pass_manager,
+)
+from starkware.cairo.lang.vm.memory_segments import FIRST_MEMORY_ADDR as PROGRAM_BASE
+
+from cairo_addons.profiler import _reduce_trace, frame_names
+from cairo_addons.rust_bindings.vm import CairoRunner
+from cairo_addons.rust_bindings.vm import Program as RustProgram
+from cairo_addons.rust_bindings.vm import RunResources
+
+# A call at fp 10 making two calls at fp 20, with runs spanning several chunks.
+TRACE = pl.DataFrame(
+    {
+        "pc": list(range(1, 12)),
+        "fp": [10, 10, 10, 20, 20, 10, 10, 20, 20, 20, 10],
+    },
+    schema={"pc": pl.UInt64, "fp": pl.UInt64},
+)
+
+
+class TestReduceTrace:
+    def test_single_chunk(self):
+        fp_runs, fp_to_first_pc = _reduce_trace(TRACE.lazy(), len(TRACE))
+        assert fp_runs.rows() == [(3, 10), (2, 20), (2, 10), (3, 20), (1, 10)]
+        assert fp_to_first_pc.rows() == [(10, 1), (20, 4)]
+
+    @pytest.mark.parametrize("chunk_size", [1, 2, 7])
+    def test_chunked_matches_single_chunk(self, chunk_size):
+        expected_runs, expected_first_pcs = _reduce_trace(TRACE.lazy(), len(TRACE))
+        fp_runs, fp_to_first_pc = _reduce_trace(TRACE.lazy(), chunk_size)
+        assert fp_runs.equals(expected_runs)
+        assert fp_to_first_pc.equals(expected_first_pcs)
+
+    def test_empty_trace(self):
+        fp_runs, fp_to_first_pc = _reduce_trace(TRACE.clear().lazy(), 2)
+        assert fp_runs.is_empty()
+        assert fp_to_first_pc.is_empty()
+
+
+# `main` calls `check` directly and through `inner`, each `check` using one range check instance.
+# `unused_local` allocates two locals and only writes the first one, leaving one memory hole.
+PROFILED_PROGRAM = """
+%builtins range_check
+
+func main{range_check_ptr}() {
+    unused_local();
+    check(1);
+    inner();
+    return ();
+}
+
+func inner{range_check_ptr}() {
+    check(2);
+    check(3);
+    return ();
+}
+
+func check{range_check_ptr}(x: felt) {
+    assert [range_check_ptr] = x;
+    let range_check_ptr = range_check_ptr + 1;
+    return ();
+}
+
+func unused_local() {
+    alloc_locals;
+    local used = 1;
+    local unused: felt;
+    return ();
+}
+"""
+
+
+@pytest.fixture(scope="module")
+def profiled_program():
+    pass_manager = default_pass_manager(
+        prime=DEFAULT_PRIME, read_module=get_module_reader(cairo_path=[]).read
+    )
+    return compile_cairo(
+        PROFILED_PROGRAM,
+        pass_manager=pass_manager,
+        debug_info=True,
+        add_start=False,
+    )
+
+
+def read_folded(path):
+    return dict(line.rsplit(" ", 1) for line in path.read_text().splitlines())
+
+
+class TestCallStackProfile:
+    @pytest.fixture
+    def profile_path(self, profiled_program, tmp_path):
+        rust_program = RustProgram.from_bytes(
+            json.dumps(profiled_program.Schema().dump(profiled_program)).encode()
+        )
+        runner = CairoRunner(rust_program, layout="all_cairo")
+        runner.initialize_segments()
+
+        return_fp = runner.execution_base + 2
+        end = runner.program_base + runner.program_len
+        range_check = runner.builtin_runners["range_check_builtin"]
+        stack = [return_fp, end, *range_check["initial_stack"], return_fp, end]
+        runner.initial_pc = runner.program_base + profiled_program.get_label("main")
+        runner.load_program_data(runner.program_base)
+        runner.load_data(runner.execution_base, stack)
+        runner.initial_fp = runner.initial_ap = runner.execution_base + len(stack)
+        runner.initialize_vm()
+        runner.run_until_pc(end, RunResources(1_000))
+        runner.relocate()
+
+        path = tmp_path / "profile.folded"
+        runner.write_call_stack_profile(
+            path, frame_names(profiled_program, PROGRAM_BASE)
+        )
+        return path
+
+    def test_steps(self, profile_path):
+        assert read_folded(profile_path) == {
+            "__main__.main": "6",
+            "__main__.main;__main__.unused_local": "3",
+            "__main__.main;__main__.check": "3",
+            "__main__.main;__main__.inner": "6",
+            "__main__.main;__main__.inner;__main__.check": "6",
+        }
+
+    def test_builtins(self, profile_path):
+        assert read_folded(profile_path.with_suffix(".range_check.folded")) == {
+            "__main__.main;__main__.check": "1",
+            "__main__.main;__main__.inner;__main__.check": "2",
+        }
+
+    def test_memory_holes(self, profile_path):
+        assert read_folded(profile_path.with_suffix(".memory_holes.folded")) == {
+            "__main__.main;__main__.unused_local": "1",
+        }
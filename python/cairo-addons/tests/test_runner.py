@@ -46,3 +46,15 @@ class TestRunner:
         expected = 0xABDE1
         runner.segments.load_data(base, [expected])
         assert runner.segments.memory.get(base) == expected
+
+    def test_reset(self, rust_program):
+        runner = CairoRunner(rust_program, layout="all_cairo")
+        runner.initialize_segments()
+        base = runner.segments.add()
+        runner.segments.load_data(base, [0xABDE1])
+
+        runner.reset(program_input={"a": 1})
+        runner.initialize_segments()
+        assert runner.program_base.segment_index == 0
+        assert runner.execution_base.segment_index == 1
+        assert runner.segments.memory.get(base) is None
@@ -0,0 +1,91 @@
+import json
+
+import pytest
+from starkware.cairo.lang.cairo_constants import DEFAULT_PRIME
+from starkware.cairo.lang.compiler.cairo_compile import compile_cairo, get_module_reader
+from starkware.cairo.lang.compiler.preprocessor.default_pass_manager import (
+    default_pass_manager,
+)
+
+from cairo_addons.rust_bindings.stwo_bindings import (
+    compare_serialization_formats,
+    prove,
+    verify,
+)
+from cairo_addons.rust_bindings.vm import generate_trace
+
+FORMATS = ["json", "binary", "binary-zstd"]
+MAGIC_BYTES = {"json": b"{", "binary": b"KBIN", "binary-zstd": b"\x28\xb5\x2f\xfd"}
+
+PROGRAM = """
+func main() {
+    tempvar x = 10;
+
+    loop:
+    tempvar x = x - 1;
+    jmp loop if x != 0;
+
+    return ();
+}
+"""
+
+
+@pytest.fixture(scope="module")
+def compiled_program_path(tmp_path_factory):
+    pass_manager = default_pass_manager(
+        prime=DEFAULT_PRIME, read_module=get_module_reader(cairo_path=[]).read
+    )
+    program = compile_cairo(
+        PROGRAM, pass_manager=pass_manager, debug_info=False, add_start=True
+    )
+    path = tmp_path_factory.mktemp("program") / "program.json"
+    path.write_text(json.dumps(program.Schema().dump(program)))
+    return path
+
+
+def write_prover_input(compiled_program_path, output_path, prover_input_format):
+    generate_trace(
+        entrypoint="main",
+        program_input={},
+        compiled_program_path=str(compiled_program_path),
+        output_path=output_path,
+        output_trace_components=False,
+        cairo_pie=False,
+        prover_input_format=prover_input_format,
+    )
+
+
+@pytest.fixture(scope="module")
+def prover_input_path(compiled_program_path, tmp_path_factory):
+    path = tmp_path_factory.mktemp("prover_input") / "prover_input.json"
+    write_prover_input(compiled_program_path, path, "json")
+    return path
+
+
+class TestSerialization:
+    @pytest.mark.parametrize("prover_input_format", FORMATS)
+    def test_prover_input_round_trip(
+        self, compiled_program_path, tmp_path, prover_input_format
+    ):
+        path = tmp_path / "prover_input"
+        write_prover_input(compiled_program_path, path, prover_input_format)
+        assert path.read_bytes().startswith(MAGIC_BYTES[prover_input_format])
+
+        # Reads the prover input back, detecting its format, and round-trips it through every
+        # format.
+        results = compare_serialization_formats(path, tmp_path / "formats")
+        assert [name for name, *_ in results] == FORMATS
+        for name, size, _, _ in results:
+            written = (tmp_path / "formats" / f"prover_input.{name}").read_bytes()
+            assert len(written) == size
+            assert written.startswith(MAGIC_BYTES[name])
+
+    @pytest.mark.parametrize("proof_format", FORMATS)
+    def test_proof_round_trip(self, prover_input_path, tmp_path, proof_format):
+        proof_path = tmp_path / "proof"
+        prove(
+            prover_input_path, proof_path, serde_cairo=False, proof_format=proof_format
+        )
+        assert proof_path.read_bytes().startswith(MAGIC_BYTES[proof_format])
+
+        verify(proof_path)
@@ -3,6 +3,7 @@ from collections import defaultdict
 from dataclasses import dataclass, field, fields, make_dataclass
 from typing import (
     ClassVar,
+    Dict,
     List,
     Optional,
     Set,
@@ -106,6 +107,12 @@ class MutableBloom(bytearray):
     pass
 
 
+class NodeStore(Dict[Hash32, Bytes]):
+    # The decoded nodes cache of the Cairo NodeStore is not part of the Python type: it is
+    # generated null, which disables caching.
+    pass
+
+
 T = TypeVar("T")
 
 
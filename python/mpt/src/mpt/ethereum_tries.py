@@ -1,9 +1,10 @@
 import json
 import logging
+import os
 from dataclasses import dataclass
 from functools import partial
 from pathlib import Path
-from typing import Any, Callable, Dict, Mapping
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple
 
 from ethereum.crypto.hash import Hash32, keccak256
 from ethereum.prague.fork_types import Account, Address
@@ -16,15 +17,81 @@ from ethereum.prague.trie import (
     Trie,
 )
 from ethereum_rlp import rlp
-from ethereum_types.bytes import Bytes, Bytes20, Bytes32
+from ethereum_types.bytes import Bytes, Bytes32
 from ethereum_types.numeric import U256, Uint
 
+from cairo_addons.rust_bindings.vm import keccak256_hex_many
 from keth_types.types import EMPTY_BYTES_HASH, EMPTY_TRIE_HASH
 from mpt.utils import decode_node, deserialize_to_internal_node, nibble_list_to_bytes
 
 logger = logging.getLogger(__name__)
 
 
+def _hash_hex_preimages(encoded: List[str]) -> Dict[Hash32, Bytes]:
+    """
+    Map the keccak256 hash of each hex-encoded preimage to its bytes.
+
+    Decoding and hashing are done in a single native call, across all available cores.
+    """
+    return {
+        Hash32(hash_): Bytes(preimage)
+        for hash_, preimage in keccak256_hex_many(
+            encoded, num_threads=os.cpu_count() or 1
+        )
+    }
+
+
+@dataclass
+class AccessList:
+    """
+    Index of the ZKPI-provided access list, built in a single pass over its entries.
+
+    Attributes:
+        storage_keys: A mapping of addresses to the storage keys accessed for them.
+        address_preimages: A mapping of MPT path to the corresponding addresses.
+        storage_key_preimages: A mapping of MPT path to the corresponding storage keys.
+    """
+
+    storage_keys: Dict[Address, Tuple[Bytes32, ...]]
+    address_preimages: Dict[Hash32, Address]
+    storage_key_preimages: Dict[Hash32, Bytes32]
+
+    @staticmethod
+    def from_data(data: Dict[str, Any]) -> "AccessList":
+        """
+        Create an AccessList object from the ZKPI-provided data.
+
+        Args:
+            data: The ZKPI-provided data.
+
+        Returns:
+            An AccessList object.
+        """
+        entries = (
+            data["accessList"] if "accessList" in data else data["extra"]["accessList"]
+        )
+        storage_keys: Dict[Address, Tuple[Bytes32, ...]] = {}
+        address_preimages: Dict[Hash32, Address] = {}
+        storage_key_preimages: Dict[Hash32, Bytes32] = {}
+        for entry in entries:
+            address = Address.fromhex(entry["address"][2:])
+            keys = tuple(
+                Bytes32.fromhex(storage_key[2:])
+                for storage_key in entry["storageKeys"] or []
+            )
+            # Only the first entry of an address provides its storage keys
+            storage_keys.setdefault(address, keys)
+            address_preimages[keccak256(address)] = address
+            for key in keys:
+                storage_key_preimages[keccak256(key)] = key
+
+        return AccessList(
+            storage_keys=storage_keys,
+            address_preimages=address_preimages,
+            storage_key_preimages=storage_key_preimages,
+        )
+
+
 @dataclass
 class EthereumTries:
     """
@@ -62,20 +129,18 @@ class EthereumTries:
         return EthereumTries.from_data(data)
 
     @staticmethod
-    def from_data(data: Dict[str, Any]):
+    def from_data(data: Dict[str, Any], access_list: Optional[AccessList] = None):
         """
         Create an EthereumTries object from the ZKPI-provided data.
 
         Args:
             data: The ZKPI-provided data.
+            access_list: The indexed access list of `data`, built from it if not provided.
 
         Returns:
             An EthereumTries object.
         """
-        nodes = {
-            keccak256(bytes.fromhex(node[2:])): bytes.fromhex(node[2:])
-            for node in data["witness"]["state"]
-        }
+        nodes = _hash_hex_preimages(data["witness"]["state"])
 
         pre_state_root = Hash32.fromhex(
             data["witness"]["ancestors"][0]["stateRoot"][2:]
@@ -83,10 +148,7 @@ class EthereumTries:
         if pre_state_root not in nodes:
             raise ValueError(f"State root not found in nodes: {pre_state_root}")
 
-        codes = {
-            keccak256(Bytes.fromhex(code[2:])): Bytes.fromhex(code[2:])
-            for code in data["witness"]["codes"]
-        }
+        codes = _hash_hex_preimages(data["witness"]["codes"])
 
         # TODO: modify zk-pig to provide directly address preimages
 
@@ -97,28 +159,14 @@ class EthereumTries:
         #     _main_trie: Trie[Address, Optional[Account]]
         #     _storage_tries: Dict[Address, Trie[Bytes32, U256]]
         # ...
-        access_list = (
-            data["accessList"] if "accessList" in data else data["extra"]["accessList"]
-        )
-        address_preimages = {
-            keccak256(Bytes20.fromhex(preimage["address"][2:])): Address.fromhex(
-                preimage["address"][2:]
-            )
-            for preimage in access_list
-        }
-        storage_key_preimages = {
-            keccak256(Bytes32.fromhex(storage_key[2:])): Bytes32.fromhex(
-                storage_key[2:]
-            )
-            for access in access_list
-            for storage_key in access["storageKeys"] or []
-        }
+        if access_list is None:
+            access_list = AccessList.from_data(data)
 
         return EthereumTries(
             nodes=nodes,
             codes=codes,
-            address_preimages=address_preimages,
-            storage_key_preimages=storage_key_preimages,
+            address_preimages=access_list.address_preimages,
+            storage_key_preimages=access_list.storage_key_preimages,
             state_root=pre_state_root,
         )
 
@@ -329,16 +377,15 @@ class EthereumTrieTransitionDB(EthereumTries):
         return EthereumTrieTransitionDB.from_data(data)
 
     @classmethod
-    def from_data(cls, data: Dict[str, Any]) -> "EthereumTrieTransitionDB":
+    def from_data(
+        cls, data: Dict[str, Any], access_list: Optional[AccessList] = None
+    ) -> "EthereumTrieTransitionDB":
         """
         Create an EthereumTrieTransitionDB object from the ZKPI-provided data.
         """
-        pre_trie = EthereumTries.from_data(data)
+        pre_trie = EthereumTries.from_data(data, access_list)
 
-        post_nodes = {
-            keccak256(bytes.fromhex(node[2:])): bytes.fromhex(node[2:])
-            for node in data["extra"]["committed"]
-        }
+        post_nodes = _hash_hex_preimages(data["extra"]["committed"])
         post_state_root = Hash32.fromhex(data["blocks"][0]["header"]["stateRoot"][2:])
         if post_state_root not in post_nodes:
             raise ValueError(f"Post state root not found in nodes: {post_state_root}")
@@ -356,10 +403,15 @@ class EthereumTrieTransitionDB(EthereumTries):
 
 class PreState:
     @staticmethod
-    def from_data(data: Dict[str, Any]) -> State:
+    def from_data(
+        data: Dict[str, Any], access_list: Optional[AccessList] = None
+    ) -> State:
         """
         Create a PreState object from the ZKPI-provided data.
         """
+        if access_list is None:
+            access_list = AccessList.from_data(data)
+
         pre_state = State()
         for address_hex, account in data["extra"]["preState"].items():
             address = Address.fromhex(address_hex[2:])
@@ -372,21 +424,8 @@ class PreState:
                 pre_state._main_trie._data[address] = None
 
                 # If this account has storage that will be accessed or initialized, we need to add it to the storage tries.
-                # Find the access list entry for this address if it exists
-                access_entry = next(
-                    (
-                        entry
-                        for entry in data["extra"]["accessList"]
-                        if entry["address"] == address_hex
-                    ),
-                    None,
-                )
-                if access_entry:
-                    for storage_key in access_entry["storageKeys"]:
-                        storage_key_bytes = Bytes32.fromhex(storage_key[2:])
-                        pre_state._storage_tries[address]._data[
-                            storage_key_bytes
-                        ] = None
+                for storage_key in access_list.storage_keys.get(address, ()):
+                    pre_state._storage_tries[address]._data[storage_key] = None
                 continue
 
             # Initialize the account
@@ -456,9 +495,10 @@ class ZkPi:
         """
         from mpt.trie_diff import StateDiff
 
-        transition_tries = EthereumTrieTransitionDB.from_data(data)
+        access_list = AccessList.from_data(data)
+        transition_tries = EthereumTrieTransitionDB.from_data(data, access_list)
         state_diff = StateDiff.from_data(data)
-        pre_state = PreState.from_data(data)
+        pre_state = PreState.from_data(data, access_list)
         return cls(
             transition_db=transition_tries, state_diff=state_diff, pre_state=pre_state
         )
@@ -49,7 +49,14 @@ from ethereum_rlp.rlp import (
     Extended__eq__,
 )
 
-from legacy.utils.dict import hashdict_read
+from starkware.cairo.common.default_dict import default_dict_new
+from legacy.utils.dict import (
+    dict_read,
+    dict_write,
+    hashdict_read,
+    hashdict_read_hashed,
+    default_dict_finalize,
+)
 from cairo_core.control_flow import raise
 from ethereum.utils.numeric import OptionalU256__eq__
 from ethereum.utils.bytes import (
@@ -71,6 +78,9 @@ from mpt.types import (
     NodeStore,
     NodeStoreStruct,
     NodeStoreDictAccess,
+    DecodedNodes,
+    DecodedNodesStruct,
+    DecodedNodesDictAccess,
     MappingBytes32Address,
     MappingBytes32AddressStruct,
     Bytes32OptionalAddressDictAccess,
@@ -745,6 +755,17 @@ func compute_diff_entrypoint{
     alloc_locals;
     tempvar account_address = OptionalAddress(cast(0, felt*));
 
+    // Each node is verified and decoded once, however many times the diff visits it.
+    let (decoded_nodes_start_) = default_dict_new(0);
+    let decoded_nodes_start = cast(decoded_nodes_start_, DecodedNodesDictAccess*);
+    tempvar node_store = NodeStore(
+        new NodeStoreStruct(
+            node_store.value.dict_ptr_start,
+            node_store.value.dict_ptr,
+            DecodedNodes(new DecodedNodesStruct(decoded_nodes_start, decoded_nodes_start)),
+        ),
+    );
+
     _compute_diff{
         node_store=node_store,
         address_preimages=address_preimages,
@@ -765,6 +786,12 @@ func compute_diff_entrypoint{
         cast(node_store.value.dict_ptr_start, DictAccess*),
         cast(node_store.value.dict_ptr, DictAccess*),
     );
+    // The cache starts empty: all its first reads must be misses.
+    default_dict_finalize(
+        cast(node_store.value.decoded_nodes.value.dict_ptr_start, DictAccess*),
+        cast(node_store.value.decoded_nodes.value.dict_ptr, DictAccess*),
+        0,
+    );
     dict_squash(
         cast(address_preimages.value.dict_ptr_start, DictAccess*),
         cast(address_preimages.value.dict_ptr, DictAccess*),
@@ -2204,6 +2231,9 @@ func _compute_left_extension_node_diff_on_right_branch_node{
 // @notice Retrieves a node from the node store dictionary by its hash.
 // @dev Uses the poseidon hash components (low, high) as the key to look up the node pointer
 //      in the `node_store` dictionary. Handles the special case for the empty trie hash.
+//      If the node store has a `decoded_nodes` cache, a node is keccak-checked and RLP-decoded
+//      only on its first lookup, later lookups return the cached decoded node. The key is hashed
+//      once, and used for both the cache and the node store.
 // @implicit poseidon_ptr Used for hashing if needed by `hashdict_read`.
 // @implicit node_store The NodeStore containing the hash-to-node mapping.
 // @param node_hash The Hash32 of the node to retrieve.
@@ -2225,21 +2255,78 @@ func node_store_get{
         return res;
     }
 
-    let dict_ptr = cast(node_store.value.dict_ptr, DictAccess*);
-
-    let fp_and_pc = get_fp_and_pc();
-    local __fp__: felt* = fp_and_pc.fp_val;
-
-    let (keys) = alloc();
+    let (local keys: felt*) = alloc();
     assert keys[0] = node_hash.value.low;
     assert keys[1] = node_hash.value.high;
+    let (local felt_key) = blake2s_hash_many(2, keys);
+
+    if (cast(node_store.value.decoded_nodes.value, felt) == 0) {
+        let result = _node_store_read_and_decode(node_hash, keys, felt_key);
+        return result;
+    }
+
+    // Decoded nodes were verified when first read: return them as is.
+    let decoded_nodes_start = node_store.value.decoded_nodes.value.dict_ptr_start;
+    let decoded_nodes_ptr = cast(node_store.value.decoded_nodes.value.dict_ptr, DictAccess*);
+    let (cached_node) = dict_read{dict_ptr=decoded_nodes_ptr}(felt_key);
+    let new_decoded_nodes_ptr = cast(decoded_nodes_ptr, DecodedNodesDictAccess*);
+    tempvar node_store = NodeStore(
+        new NodeStoreStruct(
+            node_store.value.dict_ptr_start,
+            node_store.value.dict_ptr,
+            DecodedNodes(new DecodedNodesStruct(decoded_nodes_start, new_decoded_nodes_ptr)),
+        ),
+    );
+    if (cached_node != 0) {
+        let result = OptionalInternalNode(cast(cached_node, InternalNodeEnum*));
+        return result;
+    }
+
+    let decoded_node = _node_store_read_and_decode(node_hash, keys, felt_key);
+    local result: OptionalInternalNode = decoded_node;
+
+    let decoded_nodes_ptr = cast(node_store.value.decoded_nodes.value.dict_ptr, DictAccess*);
+    dict_write{dict_ptr=decoded_nodes_ptr}(felt_key, cast(result.value, felt));
+    let new_decoded_nodes_ptr = cast(decoded_nodes_ptr, DecodedNodesDictAccess*);
+    tempvar node_store = NodeStore(
+        new NodeStoreStruct(
+            node_store.value.dict_ptr_start,
+            node_store.value.dict_ptr,
+            DecodedNodes(
+                new DecodedNodesStruct(
+                    node_store.value.decoded_nodes.value.dict_ptr_start, new_decoded_nodes_ptr
+                ),
+            ),
+        ),
+    );
+    return result;
+}
+
+// @notice Reads a node from the node store, checks its preimage and RLP-decodes it.
+// @implicit node_store The NodeStore containing the hash-to-node mapping.
+// @param node_hash The Hash32 of the node to retrieve, which must not be the empty trie hash.
+// @param keys The (low, high) components of `node_hash`, the node store key.
+// @param felt_key The hash of `keys`.
+// @return The decoded node.
+func _node_store_read_and_decode{
+    range_check_ptr,
+    bitwise_ptr: BitwiseBuiltin*,
+    keccak_ptr: felt*,
+    poseidon_ptr: PoseidonBuiltin*,
+    node_store: NodeStore,
+}(node_hash: Hash32, keys: felt*, felt_key: felt) -> OptionalInternalNode {
+    alloc_locals;
+
+    let dict_ptr = cast(node_store.value.dict_ptr, DictAccess*);
 
     // Read from the dictionary using the hash as key
-    let (pointer) = hashdict_read{dict_ptr=dict_ptr}(2, keys);
+    let (pointer) = hashdict_read_hashed{dict_ptr=dict_ptr}(2, keys, felt_key);
 
     let new_dict_ptr = cast(dict_ptr, NodeStoreDictAccess*);
     tempvar node_store = NodeStore(
-        new NodeStoreStruct(node_store.value.dict_ptr_start, new_dict_ptr)
+        new NodeStoreStruct(
+            node_store.value.dict_ptr_start, new_dict_ptr, node_store.value.decoded_nodes
+        ),
     );
 
     // Cast the result to a Bytes, hash it to check invariant and RLP-decode it.
@@ -1,11 +1,34 @@
 from ethereum_types.bytes import HashedBytes32, Bytes32, Bytes, String
-from ethereum.prague.trie import LeafNode, ExtensionNode, BranchNode, SequenceExtended
+from ethereum.prague.trie import (
+    LeafNode,
+    ExtensionNode,
+    BranchNode,
+    SequenceExtended,
+    OptionalInternalNode,
+)
 from ethereum.prague.fork_types import Address, HashedTupleAddressBytes32, OptionalAccount
 from cairo_core.numeric import Bool, OptionalU256, Uint
 
 const EMPTY_TRIE_HASH_LOW = 0x6ef8c092e64583ffa655cc1b171fe856;
 const EMPTY_TRIE_HASH_HIGH = 0x21b463e3b52f6201c0ad6c991be0485b;
 
+// DecodedNodes is a mapping of node hashes to their decoded InternalNode
+// Entries are only written by `node_store_get` once the node preimage has been checked,
+// and the dict is finalized with a default value of 0: a cached node can't be
+// provided by the prover.
+struct DecodedNodes {
+    value: DecodedNodesStruct*,
+}
+struct DecodedNodesStruct {
+    dict_ptr_start: DecodedNodesDictAccess*,
+    dict_ptr: DecodedNodesDictAccess*,
+}
+struct DecodedNodesDictAccess {
+    key: HashedBytes32,
+    prev_value: OptionalInternalNode,
+    new_value: OptionalInternalNode,
+}
+
 // NodeStore is a mapping of node hashes to their corresponding InternalNode
 // In the world state DB given as input to the program
 // This is used to store state and storage MPT nodes
@@ -16,6 +39,8 @@ struct NodeStore {
 struct NodeStoreStruct {
     dict_ptr_start: NodeStoreDictAccess*,
     dict_ptr: NodeStoreDictAccess*,
+    // Nodes already verified and decoded by `node_store_get`, or null to disable caching.
+    decoded_nodes: DecodedNodes,
 }
 
 struct NodeStoreDictAccess {
@@ -23,6 +48,7 @@ struct NodeStoreDictAccess {
     prev_value: Bytes,
     new_value: Bytes,
 }
+
 // AddressPreimages is a mapping of keccak(address) to their corresponding preimages
 // As per the specification, MPT state nodes paths are keccak(address)
 // This mapping is used to retrieve the address given a full state path
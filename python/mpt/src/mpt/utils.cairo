@@ -1,5 +1,3 @@
-from starkware.cairo.common.cairo_builtins import BitwiseBuiltin
-
 from ethereum.prague.trie import (
     InternalNode,
     OptionalInternalNode,
@@ -29,18 +27,14 @@ from mpt.types import (
     StorageDiffStruct,
 )
 
-func decode_to_internal_node{range_check_ptr, bitwise_ptr: BitwiseBuiltin*}(
-    node: Bytes
-) -> InternalNode {
+func decode_to_internal_node{range_check_ptr}(node: Bytes) -> InternalNode {
     alloc_locals;
     let decoded = decode(node);
     let extended = ExtendedImpl.from_simple(decoded);
     return deserialize_to_internal_node(extended);
 }
 
-func deserialize_to_internal_node{range_check_ptr, bitwise_ptr: BitwiseBuiltin*}(
-    decoded: Extended
-) -> InternalNode {
+func deserialize_to_internal_node{range_check_ptr}(decoded: Extended) -> InternalNode {
     alloc_locals;
     // Verify it's a sequence
     with_attr error_message("DecodingError") {
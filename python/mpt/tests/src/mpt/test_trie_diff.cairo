@@ -1,9 +1,13 @@
 from starkware.cairo.common.cairo_builtins import PoseidonBuiltin, BitwiseBuiltin
 from starkware.cairo.common.alloc import alloc
+from starkware.cairo.common.default_dict import default_dict_new
+from starkware.cairo.common.dict import DictAccess
+from legacy.utils.dict import default_dict_finalize
 from mpt.trie_diff import (
     _process_account_diff,
     _process_storage_diff,
     compute_diff_entrypoint,
+    node_store_get,
     MappingBytes32Address,
     AddressAccountDiffEntry,
     AccountDiff,
@@ -13,10 +17,15 @@ from mpt.trie_diff import (
     StorageDiffEntry,
     MappingBytes32Bytes32,
     NodeStore,
+    NodeStoreStruct,
+    DecodedNodes,
+    DecodedNodesStruct,
+    DecodedNodesDictAccess,
     OptionalUnionInternalNodeExtended
 )
+from ethereum.crypto.hash import Hash32
 from ethereum_types.bytes import Bytes32, Bytes
-from ethereum.prague.trie import OptionalLeafNode
+from ethereum.prague.trie import OptionalLeafNode, OptionalInternalNode
 from ethereum.prague.fork_types import Address
 
 func test__process_account_diff{
@@ -96,3 +105,33 @@ func test__compute_diff_entrypoint{
     let res = compute_diff_entrypoint(node_store=node_store, address_preimages=address_preimages, storage_key_preimages=storage_key_preimages, left=left, right=right, start_path=start_path, main_trie_start=main_trie_start, main_trie_end=main_trie_end, storage_tries_start=storage_tries_start, storage_tries_end=storage_tries_end);
     return res;
 }
+
+func test_node_store_get_cached{
+    range_check_ptr, bitwise_ptr: BitwiseBuiltin*, poseidon_ptr: PoseidonBuiltin*, keccak_ptr: felt*
+}(node_store: NodeStore, node_hash: Hash32) -> (OptionalInternalNode, OptionalInternalNode) {
+    alloc_locals;
+    let (decoded_nodes_start_) = default_dict_new(0);
+    let decoded_nodes_start = cast(decoded_nodes_start_, DecodedNodesDictAccess*);
+    tempvar node_store = NodeStore(
+        new NodeStoreStruct(
+            node_store.value.dict_ptr_start,
+            node_store.value.dict_ptr,
+            DecodedNodes(new DecodedNodesStruct(decoded_nodes_start, decoded_nodes_start)),
+        ),
+    );
+
+    let first = node_store_get{node_store=node_store}(node_hash);
+    let second = node_store_get{node_store=node_store}(node_hash);
+
+    // The first lookup is a miss (read and write), the second one a hit (read only) returning the
+    // node decoded by the first one.
+    let decoded_nodes_end = node_store.value.decoded_nodes.value.dict_ptr;
+    assert decoded_nodes_end - decoded_nodes_start = 3 * DecodedNodesDictAccess.SIZE;
+    assert second.value = first.value;
+
+    // The cache starts empty: its first read must be a miss.
+    default_dict_finalize(
+        cast(decoded_nodes_start, DictAccess*), cast(decoded_nodes_end, DictAccess*), 0
+    );
+    return (first, second);
+}
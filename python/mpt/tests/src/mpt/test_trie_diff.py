@@ -311,6 +311,18 @@ class TestTrieDiff:
                 continue
             assert result == decode_node(small_store[key])
 
+    @pytest.mark.parametrize(
+        "data_path", [Path("test_data/22081873.json")], scope="session"
+    )
+    @given(data=st.data())
+    @pytest.mark.slow
+    def test_node_store_get_cached(self, cairo_run, node_store, data):
+        small_store = {k: v for k, v in list(node_store.items())[:6]}
+        key = data.draw(st.sampled_from(list(small_store.keys())))
+
+        first, second = cairo_run("test_node_store_get_cached", small_store, key)
+        assert first == second == decode_node(small_store[key])
+
     @given(address=..., account_before=..., account_after=...)
     def test__process_account_diff(
         self,